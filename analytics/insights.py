@@ -8,10 +8,30 @@ from pathlib import Path
 sys.path.append(str(Path(__file__).parent.parent))
 
 from config.database import get_db_connection, DatabaseManager
+from config.settings import CACHE_CONFIG, DB_CONFIG
 from database import queries
+import numpy as np
 import pandas as pd
+import psycopg2.errors
+from psycopg2.extras import execute_values
+import pyarrow as pa
+import pyarrow.csv as pacsv
+import hashlib
+import io
+import json
 import logging
-from typing import Dict, List, Tuple, Optional
+import pickle
+import threading
+import time
+from cachetools import TTLCache
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, NamedTuple, Tuple, Optional
+from urllib.parse import quote
+
+try:
+    import connectorx as cx
+except ImportError:
+    cx = None
 
 import warnings
 warnings.filterwarnings('ignore', message='pandas only supports SQLAlchemy')
@@ -19,17 +39,193 @@ warnings.filterwarnings('ignore', message='pandas only supports SQLAlchemy')
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+CACHE_DIR = Path(__file__).parent.parent / CACHE_CONFIG['dir']
+
+POSTGRES_URI = (
+    f"postgresql://{quote(DB_CONFIG['user'])}:{quote(DB_CONFIG['password'])}"
+    f"@{DB_CONFIG['host']}:{DB_CONFIG['port']}/{DB_CONFIG['database']}"
+)
+
+
+class MarketOverview(NamedTuple):
+    """Market overview sections as DataFrames, as the dashboard caches them"""
+    # Lives here rather than in the dashboard script: Streamlit redefines the
+    # script's classes on every run, which breaks pickling cached results
+    top_skills: pd.DataFrame
+    top_companies: pd.DataFrame
+    jobs_by_city: pd.DataFrame
+    experience: pd.DataFrame
+    totals: Dict[str, int]
+
+
 class JobMarketAnalytics:
     """Generate insights from job market data"""
     
+    # Query results shared by all instances, keyed by (query, params)
+    _query_cache = TTLCache(maxsize=CACHE_CONFIG['maxsize'], ttl=CACHE_CONFIG['ttl'])
+    _cache_lock = threading.Lock()
+    
+    # (backend_pid, statement_name) pairs already PREPAREd
+    _prepared_statements = set()
+    
+    # Time of the last invalidate_cache() call; older instance memos are stale
+    _invalidated_at = 0.0
+    
+    # Last get_data_version() result; a different one invalidates the cache
+    _data_version: Optional[str] = None
+    
+    # Seconds a per-instance get_jobs_by_city() result stays fresh
+    JOBS_BY_CITY_TTL = 60
+    
+    # Label columns that become categoricals once a result has at least this
+    # many rows and fewer distinct values than this fraction of them. Opt-in
+    # per column: names such as skill_1/skill_2 get concatenated by callers,
+    # which a Categorical doesn't support
+    CATEGORY_COLUMNS = ('city', 'state', 'skill_category', 'experience_level')
+    CATEGORY_MIN_ROWS = 100
+    CATEGORY_MAX_UNIQUE_RATIO = 0.5
+    
+    # Single-value counts (get_total_jobs, get_jobs_with_salary), keyed by SQL
+    COUNT_CACHE_TTL = 60
+    _count_cache = TTLCache(maxsize=32, ttl=COUNT_CACHE_TTL)
+    
+    # Skill lists longer than this are joined via a temp table instead of = ANY(array)
+    SKILL_FILTER_TABLE_THRESHOLD = 1000
+    
     def __init__(self):
         DatabaseManager.initialize_pool()
+        self._jobs_by_city_cache: Optional[Tuple[float, pd.DataFrame, pd.DataFrame]] = None
+    
+    # ==================== RESULT CACHE ====================
+    
+    @staticmethod
+    def _cache_key(query: str, params: tuple = None) -> str:
+        """Hash the whitespace-normalized SQL together with its parameters"""
+        normalized = ' '.join(query.split())
+        return hashlib.blake2b(normalized.encode() + repr(params).encode()).hexdigest()
+    
+    @classmethod
+    def invalidate_cache(cls):
+        """Drop all cached query results (call after new data is loaded)"""
+        with cls._cache_lock:
+            cls._query_cache.clear()
+            cls._count_cache.clear()
+            cls._invalidated_at = time.time()
+        
+        # Pickles are ours; Parquet files are the dashboard's on-disk tier
+        if CACHE_DIR.exists():
+            for pattern in ('*.pkl', '*.parquet'):
+                for cache_file in CACHE_DIR.glob(pattern):
+                    cache_file.unlink(missing_ok=True)
+        
+        logger.info("Analytics cache invalidated")
     
-    def __del__(self):
-        DatabaseManager.close_all_connections()
+    @staticmethod
+    def _load_disk_cache(key: str) -> Optional[Any]:
+        """Load a pickled result from disk if it is younger than the cache TTL"""
+        cache_file = CACHE_DIR / f"{key}.pkl"
+        try:
+            if time.time() - cache_file.stat().st_mtime > CACHE_CONFIG['ttl']:
+                return None
+            with open(cache_file, 'rb') as f:
+                return pickle.load(f)
+        except (OSError, pickle.PickleError, EOFError):
+            return None
+    
+    @staticmethod
+    def _store_disk_cache(key: str, value: Any):
+        """Pickle a result to disk, ignoring write failures"""
+        try:
+            CACHE_DIR.mkdir(exist_ok=True)
+            with open(CACHE_DIR / f"{key}.pkl", 'wb') as f:
+                pickle.dump(value, f)
+        except OSError as e:
+            logger.warning(f"Could not write analytics cache: {e}")
     
     def _execute_query(self, query: str, params: tuple = None) -> pd.DataFrame:
-        """Execute a query and return results as DataFrame"""
+        """
+        Execute a query and return results as DataFrame (cached with a TTL)
+        
+        Args:
+            query: SQL query with %s placeholders
+            params: Query parameters
+        """
+        return self._cached_frame(
+            self._cache_key(query, params),
+            lambda: self._categorize_strings(self._fetch_dataframe(query, params))
+        )
+    
+    def _execute_query_arrow(self, query: str, params: tuple = None) -> pa.Table:
+        """
+        Execute a query and return results as an Arrow table (cached with a TTL)
+        
+        For report code that serializes rows (to_pylist, JSON) and never needs
+        a pandas DataFrame; call _to_pandas() if one is needed after all.
+        """
+        return self._cached_result(
+            self._cache_key(query, (params, 'arrow')),
+            lambda: self._fetch_arrow(query, params)
+        )
+    
+    @staticmethod
+    def _to_pandas(table: pa.Table) -> pd.DataFrame:
+        """Convert an Arrow table to a DataFrame with Arrow-backed columns"""
+        return table.to_pandas(types_mapper=pd.ArrowDtype)
+    
+    @classmethod
+    def _categorize_strings(cls, df: pd.DataFrame) -> pd.DataFrame:
+        """Store repetitive label columns (CATEGORY_COLUMNS) as categoricals"""
+        if len(df) < cls.CATEGORY_MIN_ROWS:
+            return df
+        
+        for col in df.columns.intersection(cls.CATEGORY_COLUMNS):
+            if not pd.api.types.is_string_dtype(df[col].dtype):
+                continue
+            if df[col].nunique() / len(df) < cls.CATEGORY_MAX_UNIQUE_RATIO:
+                df[col] = df[col].astype('category')
+        
+        return df
+    
+    def _cached_result(self, key: str, fetch: Callable[[], Any]) -> Any:
+        """Return the cached result for key, calling fetch() on a miss"""
+        with self._cache_lock:
+            result = self._query_cache.get(key)
+        
+        if result is None:
+            result = fetch()
+            with self._cache_lock:
+                self._query_cache[key] = result
+        
+        return result
+    
+    def _cached_frame(self, key: str, fetch: Callable[[], pd.DataFrame]) -> pd.DataFrame:
+        """Return the cached DataFrame for key, calling fetch() on a miss"""
+        # Shallow copy so callers adding columns can't alter the cached frame
+        return self._cached_result(key, fetch).copy(deep=False)
+    
+    def _cached_count(self, query: str) -> int:
+        """Return the single integer produced by query, cached for COUNT_CACHE_TTL"""
+        with self._cache_lock:
+            value = self._count_cache.get(query)
+        if value is not None:
+            return value
+        
+        conn = None
+        try:
+            conn = get_db_connection()
+            with conn.cursor() as cursor:
+                cursor.execute(query)
+                value = cursor.fetchone()[0]
+        finally:
+            if conn:
+                DatabaseManager.return_connection(conn)
+        
+        with self._cache_lock:
+            self._count_cache[query] = value
+        return value
+    
+    def _fetch_dataframe(self, query: str, params: tuple = None) -> pd.DataFrame:
+        """Run a query against the database and return results as DataFrame"""
         conn = None
         try:
             conn = get_db_connection()
@@ -42,15 +238,134 @@ class JobMarketAnalytics:
             if conn:
                 DatabaseManager.return_connection(conn)
     
+    def _fetch_arrow(self, query: str, params: tuple = None) -> pa.Table:
+        """
+        Run a query via COPY ... TO STDOUT and parse the CSV with pyarrow
+        
+        Avoids building a Python tuple per row; columns are parsed straight
+        into Arrow buffers.
+        When connectorx is installed it fetches the result instead, decoding
+        Postgres' binary protocol in Rust.
+        """
+        conn = None
+        cursor = None
+        try:
+            conn = get_db_connection()
+            cursor = conn.cursor()
+            select_sql = cursor.mogrify(query, params).decode()
+            
+            if cx is not None:
+                return cx.read_sql(POSTGRES_URI, select_sql, return_type="arrow")
+            
+            buf = io.BytesIO()
+            cursor.copy_expert(
+                f"COPY ({select_sql}) TO STDOUT WITH (FORMAT CSV, HEADER)", buf
+            )
+            buf.seek(0)
+            
+            # Unquoted empty fields are NULLs in Postgres CSV output, quoted ones are ''
+            return pacsv.read_csv(
+                buf,
+                convert_options=pacsv.ConvertOptions(
+                    strings_can_be_null=True,
+                    quoted_strings_can_be_null=False
+                )
+            )
+        except Exception as e:
+            logger.error(f"Error executing query: {e}")
+            raise
+        finally:
+            if conn:
+                if cursor:
+                    cursor.close()
+                DatabaseManager.return_connection(conn)
+    
+    def _execute_prepared(self, name: str, statement: str, params: tuple) -> pd.DataFrame:
+        """
+        Execute a named prepared statement, preparing it on first use
+        
+        Prepared statements live per database session, so the statements
+        already prepared are tracked per backend process ID.
+        """
+        conn = None
+        try:
+            conn = get_db_connection()
+            session_key = (conn.get_backend_pid(), name)
+            execute_sql = f"EXECUTE {name}({', '.join(['%s'] * len(params))})"
+            
+            if session_key not in self._prepared_statements:
+                with conn.cursor() as cursor:
+                    cursor.execute(f"PREPARE {name} AS {statement}")
+                self._prepared_statements.add(session_key)
+            
+            try:
+                return pd.read_sql_query(execute_sql, conn, params=params)
+            except psycopg2.errors.InvalidSqlStatementName:
+                # Session was replaced behind a reused PID; prepare again
+                conn.rollback()
+                with conn.cursor() as cursor:
+                    cursor.execute(f"PREPARE {name} AS {statement}")
+                return pd.read_sql_query(execute_sql, conn, params=params)
+        except Exception as e:
+            logger.error(f"Error executing prepared statement {name}: {e}")
+            raise
+        finally:
+            if conn:
+                DatabaseManager.return_connection(conn)
+    
+    def _fetch_with_skill_filter(self, query: str, skill_keys: List[str], params: tuple) -> pd.DataFrame:
+        """
+        Run a query that joins against a temp table of skill names
+        
+        Args:
+            query: SQL reading the _skills_filter(skill_name) table
+            skill_keys: Lowercased skill names to load into the table
+            params: Parameters for query itself
+        """
+        conn = None
+        try:
+            conn = get_db_connection()
+            with conn.cursor() as cursor:
+                cursor.execute(
+                    "CREATE TEMP TABLE _skills_filter (skill_name TEXT PRIMARY KEY) ON COMMIT DROP"
+                )
+                execute_values(
+                    cursor,
+                    "INSERT INTO _skills_filter VALUES %s ON CONFLICT DO NOTHING",
+                    [(key,) for key in skill_keys]
+                )
+                cursor.execute("ANALYZE _skills_filter")
+                cursor.execute(query, params)
+                columns = [desc[0] for desc in cursor.description]
+                rows = cursor.fetchall()
+            conn.commit()
+            return pd.DataFrame(rows, columns=columns)
+        except Exception as e:
+            if conn:
+                conn.rollback()
+            logger.error(f"Error executing query: {e}")
+            raise
+        finally:
+            if conn:
+                DatabaseManager.return_connection(conn)
+    
     # ==================== SKILL ANALYTICS ====================
     
-    def get_top_skills(self, limit: int = 20) -> pd.DataFrame:
+    def get_top_skills(self, limit: int = 20, search: str = None) -> pd.DataFrame:
         """
         Get top in-demand skills overall
         
+        Args:
+            limit: Number of top skills to return
+            search: Only include skills whose name contains this text (case-insensitive)
+            
         Returns:
             DataFrame with columns: skill_name, skill_category, job_count, percentage
         """
+        if search:
+            logger.info(f"Fetching top {limit} skills matching '{search}'...")
+            return self._execute_query(queries.TOP_SKILLS_MATCHING, (f'%{search}%', limit))
+        
         logger.info(f"Fetching top {limit} skills...")
         df = self._execute_query(queries.TOP_SKILLS_OVERALL, (limit,))
         return df
@@ -70,6 +385,21 @@ class JobMarketAnalytics:
         df = self._execute_query(queries.TOP_SKILLS_BY_LOCATION, (city, limit))
         return df
     
+    def get_top_skills_for_cities(self, cities: List[str], limit: int = 20) -> pd.DataFrame:
+        """
+        Get top skills for several cities with a single query
+        
+        Args:
+            cities: City names
+            limit: Number of top skills to return per city
+            
+        Returns:
+            DataFrame with columns: city, skill_name, job_count
+            (ordered by city, then job_count descending)
+        """
+        logger.info(f"Fetching top {limit} skills for {len(cities)} cities...")
+        return self._execute_query(queries.TOP_SKILLS_BY_LOCATIONS, (list(cities), limit))
+    
     def get_top_skills_by_role(self, role_keyword: str, limit: int = 20) -> pd.DataFrame:
         """
         Get top skills for a specific job role
@@ -94,11 +424,13 @@ class JobMarketAnalytics:
             limit: Maximum number of pairs to return
             
         Returns:
-            DataFrame with columns: skill_1, skill_2, co_occurrence_count
+            DataFrame with columns: skill_1, skill_2, co_occurrence_count,
+            skill_pair ("skill_1 + skill_2" label)
         """
         logger.info(f"Analyzing skill co-occurrence (min count: {min_count})...")
-        df = self._execute_query(queries.SKILL_COOCCURRENCE, (min_count, limit))
-        return df
+        
+        # Pair counts are pre-aggregated in mv_skill_cooccurrence on ingest
+        return self._execute_query(queries.SKILL_COOCCURRENCE, (min_count, limit))
     
     def compare_skills_across_cities(self, skills: List[str], cities: List[str] = None) -> pd.DataFrame:
         """
@@ -114,29 +446,58 @@ class JobMarketAnalytics:
         logger.info(f"Comparing {len(skills)} skills across cities...")
         
         if cities is None:
-            cities = self.get_all_cities()['city'].tolist()
-        
-        comparison_data = []
+            cities = self.get_all_cities()
+
+        skill_keys = [skill.lower() for skill in skills]
+
+        # One grouped query for every (skill, city) pair instead of one per pair
+        if len(skill_keys) > self.SKILL_FILTER_TABLE_THRESHOLD:
+            df = self._cached_frame(
+                self._cache_key(queries.SKILL_DEMAND_BY_CITY_FILTER_TABLE, (skill_keys, list(cities))),
+                lambda: self._fetch_with_skill_filter(
+                    queries.SKILL_DEMAND_BY_CITY_FILTER_TABLE, skill_keys, (list(cities),)
+                )
+            )
+        else:
+            df = self._execute_query(queries.SKILL_DEMAND_BY_CITY, (skill_keys, list(cities)))
+
+        # Scatter the counts into a (skill x city) matrix via categorical codes
+        # instead of pivot/reindex/fillna over string labels
+        skill_index = pd.Index(skill_keys).unique()
+        city_index = pd.Index(cities).unique()
+        skill_codes = pd.Categorical(df['skill_name'], categories=skill_index).codes
+        city_codes = pd.Categorical(df['city'], categories=city_index).codes
+        found = (skill_codes >= 0) & (city_codes >= 0)
         
-        for skill in skills:
-            row_data = {'skill': skill}
-            for city in cities:
-                df = self._execute_query(queries.TOP_SKILLS_BY_LOCATION, (city, 1000))
-                count = df[df['skill_name'].str.lower() == skill.lower()]['job_count'].sum()
-                row_data[city] = count
-            comparison_data.append(row_data)
+        counts = np.zeros((len(skill_index), len(city_index)), dtype=np.int64)
+        np.add.at(
+            counts,
+            (skill_codes[found], city_codes[found]),
+            df['job_count'].to_numpy(dtype=np.int64)[found]
+        )
         
-        return pd.DataFrame(comparison_data)
+        counts = counts[np.ix_(skill_index.get_indexer(skill_keys), city_index.get_indexer(cities))]
+        comparison = pd.DataFrame(counts, columns=list(cities))
+        comparison.insert(0, 'skill', skills)
+        return comparison
     
     # ==================== COMPANY ANALYTICS ====================
     
-    def get_top_hiring_companies(self, limit: int = 20) -> pd.DataFrame:
+    def get_top_hiring_companies(self, limit: int = 20, search: str = None) -> pd.DataFrame:
         """
         Get companies with most job postings
         
+        Args:
+            limit: Number of companies to return
+            search: Only include companies whose name contains this text (case-insensitive)
+            
         Returns:
-            DataFrame with columns: company_name, industry, job_count, cities_hiring_in
+            DataFrame with columns: company_name, job_count, cities_hiring_in
         """
+        if search:
+            logger.info(f"Fetching top {limit} hiring companies matching '{search}'...")
+            return self._execute_query(queries.TOP_HIRING_COMPANIES_MATCHING, (f'%{search}%', limit))
+        
         logger.info(f"Fetching top {limit} hiring companies...")
         df = self._execute_query(queries.TOP_HIRING_COMPANIES, (limit,))
         return df
@@ -156,6 +517,21 @@ class JobMarketAnalytics:
         df = self._execute_query(queries.COMPANIES_BY_CITY, (city, limit))
         return df
     
+    def get_companies_for_cities(self, cities: List[str], limit: int = 20) -> pd.DataFrame:
+        """
+        Get top hiring companies for several cities with a single query
+        
+        Args:
+            cities: City names
+            limit: Number of companies to return per city
+            
+        Returns:
+            DataFrame with columns: city, company_name, job_count
+            (ordered by city, then job_count descending)
+        """
+        logger.info(f"Fetching top {limit} companies for {len(cities)} cities...")
+        return self._execute_query(queries.COMPANIES_BY_CITIES, (list(cities), limit))
+    
     # ==================== LOCATION ANALYTICS ====================
     
     def get_jobs_by_city(self) -> pd.DataFrame:
@@ -165,14 +541,40 @@ class JobMarketAnalytics:
         Returns:
             DataFrame with columns: city, state, job_count, company_count
         """
-        logger.info("Fetching job distribution by city...")
-        df = self._execute_query(queries.JOBS_BY_CITY)
-        return df
+        return self._jobs_by_city()[0].copy(deep=False)
+    
+    def _jobs_by_city(self) -> Tuple[pd.DataFrame, pd.DataFrame]:
+        """
+        Memoized job distribution by city
+        
+        Returns:
+            Tuple of (plain DataFrame, same data indexed by city)
+        """
+        cached = self._jobs_by_city_cache
+        now = time.time()
+        
+        if cached is None or now - cached[0] > self.JOBS_BY_CITY_TTL or cached[0] <= self._invalidated_at:
+            logger.info("Fetching job distribution by city...")
+            df = self._execute_query(queries.JOBS_BY_CITY)
+            cached = (now, df, df.set_index('city'))
+            self._jobs_by_city_cache = cached
+        
+        return cached[1], cached[2]
     
-    def get_all_cities(self) -> pd.DataFrame:
-        """Get list of all cities with jobs"""
-        df = self.get_jobs_by_city()
-        return df[df['job_count'] > 0]
+    def get_active_jobs_by_city(self) -> pd.DataFrame:
+        """
+        Get job distribution across named cities that have at least one job
+        
+        Returns:
+            DataFrame with columns: city, state, job_count, company_count
+        """
+        logger.info("Fetching job distribution by active city...")
+        return self._execute_query(queries.ACTIVE_JOBS_BY_CITY)
+    
+    def get_all_cities(self) -> pd.Index:
+        """Get names of all cities with jobs, alphabetically"""
+        df = self._execute_query(queries.CITIES_WITH_JOBS)
+        return pd.Index(df['city'].unique(), name='city')
     
     # ==================== EXPERIENCE ANALYTICS ====================
     
@@ -232,87 +634,47 @@ class JobMarketAnalytics:
     # ==================== FILTERED ANALYTICS ====================
 
     def get_jobs_with_salary(self) -> int:
-        """Get count of jobs that have salary information"""
-        conn = None
-        try:
-            conn = get_db_connection()
-            cursor = conn.cursor()
-            cursor.execute(
-                """
-                SELECT COUNT(*) 
-                FROM jobs 
-                WHERE salary_min IS NOT NULL 
-                  AND salary_max IS NOT NULL
-                  AND salary_min > 0
-                """
-            )
-            return cursor.fetchone()[0]
-        finally:
-            if conn:
-                cursor.close()
-                DatabaseManager.return_connection(conn)
+        """Get count of jobs that have salary information (cached for COUNT_CACHE_TTL seconds)"""
+        return self._cached_count(queries.JOBS_WITH_SALARY_COUNT)
+
+    def get_experience_by_all_cities(self) -> pd.DataFrame:
+        """
+        Get experience level distribution for every city in one query
+        
+        Returns:
+            DataFrame with columns: city, experience_level, job_count
+        """
+        return self._execute_query(queries.EXPERIENCE_BY_CITY)
+
+    def get_job_types_by_all_cities(self) -> pd.DataFrame:
+        """
+        Get job type distribution for every city in one query
+        
+        Returns:
+            DataFrame with columns: city, job_type, job_count
+        """
+        return self._execute_query(queries.JOB_TYPE_BY_CITY)
 
     def get_jobs_by_experience_and_city(self, city: str) -> pd.DataFrame:
         """Get experience level distribution for a specific city"""
-        query = """
-            SELECT 
-                j.experience_level,
-                COUNT(*) as job_count
-            FROM jobs j
-            JOIN locations l ON j.location_id = l.location_id
-            WHERE l.city = %s AND j.experience_level IS NOT NULL
-            GROUP BY j.experience_level
-            ORDER BY job_count DESC
-        """
-        return self._execute_query(query, (city,))
+        return self._city_slice(self.get_experience_by_all_cities(), city)
 
     def get_jobs_by_type_and_city(self, city: str) -> pd.DataFrame:
         """Get job type distribution for a specific city"""
-        query = """
-            SELECT 
-                j.job_type,
-                COUNT(*) as job_count
-            FROM jobs j
-            JOIN locations l ON j.location_id = l.location_id
-            WHERE l.city = %s AND j.job_type IS NOT NULL
-            GROUP BY j.job_type
-            ORDER BY job_count DESC
-        """
-        return self._execute_query(query, (city,))
+        return self._city_slice(self.get_job_types_by_all_cities(), city)
+
+    @staticmethod
+    def _city_slice(df: pd.DataFrame, city: str) -> pd.DataFrame:
+        """Rows of a per-city distribution for one city, without the city column"""
+        return df.loc[df['city'] == city].drop(columns='city').reset_index(drop=True)
 
     def get_top_skills_by_experience(self, experience_level: str, limit: int = 20) -> pd.DataFrame:
         """Get top skills for a specific experience level"""
-        query = """
-            SELECT 
-                s.skill_name,
-                s.skill_category,
-                COUNT(DISTINCT j.job_id) as job_count
-            FROM skills s
-            JOIN job_skills js ON s.skill_id = js.skill_id
-            JOIN jobs j ON js.job_id = j.job_id
-            WHERE j.experience_level = %s
-            GROUP BY s.skill_id, s.skill_name, s.skill_category
-            ORDER BY job_count DESC
-            LIMIT %s
-        """
-        return self._execute_query(query, (experience_level, limit))
+        return self._execute_query(queries.TOP_SKILLS_BY_EXPERIENCE, (experience_level, limit))
 
     def get_top_skills_by_job_type(self, job_type: str, limit: int = 20) -> pd.DataFrame:
         """Get top skills for a specific job type"""
-        query = """
-            SELECT 
-                s.skill_name,
-                s.skill_category,
-                COUNT(DISTINCT j.job_id) as job_count
-            FROM skills s
-            JOIN job_skills js ON s.skill_id = js.skill_id
-            JOIN jobs j ON js.job_id = j.job_id
-            WHERE j.job_type = %s
-            GROUP BY s.skill_id, s.skill_name, s.skill_category
-            ORDER BY job_count DESC
-            LIMIT %s
-        """
-        return self._execute_query(query, (job_type, limit))
+        return self._execute_query(queries.TOP_SKILLS_BY_JOB_TYPE, (job_type, limit))
 
     def get_companies_hiring_for_experience(self, experience_level: str, limit: int = 20) -> pd.DataFrame:
         """Get top companies hiring for a specific experience level"""
@@ -345,46 +707,42 @@ class JobMarketAnalytics:
             skill_name: Filter by skill (optional)
             limit: Maximum results
         """
-        query = """
-            SELECT DISTINCT
-                j.job_id,
-                j.job_title,
-                c.company_name,
-                l.city,
-                j.experience_level,
-                j.job_type,
-                j.job_url,
-                j.posted_date
-            FROM jobs j
-            LEFT JOIN companies c ON j.company_id = c.company_id
-            LEFT JOIN locations l ON j.location_id = l.location_id
-            LEFT JOIN job_skills js ON j.job_id = js.job_id
-            LEFT JOIN skills s ON js.skill_id = s.skill_id
-            WHERE 1=1
-        """
+        filters = {
+            'city': city,
+            'experience_level': experience_level,
+            'job_type': job_type,
+            'skill_name': skill_name
+        }
         
+        # One prepared statement per combination of active filters
+        mask = 0
         params = []
+        for bit, (name, _) in enumerate(queries.SEARCH_FILTER_CLAUSES):
+            if filters[name]:
+                mask |= 1 << bit
+                params.append(filters[name])
+        params.append(limit)
         
-        if city:
-            query += " AND l.city = %s"
-            params.append(city)
-        
-        if experience_level:
-            query += " AND j.experience_level = %s"
-            params.append(experience_level)
-        
-        if job_type:
-            query += " AND j.job_type = %s"
-            params.append(job_type)
+        statement_name = f"search_{mask:04b}"
+        params = tuple(params)
         
-        if skill_name:
-            query += " AND LOWER(s.skill_name) = LOWER(%s)"
-            params.append(skill_name)
+        return self._cached_frame(
+            self._cache_key(statement_name, params),
+            lambda: self._execute_prepared(statement_name, self._search_statement(mask), params)
+        )
+    
+    @staticmethod
+    def _search_statement(mask: int) -> str:
+        """Build the search SQL for a filter bitmask using $n placeholders"""
+        query = queries.SEARCH_JOBS_BY_FILTERS
+        position = 0
         
-        query += " ORDER BY j.created_at DESC LIMIT %s"
-        params.append(limit)
+        for bit, (_, clause) in enumerate(queries.SEARCH_FILTER_CLAUSES):
+            if mask & (1 << bit):
+                position += 1
+                query += " AND " + clause.format(position)
         
-        return self._execute_query(query, tuple(params))
+        return query + f" ORDER BY j.created_at DESC LIMIT ${position + 1}"
         
     # ==================== PORTAL ANALYTICS ====================
     
@@ -399,40 +757,74 @@ class JobMarketAnalytics:
         df = self._execute_query(queries.JOBS_BY_PORTAL)
         return df
     
-    def get_total_jobs(self) -> int:
-        """Get total number of jobs in database"""
+    def get_total_jobs(self, exact: bool = True) -> int:
+        """
+        Get total number of jobs in database (cached for COUNT_CACHE_TTL seconds)
+        
+        Args:
+            exact: Run COUNT(*); pass False to read the planner's row estimate,
+                which lags behind loads until the table is next analyzed
+        """
+        if not exact:
+            estimate = self._cached_count(queries.JOBS_ESTIMATED_COUNT)
+            # Never-analyzed tables report -1 (PostgreSQL 14+) or 0 (older versions)
+            if estimate > 0:
+                return estimate
+        return self._cached_count("SELECT COUNT(*) FROM jobs")
+
+    def get_job_counts(self) -> Dict[str, int]:
+        """
+        Get all summary counts in a single query
+
+        Returns:
+            Dictionary with keys: total_jobs, total_companies, total_skills,
+            total_cities, jobs_with_salary
+        """
         conn = None
         try:
             conn = get_db_connection()
             cursor = conn.cursor()
-            cursor.execute("SELECT COUNT(*) FROM jobs")
-            return cursor.fetchone()[0]
+            cursor.execute(queries.MARKET_TOTALS)
+            row = cursor.fetchone()
+            columns = [desc[0] for desc in cursor.description]
+            return dict(zip(columns, row))
         finally:
             if conn:
                 cursor.close()
                 DatabaseManager.return_connection(conn)
 
-    def get_jobs_with_salary(self) -> int:
-        """Get count of jobs that have salary information"""
+    def get_data_version(self) -> str:
+        """
+        Get a token identifying the data currently loaded (never cached)
+        
+        The stamp is bumped in the same transaction as the materialized view
+        refresh that ends every load or cleanup. When it differs from the
+        version this process saw last, the query cache is invalidated so
+        results rebuilt for the new version don't come from older data.
+        
+        Returns:
+            The stamp as a string ("0" before the first refresh creates it)
+        """
         conn = None
         try:
             conn = get_db_connection()
-            cursor = conn.cursor()
-            cursor.execute(
-                """
-                SELECT COUNT(*) 
-                FROM jobs 
-                WHERE salary_min IS NOT NULL 
-                  AND salary_max IS NOT NULL
-                  AND salary_min > 0
-                """
-            )
-            return cursor.fetchone()[0]
+            with conn.cursor() as cursor:
+                cursor.execute(queries.DATA_VERSION)
+                version = str(cursor.fetchone()[0])
+        except psycopg2.errors.UndefinedTable:
+            # Databases from an older schema get the stamp on their next refresh
+            version = '0'
         finally:
             if conn:
-                cursor.close()
                 DatabaseManager.return_connection(conn)
-    
+        
+        with self._cache_lock:
+            changed = self._data_version is not None and version != self._data_version
+            JobMarketAnalytics._data_version = version
+        if changed:
+            self.invalidate_cache()
+        return version
+
     # ==================== COMPREHENSIVE REPORTS ====================
     
     def generate_market_overview(self) -> Dict:
@@ -442,50 +834,86 @@ class JobMarketAnalytics:
         Returns:
             Dictionary with various market statistics
         """
+        cache_key = self._cache_key('generate_market_overview')
+        overview = self._load_disk_cache(cache_key)
+        if overview is not None:
+            logger.info("Market overview loaded from cache")
+            return overview
+        
         logger.info("Generating market overview report...")
         
-        overview = {}
+        counts, tables = self._market_overview_parts()
         
-        # Basic stats
-        conn = None
-        try:
-            conn = get_db_connection()
-            cursor = conn.cursor()
-            
-            cursor.execute("SELECT COUNT(*) FROM jobs")
-            overview['total_jobs'] = cursor.fetchone()[0]
-            
-            cursor.execute("SELECT COUNT(*) FROM companies")
-            overview['total_companies'] = cursor.fetchone()[0]
-            
-            cursor.execute("SELECT COUNT(*) FROM skills")
-            overview['total_skills'] = cursor.fetchone()[0]
-            
-            cursor.execute("SELECT COUNT(DISTINCT location_id) FROM jobs")
-            overview['total_cities'] = cursor.fetchone()[0]
-            
-        finally:
-            if conn:
-                cursor.close()
-                DatabaseManager.return_connection(conn)
+        overview = dict(counts)
+        for section, table in tables.items():
+            overview[section] = table.to_pylist()
         
-        # Top skills
-        overview['top_10_skills'] = self.get_top_skills(10).to_dict('records')
+        self._store_disk_cache(cache_key, overview)
         
-        # Top companies
-        overview['top_10_companies'] = self.get_top_hiring_companies(10).to_dict('records')
+        logger.info("✓ Market overview generated")
+        return overview
+    
+    def generate_market_overview_json(self) -> str:
+        """
+        Generate the market overview report as a JSON document
         
-        # Job distribution by city
-        overview['jobs_by_city'] = self.get_jobs_by_city().to_dict('records')
+        Serializes each section's rows straight to JSON, for consumers that
+        only need JSON.
         
-        # Experience distribution
-        overview['experience_distribution'] = self.get_experience_distribution().to_dict('records')
+        Returns:
+            JSON string with the same keys as generate_market_overview()
+        """
+        logger.info("Generating market overview JSON...")
         
-        # Portal distribution
-        overview['jobs_by_portal'] = self.get_jobs_by_portal().to_dict('records')
+        counts, tables = self._market_overview_parts()
+        sections = [f'{json.dumps(key)}: {int(value)}' for key, value in counts.items()]
         
-        logger.info("✓ Market overview generated")
-        return overview
+        for section, table in tables.items():
+            sections.append(f'{json.dumps(section)}: {json.dumps(table.to_pylist(), default=str)}')
+        
+        return '{' + ', '.join(sections) + '}'
+    
+    def get_market_overview_frames(self) -> Tuple[Dict[str, int], Dict[str, pd.DataFrame]]:
+        """
+        Get the market overview sections as DataFrames (for dashboards)
+        
+        The frames use plain NumPy-backed dtypes rather than _to_pandas()'s
+        Arrow extension types: they go straight into Plotly, which doesn't
+        reliably serialize Arrow arrays (or pd.NA) at the pinned version.
+        
+        Returns:
+            Tuple of (summary counts, DataFrames keyed by the same section
+            names as generate_market_overview())
+        """
+        counts, tables = self._market_overview_parts()
+        return counts, {section: table.to_pandas() for section, table in tables.items()}
+    
+    def _market_overview_parts(self) -> Tuple[Dict[str, int], Dict[str, pa.Table]]:
+        """
+        Run the market overview queries concurrently on pooled connections
+        
+        Sections are fetched as Arrow tables since they are only serialized,
+        never analyzed with pandas.
+        
+        Returns:
+            Tuple of (summary counts, Arrow tables keyed by report section)
+        """
+        sections = {
+            'top_10_skills': (queries.TOP_SKILLS_OVERALL, (10,)),
+            'top_10_companies': (queries.TOP_HIRING_COMPANIES, (10,)),
+            'jobs_by_city': (queries.JOBS_BY_CITY, None),
+            'experience_distribution': (queries.EXPERIENCE_DISTRIBUTION, None),
+            'jobs_by_portal': (queries.JOBS_BY_PORTAL, None)
+        }
+        
+        with ThreadPoolExecutor(max_workers=len(sections) + 1) as executor:
+            counts = executor.submit(self.get_job_counts)
+            futures = {
+                section: executor.submit(self._execute_query_arrow, query, params)
+                for section, (query, params) in sections.items()
+            }
+            
+            return counts.result(), {section: future.result() for section, future in futures.items()}
     
     def generate_city_report(self, city: str) -> Dict:
         """
@@ -501,16 +929,16 @@ class JobMarketAnalytics:
         
         report = {
             'city': city,
-            'top_skills': self.get_top_skills_by_city(city, 15).to_dict('records'),
-            'top_companies': self.get_companies_by_city(city, 15).to_dict('records')
+            'top_skills': self._execute_query_arrow(queries.TOP_SKILLS_BY_LOCATION, (city, 15)).to_pylist(),
+            'top_companies': self._execute_query_arrow(queries.COMPANIES_BY_CITY, (city, 15)).to_pylist()
         }
         
         # Get total jobs in city
-        jobs_df = self.get_jobs_by_city()
-        city_data = jobs_df[jobs_df['city'] == city]
-        if not city_data.empty:
-            report['total_jobs'] = int(city_data.iloc[0]['job_count'])
-            report['total_companies'] = int(city_data.iloc[0]['company_count'])
+        jobs_by_city = self._jobs_by_city()[1]
+        if city in jobs_by_city.index:
+            city_data = jobs_by_city.loc[[city]].iloc[0]
+            report['total_jobs'] = int(city_data['job_count'])
+            report['total_companies'] = int(city_data['company_count'])
         
         logger.info(f"✓ Report generated for {city}")
         return report
@@ -529,7 +957,9 @@ class JobMarketAnalytics:
         
         report = {
             'skill': skill_name,
-            'experience_demand': self.get_experience_demand_by_skill(skill_name).to_dict('records')
+            'experience_demand': self._execute_query_arrow(
+                queries.EXPERIENCE_DEMAND_BY_SKILL, (skill_name,)
+            ).to_pylist()
         }
         
         # Get total jobs with this skill
@@ -576,6 +1006,18 @@ class JobMarketAnalytics:
     
     # ==================== EXPORT FUNCTIONS ====================
     
+    @staticmethod
+    def _write_csv(df: pd.DataFrame, filename: str):
+        """Write a DataFrame to CSV with Arrow's C++ writer, falling back to pandas"""
+        try:
+            table = pa.Table.from_pandas(df, preserve_index=False)
+        except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+            # Mixed-type object columns Arrow can't infer a type for
+            df.to_csv(filename, index=False)
+            return
+        
+        pacsv.write_csv(table, filename, write_options=pacsv.WriteOptions(include_header=True))
+    
     def export_report_to_csv(self, report_type: str, filename: str = None, **kwargs):
         """
         Export a report to CSV
@@ -612,13 +1054,20 @@ class JobMarketAnalytics:
         
         try:
             df = report_functions[report_type]()
-            df.to_csv(filename, index=False)
+            self._write_csv(df, filename)
             logger.info(f"✓ Report exported to {filename}")
         except Exception as e:
             logger.error(f"Error exporting report: {e}")
             raise
 
 
+def _print_lines(lines):
+    """Print report lines with a single write"""
+    text = "\n".join(lines)
+    if text:
+        print(text)
+
+
 def main():
     """Generate sample reports"""
     analytics = JobMarketAnalytics()
@@ -640,37 +1089,46 @@ def main():
     print("\n🔧 TOP 10 SKILLS")
     print("-"*60)
     top_skills_df = analytics.get_top_skills(10)
-    for idx, row in top_skills_df.iterrows():
-        print(f"{idx+1}. {row['skill_name']} ({row['skill_category']}) - {row['job_count']} jobs ({row['percentage']}%)")
+    _print_lines(
+        f"{i}. {row.skill_name} ({row.skill_category}) - {row.job_count} jobs ({row.percentage}%)"
+        for i, row in enumerate(top_skills_df.itertuples(index=False), 1)
+    )
     
     # Top Companies
     print("\n🏢 TOP 10 HIRING COMPANIES")
     print("-"*60)
     top_companies_df = analytics.get_top_hiring_companies(10)
-    for idx, row in top_companies_df.iterrows():
-        print(f"{idx+1}. {row['company_name']} - {row['job_count']} jobs")
+    _print_lines(
+        f"{i}. {row.company_name} - {row.job_count} jobs"
+        for i, row in enumerate(top_companies_df.itertuples(index=False), 1)
+    )
     
     # Jobs by City
     print("\n📍 JOBS BY CITY")
     print("-"*60)
     jobs_by_city_df = analytics.get_jobs_by_city()
-    for idx, row in jobs_by_city_df.iterrows():
-        if row['job_count'] > 0:
-            print(f"{row['city']}: {row['job_count']} jobs, {row['company_count']} companies")
+    _print_lines(
+        f"{row.city}: {row.job_count} jobs, {row.company_count} companies"
+        for row in jobs_by_city_df[jobs_by_city_df['job_count'] > 0].itertuples(index=False)
+    )
     
     # Skill Co-occurrence
     print("\n🔗 TOP SKILL COMBINATIONS")
     print("-"*60)
     cooccurrence_df = analytics.get_skill_cooccurrence(min_count=5, limit=10)
-    for idx, row in cooccurrence_df.iterrows():
-        print(f"{row['skill_1']} + {row['skill_2']}: {row['co_occurrence_count']} times")
+    _print_lines(
+        f"{row.skill_1} + {row.skill_2}: {row.co_occurrence_count} times"
+        for row in cooccurrence_df.itertuples(index=False)
+    )
     
     # Experience Distribution
     print("\n📈 EXPERIENCE LEVEL DISTRIBUTION")
     print("-"*60)
     exp_dist_df = analytics.get_experience_distribution()
-    for idx, row in exp_dist_df.iterrows():
-        print(f"{row['experience_level']}: {row['job_count']} jobs ({row['percentage']}%)")
+    _print_lines(
+        f"{row.experience_level}: {row.job_count} jobs ({row.percentage}%)"
+        for row in exp_dist_df.itertuples(index=False)
+    )
     
     print("\n" + "="*60)
     print("✓ Analytics complete!")
@@ -1,10 +1,12 @@
-from .settings import DB_CONFIG, SCRAPING_CONFIG, SKILL_EXTRACTION_CONFIG
+from .settings import DB_CONFIG, DB_POOL_CONFIG, SCRAPING_CONFIG, SKILL_EXTRACTION_CONFIG, CACHE_CONFIG
 from .database import DatabaseManager, get_db_connection, execute_query
 
 __all__ = [
     'DB_CONFIG',
+    'DB_POOL_CONFIG',
     'SCRAPING_CONFIG',
     'SKILL_EXTRACTION_CONFIG',
+    'CACHE_CONFIG',
     'DatabaseManager',
     'get_db_connection',
     'execute_query'
@@ -1,45 +1,107 @@
 import psycopg2
 from psycopg2 import pool
-from config.settings import DB_CONFIG
+from config.settings import DB_CONFIG, DB_POOL_CONFIG
+import atexit
 import logging
+import threading
+import time
+import weakref
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 class DatabaseManager:
     _connection_pool = None
+    _pool_lock = threading.Lock()
+    # conn -> (opened_at, returned_at) for recycle and pre-ping checks; weak, so
+    # connections the pool closes on putconn (above minconn) drop out once freed
+    _conn_times = weakref.WeakKeyDictionary()
     
     @classmethod
-    def initialize_pool(cls, minconn=1, maxconn=10):
-        """Initialize the connection pool"""
-        try:
-            cls._connection_pool = psycopg2.pool.SimpleConnectionPool(
-                minconn, maxconn, **DB_CONFIG
-            )
-            logger.info("Database connection pool initialized")
-        except Exception as e:
-            logger.error(f"Error initializing connection pool: {e}")
-            raise
+    def initialize_pool(cls, minconn=None, maxconn=None):
+        """Initialize the (thread-safe) connection pool once per process"""
+        with cls._pool_lock:
+            if cls._connection_pool is not None:
+                return
+            
+            try:
+                cls._connection_pool = psycopg2.pool.ThreadedConnectionPool(
+                    minconn or DB_POOL_CONFIG['minconn'],
+                    maxconn or DB_POOL_CONFIG['maxconn'],
+                    keepalives=1,
+                    keepalives_idle=DB_POOL_CONFIG['keepalives_idle'],
+                    **DB_CONFIG
+                )
+                logger.info("Database connection pool initialized")
+            except Exception as e:
+                logger.error(f"Error initializing connection pool: {e}")
+                raise
     
     @classmethod
     def get_connection(cls):
-        """Get a connection from the pool"""
+        """Get a live connection from the pool, replacing stale or dead ones"""
         if cls._connection_pool is None:
             cls.initialize_pool()
+        
+        # Every idle connection may be stale; past that the pool opens a new one
+        for _ in range(cls._connection_pool.maxconn):
+            conn = cls._connection_pool.getconn()
+            if cls._is_usable(conn):
+                return conn
+            cls._discard(conn)
         return cls._connection_pool.getconn()
     
+    @classmethod
+    def _is_usable(cls, conn):
+        """False if conn is closed, past its recycle age, or fails a ping after idling"""
+        if conn.closed:
+            return False
+        
+        now = time.monotonic()
+        opened_at, returned_at = cls._conn_times.setdefault(conn, (now, now))
+        if now - opened_at > DB_POOL_CONFIG['recycle']:
+            return False
+        if now - returned_at <= DB_POOL_CONFIG['ping_after']:
+            return True
+        
+        try:
+            with conn.cursor() as cursor:
+                cursor.execute('SELECT 1')
+            conn.rollback()
+            return True
+        except psycopg2.Error:
+            return False
+    
+    @classmethod
+    def _discard(cls, conn):
+        """Close conn and drop it from the pool"""
+        cls._conn_times.pop(conn, None)
+        cls._connection_pool.putconn(conn, close=True)
+    
     @classmethod
     def return_connection(cls, conn):
         """Return a connection to the pool"""
         if cls._connection_pool:
+            times = cls._conn_times.pop(conn, None)
+            if times and not conn.closed:
+                cls._conn_times[conn] = (times[0], time.monotonic())
             cls._connection_pool.putconn(conn)
     
     @classmethod
     def close_all_connections(cls):
         """Close all connections in the pool"""
-        if cls._connection_pool:
-            cls._connection_pool.closeall()
-            logger.info("All database connections closed")
+        with cls._pool_lock:
+            if cls._connection_pool:
+                cls._connection_pool.closeall()
+                cls._connection_pool = None
+                cls._conn_times.clear()
+                logger.info("All database connections closed")
+
+# The pool lives for the whole process and is torn down once at exit
+atexit.register(DatabaseManager.close_all_connections)
+
+if DB_POOL_CONFIG['eager_init']:
+    DatabaseManager.initialize_pool()
 
 def get_db_connection():
     """Helper function to get a database connection"""
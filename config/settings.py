@@ -12,6 +12,18 @@ DB_CONFIG = {
     'password': os.getenv('DB_PASSWORD', '')
 }
 
+# Connection Pool Configuration
+DB_POOL_CONFIG = {
+    'minconn': int(os.getenv('DB_POOL_MIN', 4)),
+    'maxconn': int(os.getenv('DB_POOL_MAX', 32)),
+    'keepalives_idle': int(os.getenv('DB_KEEPALIVES_IDLE', 30)),
+    # Reopen connections older than this many seconds
+    'recycle': int(os.getenv('DB_POOL_RECYCLE', 3600)),
+    # Check with SELECT 1 that a connection idle this many seconds is still alive
+    'ping_after': int(os.getenv('DB_POOL_PING_AFTER', 30)),
+    'eager_init': os.getenv('DB_EAGER_INIT', 'false').lower() in ('1', 'true', 'yes'),
+}
+
 # Scraping Configuration
 SCRAPING_CONFIG = {
     'delay': int(os.getenv('SCRAPING_DELAY', 3)),
@@ -21,6 +33,13 @@ SCRAPING_CONFIG = {
     'portals': ['indeed', 'linkedin'], 
 }
 
+# Analytics Cache Configuration
+CACHE_CONFIG = {
+    'maxsize': int(os.getenv('ANALYTICS_CACHE_SIZE', 256)),
+    'ttl': int(os.getenv('ANALYTICS_CACHE_TTL', 300)),
+    'dir': os.getenv('ANALYTICS_CACHE_DIR', '.cache'),
+}
+
 # Skill Extraction Configuration
 SKILL_EXTRACTION_CONFIG = {
     'min_skill_length': 2,
@@ -5,11 +5,16 @@ sys.path.append(str(Path(__file__).parent.parent))
 
 import streamlit as st
 import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
-from analytics.insights import JobMarketAnalytics
-from database.db_operations import JobDatabase
+import numpy as np
+import pyarrow as pa
+import functools
+import zlib
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from typing import TYPE_CHECKING, Dict, List, Tuple
+
+if TYPE_CHECKING:
+    from analytics.insights import MarketOverview
 
 import warnings
 
@@ -25,167 +30,672 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# Import modern theme system
-try:
-    from theme import create_design_tokens
-    from pathlib import Path
+# Basic styles, used when the modern theme or stylesheet is unavailable
+_FALLBACK_CSS = """
+    .main-header {
+        font-size: 2.2rem;
+        font-weight: 600;
+        color: #1f2937;
+        margin-bottom: 1rem;
+    }
+    .sub-header {
+        font-size: 1.1rem;
+        color: #6b7280;
+        margin-bottom: 2rem;
+    }
+    .metric-container {
+        background-color: #f9fafb;
+        padding: 1.5rem;
+        border-radius: 0.5rem;
+        border-left: 4px solid #3b82f6;
+    }
+    .stTabs [data-baseweb="tab-list"] {
+        gap: 1rem;
+    }
+    .stTabs [data-baseweb="tab"] {
+        padding: 0.5rem 1.5rem;
+    }
+"""
+
+@st.cache_resource
+def _compiled_css() -> str:
+    """Build the page CSS (theme variables + styles_v2.css) once per process"""
+    try:
+        from theme import create_design_tokens
+    except ImportError:
+        return _FALLBACK_CSS
     
-    # Load modern CSS
     css_path = Path(__file__).parent / "styles_v2.css"
-    if css_path.exists():
-        with open(css_path) as f:
-            modern_css = f.read()
-        
-        # Create CSS variables for light theme
-        tokens = create_design_tokens('light')
-        css_vars = ":root {\n"
-        for key, value in tokens.items():
-            css_vars += f"    {key}: {value};\n"
-        css_vars += "}\n\n"
-        
-        # Apply modern styles
-        st.markdown(f"<style>{css_vars}{modern_css}</style>", unsafe_allow_html=True)
-    else:
-        # Fallback to original styles if modern CSS not found
-        st.markdown("""
-        <style>
-            .main-header {
-                font-size: 2.2rem;
-                font-weight: 600;
-                color: #1f2937;
-                margin-bottom: 1rem;
-            }
-            .sub-header {
-                font-size: 1.1rem;
-                color: #6b7280;
-                margin-bottom: 2rem;
-            }
-            .metric-container {
-                background-color: #f9fafb;
-                padding: 1.5rem;
-                border-radius: 0.5rem;
-                border-left: 4px solid #3b82f6;
-            }
-            .stTabs [data-baseweb="tab-list"] {
-                gap: 1rem;
-            }
-            .stTabs [data-baseweb="tab"] {
-                padding: 0.5rem 1.5rem;
-            }
-        </style>
-        """, unsafe_allow_html=True)
-except ImportError:
-    # Fallback to basic styles if modern theme module is not available
-    st.markdown("""
-    <style>
-        .main-header {
-            font-size: 2.2rem;
-            font-weight: 600;
-            color: #1f2937;
-            margin-bottom: 1rem;
-        }
-        .sub-header {
-            font-size: 1.1rem;
-            color: #6b7280;
-            margin-bottom: 2rem;
-        }
-        .metric-container {
-            background-color: #f9fafb;
-            padding: 1.5rem;
-            border-radius: 0.5rem;
-            border-left: 4px solid #3b82f6;
-        }
-        .stTabs [data-baseweb="tab-list"] {
-            gap: 1rem;
-        }
-        .stTabs [data-baseweb="tab"] {
-            padding: 0.5rem 1.5rem;
-        }
-    </style>
-    """, unsafe_allow_html=True)
+    if not css_path.exists():
+        return _FALLBACK_CSS
+    
+    # CSS variables for light theme
+    tokens = create_design_tokens('light')
+    css_vars = ":root {\n" + "".join(f"    {key}: {value};\n" for key, value in tokens.items()) + "}\n\n"
+    
+    return css_vars + css_path.read_text()
+
+st.markdown(f"<style>{_compiled_css()}</style>", unsafe_allow_html=True)
 
 # Plotly configuration
 PLOTLY_CONFIG = {'displayModeBar': False}
 
 # Helper functions
+def _as_float_array(values) -> np.ndarray:
+    """Scalar or Series of amounts as a float array, with NaN for missing values"""
+    return pd.to_numeric(pd.Series(np.atleast_1d(values)), errors='coerce').to_numpy(dtype=float)
+
+def format_lakhs(values) -> np.ndarray:
+    """Format amounts as '₹X.YL' strings ('N/A' when missing) without a per-row loop"""
+    amounts = _as_float_array(values)
+    return np.where(np.isnan(amounts), "N/A", np.char.mod("₹%.1fL", amounts / 100000)).astype(object)
+
 def format_salary(min_sal, max_sal, currency='INR'):
-    """Format salary for display"""
-    if pd.isna(min_sal) and pd.isna(max_sal):
-        return "Not Specified"
+    """Format salary for display (scalars, or Series formatted element-wise)"""
+    mins = _as_float_array(min_sal)
+    maxs = _as_float_array(max_sal)
     
-    def format_amount(amount):
-        if amount >= 100000:
-            return f"₹{amount/100000:.1f}L"
-        else:
-            return f"₹{amount/1000:.0f}K"
+    def format_amount(amounts):
+        return np.where(
+            amounts >= 100000,
+            np.char.mod("₹%.1fL", amounts / 100000),
+            np.char.mod("₹%.0fK", amounts / 1000)
+        )
+    
+    has_min = ~np.isnan(mins)
+    has_max = ~np.isnan(maxs)
+    min_text = format_amount(mins)
+    max_text = format_amount(maxs)
     
-    if pd.notna(min_sal) and pd.notna(max_sal):
-        return f"{format_amount(min_sal)} - {format_amount(max_sal)}"
-    elif pd.notna(min_sal):
-        return f"{format_amount(min_sal)}+"
-    elif pd.notna(max_sal):
-        return f"Up to {format_amount(max_sal)}"
+    formatted = np.select(
+        [has_min & has_max, has_min, has_max],
+        [
+            np.char.add(np.char.add(min_text, " - "), max_text),
+            np.char.add(min_text, "+"),
+            np.char.add("Up to ", max_text)
+        ],
+        default="Not Specified"
+    ).astype(object)
     
-    return "Not Specified"
+    if isinstance(min_sal, pd.Series):
+        return pd.Series(formatted, index=min_sal.index)
+    return formatted[0] if np.ndim(min_sal) == 0 else formatted
+
+def _arrow_strings(df: pd.DataFrame, *columns: str) -> pd.DataFrame:
+    """Store text columns as pyarrow-backed strings so filters run as Arrow kernels"""
+    for column in columns:
+        # Low-cardinality columns already arrive as categoricals; leave those be
+        if column in df and not isinstance(df[column].dtype, pd.CategoricalDtype):
+            df[column] = df[column].astype('string[pyarrow]')
+    return df
+
+def _valid_city_rows(df: pd.DataFrame) -> pd.DataFrame:
+    """Rows with a non-empty city name and at least one job"""
+    cities = df['city']
+    # ne() yields NA for missing names on Arrow strings; those rows are dropped too
+    has_city = cities.notna().to_numpy() & cities.ne('').fillna(False).to_numpy(dtype=bool)
+    mask = has_city & (df['job_count'].to_numpy() > 0)
+    return df[mask].reset_index(drop=True)
 
 # Initialize analytics
 @st.cache_resource
 def get_analytics():
     """Initialize analytics instance"""
+    from analytics.insights import JobMarketAnalytics
     return JobMarketAnalytics()
 
 @st.cache_resource
 def get_database():
     """Initialize database instance"""
+    from database.db_operations import JobDatabase
     return JobDatabase()
 
+# Seconds between checks of the database for newly loaded data
+DATA_VERSION_TTL = 60
+
+@st.cache_resource(ttl=DATA_VERSION_TTL, show_spinner=False)
+def data_version() -> str:
+    """Token for the jobs currently in the database, re-read at most once a minute"""
+    return get_analytics().get_data_version()
+
+def keyed_on_data_version(loader):
+    """
+    Call a cached loader with data_version() as its first argument
+    
+    The version is part of the cache key, so once a scraper load or cleanup
+    changes it every cached result misses. Reading a new version also drops
+    the analytics query cache, so the misses are rebuilt from the new data.
+    """
+    @functools.wraps(loader)
+    def wrapper(*args):
+        return loader(data_version(), *args)
+    return wrapper
+
 # Cache data loading
-@st.cache_data(ttl=3600)
-def load_market_overview():
-    analytics = get_analytics()
-    return analytics.generate_market_overview()
+# Results are persisted to disk so they survive app restarts. Persisted caches
+# don't support a TTL; keying them on data_version() retires them after new
+# data is loaded, and the sidebar's Refresh Data button clears them.
+# Every cached function takes positional-only arguments, so each cache key
+# is built from one fixed argument layout.
+def _build_market_overview(analytics) -> 'MarketOverview':
+    from analytics.insights import MarketOverview
+    
+    totals, frames = analytics.get_market_overview_frames()
+    return MarketOverview(
+        top_skills=frames['top_10_skills'],
+        top_companies=frames['top_10_companies'],
+        jobs_by_city=frames['jobs_by_city'],
+        experience=frames['experience_distribution'],
+        totals=totals
+    )
 
-@st.cache_data(ttl=3600)
-def load_data_quality():
-    """Load data quality statistics"""
+@keyed_on_data_version
+@st.cache_data(persist="disk", show_spinner=False, max_entries=64)
+def load_overview_bundle(version: str, /) -> Tuple['MarketOverview', Dict]:
+    """Load the market overview and data quality statistics concurrently"""
+    # Resolve the cached resources here; the worker threads have no script context
+    analytics = get_analytics()
     db = get_database()
-    return db.get_data_quality_stats()
+    
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        overview = executor.submit(_build_market_overview, analytics)
+        quality_stats = executor.submit(db.get_data_quality_stats)
+        return overview.result(), quality_stats.result()
 
-@st.cache_data(ttl=3600)
-def load_top_skills(limit=20):
+@keyed_on_data_version
+@st.cache_data(persist="disk", show_spinner=False, max_entries=64)
+def load_top_skills(version: str, limit: int, /) -> pd.DataFrame:
     analytics = get_analytics()
-    return analytics.get_top_skills(limit)
+    return _arrow_strings(analytics.get_top_skills(limit), 'skill_name')
 
-@st.cache_data(ttl=3600)
-def load_top_companies(limit=20):
+@keyed_on_data_version
+@st.cache_data(persist="disk", show_spinner=False, max_entries=64)
+def load_top_companies(version: str, limit: int, /) -> pd.DataFrame:
     analytics = get_analytics()
     return analytics.get_top_hiring_companies(limit)
 
-@st.cache_data(ttl=3600)
-def load_jobs_by_city():
+@keyed_on_data_version
+@st.cache_data(persist="disk", show_spinner=False, max_entries=64)
+def skills_csv(version: str, limit: int, /) -> bytes:
+    """CSV download of load_top_skills(limit), encoded once per limit"""
+    return load_top_skills(limit).to_csv(index=False).encode('utf-8')
+
+@keyed_on_data_version
+@st.cache_data(persist="disk", show_spinner=False, max_entries=64)
+def companies_csv(version: str, limit: int, /) -> bytes:
+    """CSV download of load_top_companies(limit), encoded once per limit"""
+    return load_top_companies(limit).to_csv(index=False).encode('utf-8')
+
+@keyed_on_data_version
+@st.cache_data(persist="disk", show_spinner=False, max_entries=64)
+def load_jobs_by_city(version: str, /):
+    """Jobs per city, limited to named cities that have jobs"""
     analytics = get_analytics()
-    return analytics.get_jobs_by_city()
+    return _valid_city_rows(_arrow_strings(analytics.get_jobs_by_city(), 'city'))
+
+def _cities() -> List[str]:
+    """Names of the cities shown in city selectors, kept for the session until the data changes"""
+    version = data_version()
+    cached = st.session_state.get('valid_cities')
+    if cached is None or cached[0] != version:
+        cached = (version, load_jobs_by_city()['city'].tolist())
+        st.session_state['valid_cities'] = cached
+    return cached[1]
 
-@st.cache_data(ttl=3600)
-def load_skill_cooccurrence(min_count=10, limit=50):
+@keyed_on_data_version
+@st.cache_data(persist="disk", show_spinner=False, max_entries=64)
+def load_skill_cooccurrence(version: str, min_count: int, limit: int, /) -> pd.DataFrame:
     analytics = get_analytics()
     return analytics.get_skill_cooccurrence(min_count, limit)
 
-@st.cache_data(ttl=3600)
-def load_experience_distribution():
+@keyed_on_data_version
+@st.cache_data(persist="disk", show_spinner=False, max_entries=64)
+def load_experience_distribution(version: str, /):
     analytics = get_analytics()
     return analytics.get_experience_distribution()
 
-@st.cache_data(ttl=3600)
-def load_top_skills_by_city(city, limit=20):
+@keyed_on_data_version
+@st.cache_data(persist="disk", show_spinner=False, max_entries=64)
+def load_top_skills_by_city(version: str, city: str, limit: int, /) -> pd.DataFrame:
     analytics = get_analytics()
-    return analytics.get_top_skills_by_city(city, limit)
+    return _arrow_strings(analytics.get_top_skills_by_city(city, limit), 'city', 'skill_name')
 
-@st.cache_data(ttl=3600)
-def load_companies_by_city(city, limit=20):
+@keyed_on_data_version
+@st.cache_data(persist="disk", show_spinner=False, max_entries=64)
+def load_companies_by_city(version: str, city: str, limit: int, /) -> pd.DataFrame:
     analytics = get_analytics()
     return analytics.get_companies_by_city(city, limit)
 
+@keyed_on_data_version
+@st.cache_data(persist="disk", show_spinner=False, max_entries=64)
+def load_salary_by_skill(version: str, min_jobs: int, /) -> pd.DataFrame:
+    """Average salary per skill, with formatted display columns"""
+    df = get_analytics().get_salary_by_skill(min_jobs=min_jobs, limit=20)
+    df['avg_min_display'] = format_lakhs(df['avg_min_salary'])
+    df['avg_max_display'] = format_lakhs(df['avg_max_salary'])
+    return df
+
+@keyed_on_data_version
+@st.cache_data(persist="disk", show_spinner=False, max_entries=64)
+def load_salary_by_city(version: str, /):
+    """Average salary per city, with formatted display columns"""
+    df = get_analytics().get_salary_by_city()
+    df['avg_min_display'] = format_lakhs(df['avg_min_salary'])
+    df['avg_max_display'] = format_lakhs(df['avg_max_salary'])
+    return df
+
+
+# Arrow tables for st.dataframe, converted once per cache fill instead of on every render
+def _arrow_table(df: pd.DataFrame, columns: List[str] = None, names: List[str] = None) -> pa.Table:
+    """Convert df (or the given columns of it) to an Arrow table, optionally renaming columns"""
+    table = pa.Table.from_pandas(df[columns] if columns else df, preserve_index=False)
+    return table.rename_columns(names) if names else table
+
+@keyed_on_data_version
+@st.cache_data(persist="disk", show_spinner=False, max_entries=64)
+def skills_table(version: str, limit: int, /) -> pa.Table:
+    return _arrow_table(load_top_skills(limit))
+
+@keyed_on_data_version
+@st.cache_data(persist="disk", show_spinner=False, max_entries=64)
+def city_skills_table(version: str, city: str, limit: int, /) -> pa.Table:
+    return _arrow_table(load_top_skills_by_city(city, limit))
+
+@keyed_on_data_version
+@st.cache_data(persist="disk", show_spinner=False, max_entries=64)
+def cooccurrence_table(version: str, min_count: int, limit: int, /) -> pa.Table:
+    return _arrow_table(
+        load_skill_cooccurrence(min_count, limit),
+        ['skill_1', 'skill_2', 'co_occurrence_count']
+    )
+
+@keyed_on_data_version
+@st.cache_data(persist="disk", show_spinner=False, max_entries=64)
+def companies_table(version: str, limit: int, /) -> pa.Table:
+    return _arrow_table(load_top_companies(limit))
+
+@keyed_on_data_version
+@st.cache_data(persist="disk", show_spinner=False, max_entries=64)
+def city_companies_table(version: str, city: str, limit: int, /) -> pa.Table:
+    return _arrow_table(load_companies_by_city(city, limit))
+
+@keyed_on_data_version
+@st.cache_data(persist="disk", show_spinner=False, max_entries=64)
+def locations_table(version: str, /) -> pa.Table:
+    return _arrow_table(load_jobs_by_city())
+
+@keyed_on_data_version
+@st.cache_data(persist="disk", show_spinner=False, max_entries=64)
+def experience_table(version: str, /) -> pa.Table:
+    return _arrow_table(load_experience_distribution())
+
+@keyed_on_data_version
+@st.cache_data(persist="disk", show_spinner=False, max_entries=64)
+def salary_by_skill_table(version: str, min_jobs: int, /) -> pa.Table:
+    return _arrow_table(
+        load_salary_by_skill(min_jobs),
+        ['skill_name', 'avg_min_display', 'avg_max_display', 'job_count'],
+        ['Skill', 'Avg Min', 'Avg Max', 'Jobs']
+    )
+
+@keyed_on_data_version
+@st.cache_data(persist="disk", show_spinner=False, max_entries=64)
+def salary_by_city_table(version: str, /) -> pa.Table:
+    return _arrow_table(
+        load_salary_by_city(),
+        ['city', 'avg_min_display', 'avg_max_display', 'job_count'],
+        ['City', 'Avg Min', 'Avg Max', 'Jobs']
+    )
+
+
+# Cached figures, rebuilt only when their inputs change
+# (plotly is imported inside each builder so a cold start doesn't pay for it).
+# Ranked frames arrive sorted descending; horizontal bars plot them reversed so
+# the largest bar sits on top without a categoryorder pass.
+
+# A fixed colour per skill category (as bulk_insert_skills names the
+# skill_keywords.json groups), so a category looks the same on every chart
+SKILL_CATEGORY_COLORS = {
+    'Programming Languages': '#636EFA',
+    'Web Technologies': '#EF553B',
+    'Databases': '#00CC96',
+    'Cloud Platforms': '#AB63FA',
+    'Devops Tools': '#FFA15A',
+    'Data Science Ml': '#19D3F3',
+    'Big Data': '#FF6692',
+    'Business Intelligence': '#B6E880',
+    'Mobile Development': '#FF97FF',
+    'Testing': '#FECB52',
+    'Security': '#2E91E5',
+    'Soft Skills': '#E15F99',
+    'Other Tools': '#1CA71C',
+}
+
+# Plotly's default qualitative palette, for categories not listed above
+_CATEGORY_PALETTE = ['#636EFA', '#EF553B', '#00CC96', '#AB63FA', '#FFA15A',
+                     '#19D3F3', '#FF6692', '#B6E880', '#FF97FF', '#FECB52']
+
+def _category_color(category: str) -> str:
+    """Colour for a skill category; unlisted ones hash to a stable palette entry"""
+    if category in SKILL_CATEGORY_COLORS:
+        return SKILL_CATEGORY_COLORS[category]
+    return _CATEGORY_PALETTE[zlib.crc32(category.encode()) % len(_CATEGORY_PALETTE)]
+
+def _add_skill_category_bars(fig, skills_df: pd.DataFrame, hovertemplate: str, *hover_columns: str):
+    """
+    Add horizontal skill bars to fig, one trace per skill category
+    
+    Each trace gets a legend entry and its category's colour; customdata[0]
+    is the category, followed by hover_columns. The skills keep the row
+    order of skills_df on the y axis.
+    """
+    categories = skills_df['skill_category'].astype(object).fillna('Other')
+    customdata = np.column_stack([categories, *(skills_df[column] for column in hover_columns)])
+    for category in categories.unique():
+        mask = (categories == category).to_numpy()
+        fig.add_bar(
+            x=skills_df['job_count'][mask],
+            y=skills_df['skill_name'][mask],
+            orientation='h',
+            name=category,
+            marker_color=_category_color(category),
+            customdata=customdata[mask],
+            hovertemplate=hovertemplate
+        )
+    # Each skill has a single bar, so stacking just gives it the full slot width
+    fig.update_layout(
+        barmode='relative',
+        legend_title_text='Skill Category',
+        yaxis=dict(categoryorder='array', categoryarray=skills_df['skill_name'].tolist())
+    )
+    return fig
+
+def _top_skills_bar(top_skills_df: pd.DataFrame):
+    """Overview: top 10 skills bar chart"""
+    import plotly.graph_objects as go
+    
+    fig = _add_skill_category_bars(
+        go.Figure(),
+        top_skills_df.iloc[::-1],
+        '%{y}<br>Category: %{customdata[0]}<br>Job Count: %{x}<extra></extra>'
+    )
+    fig.update_layout(
+        height=400,
+        xaxis_title='Job Count',
+        yaxis_title='Skill',
+        margin=dict(l=20, r=20, t=40, b=20)
+    )
+    return fig
+
+def _top_companies_bar(top_companies_df: pd.DataFrame):
+    """Overview: top 10 companies bar chart"""
+    import plotly.graph_objects as go
+    
+    top_companies_df = top_companies_df.iloc[::-1]
+    fig = go.Figure(go.Bar(
+        x=top_companies_df['job_count'],
+        y=top_companies_df['company_name'],
+        orientation='h'
+    ))
+    fig.update_layout(
+        height=400,
+        xaxis_title='Job Count',
+        yaxis_title='Company',
+        margin=dict(l=20, r=20, t=40, b=20)
+    )
+    return fig
+
+def _city_pie(jobs_by_city_df: pd.DataFrame):
+    """Share of jobs per city (donut)"""
+    import plotly.express as px
+    
+    fig = px.pie(
+        jobs_by_city_df,
+        values='job_count',
+        names='city',
+        hole=0.4
+    )
+    fig.update_traces(textposition='inside', textinfo='percent+label')
+    fig.update_layout(margin=dict(l=20, r=20, t=40, b=20))
+    return fig
+
+def _experience_pie(exp_dist_df: pd.DataFrame):
+    """Share of jobs per experience level (donut)"""
+    import plotly.express as px
+    
+    fig = px.pie(
+        exp_dist_df,
+        values='job_count',
+        names='experience_level',
+        hole=0.4
+    )
+    fig.update_traces(textposition='inside', textinfo='percent+label')
+    fig.update_layout(margin=dict(l=20, r=20, t=40, b=20))
+    return fig
+
+@keyed_on_data_version
+@st.cache_data(ttl=3600, show_spinner=False)
+def fig_overview(version: str, /) -> Dict:
+    """Overview charts keyed by section, built concurrently on a cache miss"""
+    # Import plotly up front so the workers don't contend on the import lock
+    import plotly.express
+    import plotly.graph_objects
+    
+    overview = load_overview_bundle()[0]
+    jobs_by_city_df = load_jobs_by_city()
+    
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        futures = {
+            'skills': executor.submit(_top_skills_bar, overview.top_skills),
+            'companies': executor.submit(_top_companies_bar, overview.top_companies),
+            'cities': executor.submit(_city_pie, jobs_by_city_df),
+            'experience': executor.submit(_experience_pie, overview.experience),
+        }
+        return {section: future.result() for section, future in futures.items()}
+
+@keyed_on_data_version
+@st.cache_data(ttl=3600, show_spinner=False)
+def fig_city_distribution(version: str, /):
+    """Share of jobs per city (donut)"""
+    return _city_pie(load_jobs_by_city())
+
+@keyed_on_data_version
+@st.cache_data(ttl=3600, show_spinner=False)
+def fig_experience_distribution(version: str, /):
+    """Share of jobs per experience level (donut)"""
+    return _experience_pie(load_experience_distribution())
+
+@keyed_on_data_version
+@st.cache_data(ttl=3600, show_spinner=False)
+def fig_top_skills(version: str, limit: int, /):
+    """Most in-demand skills"""
+    import plotly.graph_objects as go
+    
+    fig = _add_skill_category_bars(
+        go.Figure(),
+        load_top_skills(limit).iloc[::-1],
+        '%{y}<br>Category: %{customdata[0]}<br>Job Count: %{x}<br>Percentage: %{customdata[1]}<extra></extra>',
+        'percentage'
+    )
+    fig.update_layout(
+        height=600,
+        xaxis_title='Job Count',
+        yaxis_title='Skill'
+    )
+    return fig
+
+@keyed_on_data_version
+@st.cache_data(ttl=3600, show_spinner=False)
+def fig_city_skills(version: str, city: str, limit: int, /):
+    """Top skills in one city"""
+    import plotly.graph_objects as go
+    
+    city_skills_df = load_top_skills_by_city(city, limit).iloc[::-1]
+    fig = go.Figure(go.Bar(
+        x=city_skills_df['job_count'],
+        y=city_skills_df['skill_name'],
+        orientation='h'
+    ))
+    fig.update_layout(
+        height=500,
+        xaxis_title='Job Count',
+        yaxis_title='Skill'
+    )
+    return fig
+
+@keyed_on_data_version
+@st.cache_data(ttl=3600, show_spinner=False)
+def fig_cooccurrence(version: str, min_count: int, limit: int, /):
+    """Most common skill pairs"""
+    import plotly.graph_objects as go
+    
+    cooccurrence_df = load_skill_cooccurrence(min_count, limit).iloc[::-1]
+    fig = go.Figure(go.Bar(
+        x=cooccurrence_df['co_occurrence_count'],
+        y=cooccurrence_df['skill_pair'],
+        orientation='h'
+    ))
+    fig.update_layout(
+        height=600,
+        xaxis_title='Job Count',
+        yaxis_title='Skill Pair'
+    )
+    return fig
+
+@keyed_on_data_version
+@st.cache_data(ttl=3600, show_spinner=False)
+def fig_top_companies(version: str, limit: int, /):
+    """Top hiring companies"""
+    import plotly.graph_objects as go
+    
+    companies_df = load_top_companies(limit).iloc[::-1]
+    fig = go.Figure(go.Bar(
+        x=companies_df['job_count'],
+        y=companies_df['company_name'],
+        orientation='h',
+        marker=dict(
+            color=companies_df['cities_hiring_in'],
+            colorscale='Plasma',
+            colorbar=dict(title='Cities')
+        ),
+        customdata=companies_df['cities_hiring_in'],
+        hovertemplate='%{y}<br>Job Count: %{x}<br>Cities: %{customdata}<extra></extra>'
+    ))
+    fig.update_layout(
+        height=600,
+        xaxis_title='Job Count',
+        yaxis_title='Company'
+    )
+    return fig
+
+@keyed_on_data_version
+@st.cache_data(ttl=3600, show_spinner=False)
+def fig_city_companies(version: str, city: str, limit: int, /):
+    """Top hiring companies in one city"""
+    import plotly.graph_objects as go
+    
+    city_companies_df = load_companies_by_city(city, limit).iloc[::-1]
+    fig = go.Figure(go.Bar(
+        x=city_companies_df['job_count'],
+        y=city_companies_df['company_name'],
+        orientation='h'
+    ))
+    fig.update_layout(
+        height=500,
+        xaxis_title='Job Count',
+        yaxis_title='Company'
+    )
+    return fig
+
+@keyed_on_data_version
+@st.cache_data(ttl=3600, show_spinner=False)
+def fig_jobs_by_city(version: str, /):
+    """Jobs per city bar chart"""
+    import plotly.express as px
+    
+    locations_df = load_jobs_by_city()
+    fig = px.bar(
+        locations_df,
+        x='city',
+        y='job_count',
+        labels={'job_count': 'Job Count', 'city': 'City'},
+        color='job_count',
+        color_continuous_scale='Blues'
+    )
+    fig.update_layout(height=400)
+    return fig
+
+@keyed_on_data_version
+@st.cache_data(ttl=3600, show_spinner=False)
+def fig_city_comparison(version: str, cities: tuple, /):
+    """Jobs vs companies for the selected cities"""
+    import plotly.graph_objects as go
+    
+    locations_df = load_jobs_by_city()
+    comparison_df = locations_df[locations_df['city'].isin(cities)]
+    fig = go.Figure(data=[
+        go.Bar(name='Jobs', x=comparison_df['city'], y=comparison_df['job_count']),
+        go.Bar(name='Companies', x=comparison_df['city'], y=comparison_df['company_count'])
+    ])
+    fig.update_layout(
+        barmode='group',
+        xaxis_title="City",
+        yaxis_title="Count",
+        height=400
+    )
+    return fig
+
+@keyed_on_data_version
+@st.cache_data(ttl=3600, show_spinner=False)
+def fig_experience_demand(version: str, /):
+    """Jobs per experience level bar chart"""
+    import plotly.express as px
+    
+    exp_df = load_experience_distribution()
+    fig = px.bar(
+        exp_df,
+        x='experience_level',
+        y='job_count',
+        labels={'job_count': 'Job Count', 'experience_level': 'Experience Level'},
+        color='job_count',
+        color_continuous_scale='Viridis'
+    )
+    return fig
+
+@keyed_on_data_version
+@st.cache_data(ttl=3600, show_spinner=False)
+def fig_salary_by_skill(version: str, min_jobs: int, /):
+    """Average max salary per skill"""
+    import plotly.graph_objects as go
+    
+    salary_df = load_salary_by_skill(min_jobs).iloc[::-1]
+    fig = go.Figure(go.Bar(
+        x=salary_df['avg_max_salary'],
+        y=salary_df['skill_name'],
+        orientation='h',
+        customdata=salary_df[['avg_min_display', 'avg_max_display', 'job_count']],
+        hovertemplate='%{y}<br>Avg Min: %{customdata[0]}<br>Avg Max: %{customdata[1]}<br>Jobs: %{customdata[2]}<extra></extra>'
+    ))
+    fig.update_layout(height=500, xaxis_title='Average Max Salary', yaxis_title='Skill')
+    return fig
+
+@keyed_on_data_version
+@st.cache_data(ttl=3600, show_spinner=False)
+def fig_salary_by_city(version: str, /):
+    """Average max salary per city"""
+    import plotly.express as px
+    
+    city_salary_df = load_salary_by_city()
+    fig = px.bar(
+        city_salary_df,
+        x='city',
+        y='avg_max_salary',
+        labels={'avg_max_salary': 'Average Max Salary', 'city': 'City'},
+        hover_data=['avg_min_display', 'avg_max_display', 'job_count']
+    )
+    fig.update_layout(height=400)
+    return fig
+
 
 def main():
     # Header
@@ -205,35 +715,7 @@ def main():
         
         st.markdown("---")
         
-        # Data refresh
-        if st.button("Refresh Data", width='stretch'):
-            st.cache_data.clear()
-            st.rerun()
-        
-        st.markdown("---")
-        
-        # Project info
-        st.markdown("### Project Information")
-        st.markdown("**DBMS Course Project**")
-        st.markdown("**Last Updated:** " + datetime.now().strftime("%Y-%m-%d %H:%M"))
-        
-        st.markdown("---")
-        
-        # Team
-        st.markdown("### Team Members")
-        st.markdown("""
-        **Siddhartha Kabeer Upadhyay**  
-        Backend & Database
-        
-        **Adrika Srivastava**  
-        Frontend Development
-        
-        **Vibhor Saini**  
-        Data Processing & NLP
-        
-        **Nelly**  
-        Quality Assurance & Documentation
-        """)
+        _render_sidebar_info()
     
     # Route to appropriate page
     if page == "Market Overview":
@@ -250,6 +732,48 @@ def main():
         show_salary_analysis()
 
 
+@st.cache_data(ttl=60, show_spinner=False)
+def _last_updated() -> str:
+    """Timestamp shown in the sidebar, refreshed at most once a minute"""
+    return datetime.now().strftime("%Y-%m-%d %H:%M")
+
+
+def _render_sidebar_info():
+    """Sidebar refresh button, project information and team"""
+    # Data refresh; the sidebar renders before the page, so the page
+    # below already loads fresh data in this run
+    if st.button("Refresh Data", width='stretch'):
+        st.cache_data.clear()
+        data_version.clear()
+        get_analytics().invalidate_cache()
+        st.session_state.pop('valid_cities', None)
+    
+    st.markdown("---")
+    
+    # Project info
+    st.markdown("### Project Information")
+    st.markdown("**DBMS Course Project**")
+    st.markdown("**Last Updated:** " + _last_updated())
+    
+    st.markdown("---")
+    
+    # Team
+    st.markdown("### Team Members")
+    st.markdown("""
+    **Siddhartha Kabeer Upadhyay**  
+    Backend & Database
+    
+    **Adrika Srivastava**  
+    Frontend Development
+    
+    **Vibhor Saini**  
+    Data Processing & NLP
+    
+    **Nelly**  
+    Quality Assurance & Documentation
+    """)
+
+
 def show_overview():
     """Market Overview Page"""
     st.header("Market Overview")
@@ -257,8 +781,7 @@ def show_overview():
     
     try:
         with st.spinner("Loading data..."):
-            overview = load_market_overview()
-            quality_stats = load_data_quality()
+            overview, quality_stats = load_overview_bundle()
         
         # Data Quality Alert
         if quality_stats['location_coverage'] < 100:
@@ -269,13 +792,18 @@ def show_overview():
         col1, col2, col3, col4 = st.columns(4)
         
         with col1:
-            st.metric("Total Jobs", f"{overview['total_jobs']:,}")
+            st.metric("Total Jobs", f"{overview.totals['total_jobs']:,}")
         with col2:
-            st.metric("Companies", f"{overview['total_companies']:,}")
+            st.metric("Companies", f"{overview.totals['total_companies']:,}")
         with col3:
-            st.metric("Unique Skills", f"{overview['total_skills']:,}")
+            st.metric("Unique Skills", f"{overview.totals['total_skills']:,}")
         with col4:
-            st.metric("Cities Covered", f"{overview['total_cities']:,}")
+            st.metric("Cities Covered", f"{overview.totals['total_cities']:,}")
+        
+        # Nothing to chart on an empty database
+        if overview.totals['total_jobs'] == 0:
+            st.info("No jobs in database yet. Run the scraper to collect job data.")
+            return
         
         # Data Coverage Metrics
         st.markdown("---")
@@ -292,47 +820,22 @@ def show_overview():
         st.markdown("---")
         
         # Charts
+        figures = fig_overview()
         col1, col2 = st.columns(2)
         
         with col1:
             st.subheader("Top 10 Skills")
-            top_skills_df = pd.DataFrame(overview['top_10_skills'])
+            top_skills_df = overview.top_skills
             
             if not top_skills_df.empty:
-                fig = px.bar(
-                    top_skills_df,
-                    x='job_count',
-                    y='skill_name',
-                    orientation='h',
-                    color='skill_category',
-                    labels={'job_count': 'Job Count', 'skill_name': 'Skill'}
-                )
-                fig.update_layout(
-                    height=400,
-                    showlegend=True,
-                    yaxis={'categoryorder':'total ascending'},
-                    margin=dict(l=20, r=20, t=40, b=20)
-                )
-                st.plotly_chart(fig, use_container_width=True, config=PLOTLY_CONFIG)
+                st.plotly_chart(figures['skills'], use_container_width=True, config=PLOTLY_CONFIG)
         
         with col2:
             st.subheader("Top 10 Hiring Companies")
-            top_companies_df = pd.DataFrame(overview['top_10_companies'])
+            top_companies_df = overview.top_companies
             
             if not top_companies_df.empty:
-                fig = px.bar(
-                    top_companies_df,
-                    x='job_count',
-                    y='company_name',
-                    orientation='h',
-                    labels={'job_count': 'Job Count', 'company_name': 'Company'}
-                )
-                fig.update_layout(
-                    height=400,
-                    yaxis={'categoryorder':'total ascending'},
-                    margin=dict(l=20, r=20, t=40, b=20)
-                )
-                st.plotly_chart(fig, use_container_width=True, config=PLOTLY_CONFIG)
+                st.plotly_chart(figures['companies'], use_container_width=True, config=PLOTLY_CONFIG)
         
         st.markdown("---")
         
@@ -340,39 +843,17 @@ def show_overview():
         
         with col1:
             st.subheader("Job Distribution by City")
-            jobs_by_city_df = pd.DataFrame(overview['jobs_by_city'])
-            # Filter out null/NaN locations and ensure only valid data
-            jobs_by_city_df = jobs_by_city_df[
-                (jobs_by_city_df['city'].notna()) & 
-                (jobs_by_city_df['city'] != '') & 
-                (jobs_by_city_df['job_count'] > 0)
-            ]
+            jobs_by_city_df = load_jobs_by_city()
             
             if not jobs_by_city_df.empty:
-                fig = px.pie(
-                    jobs_by_city_df,
-                    values='job_count',
-                    names='city',
-                    hole=0.4
-                )
-                fig.update_traces(textposition='inside', textinfo='percent+label')
-                fig.update_layout(margin=dict(l=20, r=20, t=40, b=20))
-                st.plotly_chart(fig, use_container_width=True, config=PLOTLY_CONFIG)
+                st.plotly_chart(figures['cities'], use_container_width=True, config=PLOTLY_CONFIG)
         
         with col2:
             st.subheader("Experience Level Distribution")
-            exp_dist_df = pd.DataFrame(overview['experience_distribution'])
+            exp_dist_df = overview.experience
             
             if not exp_dist_df.empty:
-                fig = px.pie(
-                    exp_dist_df,
-                    values='job_count',
-                    names='experience_level',
-                    hole=0.4
-                )
-                fig.update_traces(textposition='inside', textinfo='percent+label')
-                fig.update_layout(margin=dict(l=20, r=20, t=40, b=20))
-                st.plotly_chart(fig, use_container_width=True, config=PLOTLY_CONFIG)
+                st.plotly_chart(figures['experience'], use_container_width=True, config=PLOTLY_CONFIG)
         
     except Exception as e:
         st.error(f"Error loading data: {str(e)}")
@@ -385,131 +866,101 @@ def show_skills_analysis():
     
     tab1, tab2, tab3 = st.tabs(["Overall Demand", "By Location", "Co-occurrence"])
     
+    # Each tab is a fragment, so its widgets only rerun that tab
     with tab1:
-        st.subheader("Most In-Demand Skills")
-        
-        num_skills = st.slider("Number of skills", 10, 50, 20, 5)
-        
-        try:
-            with st.spinner("Loading..."):
-                skills_df = load_top_skills(num_skills)
-            
-            if not skills_df.empty:
-                fig = px.bar(
-                    skills_df,
-                    x='job_count',
-                    y='skill_name',
-                    orientation='h',
-                    color='skill_category',
-                    labels={'job_count': 'Job Count', 'skill_name': 'Skill'},
-                    hover_data=['percentage']
-                )
-                fig.update_layout(
-                    height=600,
-                    yaxis={'categoryorder':'total ascending'}
-                )
-                st.plotly_chart(fig, use_container_width=True, config=PLOTLY_CONFIG)
-                
-                st.subheader("Detailed Data")
-                st.dataframe(skills_df, width='stretch', hide_index=True)
-                
-                csv = skills_df.to_csv(index=False).encode('utf-8')
-                st.download_button(
-                    label="Download CSV",
-                    data=csv,
-                    file_name=f"top_skills_{datetime.now().strftime('%Y%m%d')}.csv",
-                    mime="text/csv"
-                )
-            else:
-                st.warning("No data available")
-                
-        except Exception as e:
-            st.error(f"Error: {str(e)}")
+        _render_overall_demand()
     
     with tab2:
-        st.subheader("Skills by City")
-        
-        try:
-            cities_df = load_jobs_by_city()
-            # Filter to only valid cities with jobs
-            cities_df_filtered = cities_df[
-                (cities_df['city'].notna()) & 
-                (cities_df['city'] != '') & 
-                (cities_df['job_count'] > 0)
-            ]
-            cities = cities_df_filtered['city'].tolist()
-            
-            if not cities:
-                st.warning("No city data available")
-                return
-            
-            selected_city = st.selectbox("Select City", cities)
-            num_skills_city = st.slider("Number of skills", 10, 30, 15, 5, key="city_skills")
+        _render_skills_by_city()
+    
+    with tab3:
+        _render_cooccurrence()
+
+
+@st.fragment
+def _render_overall_demand():
+    """Skills tab: most in-demand skills"""
+    st.subheader("Most In-Demand Skills")
+    
+    num_skills = st.slider("Number of skills", 10, 50, 20, 5)
+    
+    try:
+        with st.spinner("Loading..."):
+            skills_df = load_top_skills(num_skills)
+        
+        if not skills_df.empty:
+            st.plotly_chart(fig_top_skills(num_skills), use_container_width=True, config=PLOTLY_CONFIG)
             
-            with st.spinner("Loading..."):
-                city_skills_df = load_top_skills_by_city(selected_city, num_skills_city)
+            st.subheader("Detailed Data")
+            st.dataframe(skills_table(num_skills), width='stretch', hide_index=True)
             
-            if not city_skills_df.empty:
-                fig = px.bar(
-                    city_skills_df,
-                    x='job_count',
-                    y='skill_name',
-                    orientation='h',
-                    labels={'job_count': 'Job Count', 'skill_name': 'Skill'}
-                )
-                fig.update_layout(
-                    height=500,
-                    yaxis={'categoryorder':'total ascending'}
-                )
-                st.plotly_chart(fig, use_container_width=True, config=PLOTLY_CONFIG)
-                
-                st.dataframe(city_skills_df, width='stretch', hide_index=True)
-            else:
-                st.warning(f"No data for {selected_city}")
-                
-        except Exception as e:
-            st.error(f"Error: {str(e)}")
+            st.download_button(
+                label="Download CSV",
+                data=skills_csv(num_skills),
+                file_name=f"top_skills_{datetime.now().strftime('%Y%m%d')}.csv",
+                mime="text/csv"
+            )
+        else:
+            st.warning("No data available")
     
-    with tab3:
-        st.subheader("Skill Co-occurrence")
-        st.caption("Skills frequently requested together")
+    except Exception as e:
+        st.error(f"Error: {str(e)}")
+
+
+@st.fragment
+def _render_skills_by_city():
+    """Skills tab: top skills in a selected city"""
+    st.subheader("Skills by City")
+    
+    try:
+        cities = _cities()
         
-        col1, col2 = st.columns(2)
-        with col1:
-            min_count = st.number_input("Minimum occurrences", 5, 50, 10, 5)
-        with col2:
-            limit = st.number_input("Number of pairs", 10, 100, 30, 10)
+        if not cities:
+            st.warning("No city data available")
+            return
+        
+        selected_city = st.selectbox("Select City", cities)
+        num_skills_city = st.slider("Number of skills", 10, 30, 15, 5, key="city_skills")
+        
+        with st.spinner("Loading..."):
+            city_skills_df = load_top_skills_by_city(selected_city, num_skills_city)
+        
+        if not city_skills_df.empty:
+            st.plotly_chart(fig_city_skills(selected_city, num_skills_city), use_container_width=True, config=PLOTLY_CONFIG)
+            
+            st.dataframe(city_skills_table(selected_city, num_skills_city), width='stretch', hide_index=True)
+        else:
+            st.warning(f"No data for {selected_city}")
+    
+    except Exception as e:
+        st.error(f"Error: {str(e)}")
+
+
+@st.fragment
+def _render_cooccurrence():
+    """Skills tab: skill pairs requested together"""
+    st.subheader("Skill Co-occurrence")
+    st.caption("Skills frequently requested together")
+    
+    col1, col2 = st.columns(2)
+    with col1:
+        min_count = st.number_input("Minimum occurrences", 5, 50, 10, 5)
+    with col2:
+        limit = st.number_input("Number of pairs", 10, 100, 30, 10)
+    
+    try:
+        with st.spinner("Analyzing..."):
+            cooccurrence_df = load_skill_cooccurrence(min_count, limit)
         
-        try:
-            with st.spinner("Analyzing..."):
-                cooccurrence_df = load_skill_cooccurrence(min_count, limit)
+        if not cooccurrence_df.empty:
+            st.plotly_chart(fig_cooccurrence(min_count, limit), use_container_width=True, config=PLOTLY_CONFIG)
             
-            if not cooccurrence_df.empty:
-                cooccurrence_df['skill_pair'] = cooccurrence_df['skill_1'] + ' + ' + cooccurrence_df['skill_2']
-                
-                fig = px.bar(
-                    cooccurrence_df,
-                    x='co_occurrence_count',
-                    y='skill_pair',
-                    orientation='h',
-                    labels={'co_occurrence_count': 'Job Count', 'skill_pair': 'Skill Pair'}
-                )
-                fig.update_layout(
-                    height=600,
-                    yaxis={'categoryorder':'total ascending'}
-                )
-                st.plotly_chart(fig, use_container_width=True, config=PLOTLY_CONFIG)
-                
-                st.dataframe(
-                    cooccurrence_df[['skill_1', 'skill_2', 'co_occurrence_count']],
-                    width='stretch',
-                    hide_index=True
-                )
-            else:
-                st.warning("No co-occurrence data with current filters")
-                
-        except Exception as e:
-            st.error(f"Error: {str(e)}")
+            st.dataframe(cooccurrence_table(min_count, limit), width='stretch', hide_index=True)
+        else:
+            st.warning("No co-occurrence data with current filters")
+    
+    except Exception as e:
+        st.error(f"Error: {str(e)}")
 
 
 def show_company_insights():
@@ -519,87 +970,69 @@ def show_company_insights():
     tab1, tab2 = st.tabs(["Top Companies", "By Location"])
     
     with tab1:
-        st.subheader("Top Hiring Companies")
-        
-        num_companies = st.slider("Number of companies", 10, 50, 20, 5)
-        
-        try:
-            with st.spinner("Loading..."):
-                companies_df = load_top_companies(num_companies)
-            
-            if not companies_df.empty:
-                fig = px.bar(
-                    companies_df,
-                    x='job_count',
-                    y='company_name',
-                    orientation='h',
-                    color='cities_hiring_in',
-                    labels={'job_count': 'Job Count', 'company_name': 'Company', 'cities_hiring_in': 'Cities'},
-                )
-                fig.update_layout(
-                    height=600,
-                    yaxis={'categoryorder':'total ascending'}
-                )
-                st.plotly_chart(fig, use_container_width=True, config=PLOTLY_CONFIG)
-                
-                st.dataframe(companies_df, width='stretch', hide_index=True)
-                
-                csv = companies_df.to_csv(index=False).encode('utf-8')
-                st.download_button(
-                    label="Download CSV",
-                    data=csv,
-                    file_name=f"top_companies_{datetime.now().strftime('%Y%m%d')}.csv",
-                    mime="text/csv"
-                )
-            else:
-                st.warning("No data available")
-                
-        except Exception as e:
-            st.error(f"Error: {str(e)}")
+        _render_top_companies()
     
     with tab2:
-        st.subheader("Companies by City")
-        
-        try:
-            cities_df = load_jobs_by_city()
-            # Filter to only valid cities with jobs
-            cities_df_filtered = cities_df[
-                (cities_df['city'].notna()) & 
-                (cities_df['city'] != '') & 
-                (cities_df['job_count'] > 0)
-            ]
-            cities = cities_df_filtered['city'].tolist()
-            
-            if not cities:
-                st.warning("No city data available")
-                return
+        _render_companies_by_city()
+
+
+@st.fragment
+def _render_top_companies():
+    """Companies tab: top hiring companies"""
+    st.subheader("Top Hiring Companies")
+    
+    num_companies = st.slider("Number of companies", 10, 50, 20, 5)
+    
+    try:
+        with st.spinner("Loading..."):
+            companies_df = load_top_companies(num_companies)
+        
+        if not companies_df.empty:
+            st.plotly_chart(fig_top_companies(num_companies), use_container_width=True, config=PLOTLY_CONFIG)
             
-            selected_city = st.selectbox("Select City", cities, key="company_city")
-            num_companies_city = st.slider("Number of companies", 10, 30, 15, 5, key="city_companies")
+            st.dataframe(companies_table(num_companies), width='stretch', hide_index=True)
             
-            with st.spinner("Loading..."):
-                city_companies_df = load_companies_by_city(selected_city, num_companies_city)
+            st.download_button(
+                label="Download CSV",
+                data=companies_csv(num_companies),
+                file_name=f"top_companies_{datetime.now().strftime('%Y%m%d')}.csv",
+                mime="text/csv"
+            )
+        else:
+            st.warning("No data available")
+    
+    except Exception as e:
+        st.error(f"Error: {str(e)}")
+
+
+@st.fragment
+def _render_companies_by_city():
+    """Companies tab: top companies in a selected city"""
+    st.subheader("Companies by City")
+    
+    try:
+        cities = _cities()
+        
+        if not cities:
+            st.warning("No city data available")
+            return
+        
+        selected_city = st.selectbox("Select City", cities, key="company_city")
+        num_companies_city = st.slider("Number of companies", 10, 30, 15, 5, key="city_companies")
+        
+        with st.spinner("Loading..."):
+            city_companies_df = load_companies_by_city(selected_city, num_companies_city)
+        
+        if not city_companies_df.empty:
+            st.plotly_chart(fig_city_companies(selected_city, num_companies_city), use_container_width=True, config=PLOTLY_CONFIG)
             
-            if not city_companies_df.empty:
-                fig = px.bar(
-                    city_companies_df,
-                    x='job_count',
-                    y='company_name',
-                    orientation='h',
-                    labels={'job_count': 'Job Count', 'company_name': 'Company'}
-                )
-                fig.update_layout(
-                    height=500,
-                    yaxis={'categoryorder':'total ascending'}
-                )
-                st.plotly_chart(fig, use_container_width=True, config=PLOTLY_CONFIG)
-                
-                st.dataframe(city_companies_df, width='stretch', hide_index=True)
-            else:
-                st.warning(f"No data for {selected_city}")
-                
-        except Exception as e:
-            st.error(f"Error: {str(e)}")
+            st.dataframe(city_companies_table(selected_city, num_companies_city), width='stretch', hide_index=True)
+        else:
+            st.warning(f"No data for {selected_city}")
+    
+    except Exception as e:
+        st.error(f"Error: {str(e)}")
+
 
 
 def show_location_analysis():
@@ -609,42 +1042,20 @@ def show_location_analysis():
     try:
         with st.spinner("Loading..."):
             locations_df = load_jobs_by_city()
-            # Filter out null/NaN locations
-            locations_df = locations_df[
-                (locations_df['city'].notna()) & 
-                (locations_df['city'] != '') & 
-                (locations_df['job_count'] > 0)
-            ]
         
         if not locations_df.empty:
             col1, col2 = st.columns(2)
             
             with col1:
                 st.subheader("Jobs by City")
-                fig = px.bar(
-                    locations_df,
-                    x='city',
-                    y='job_count',
-                    labels={'job_count': 'Job Count', 'city': 'City'},
-                    color='job_count',
-                    color_continuous_scale='Blues'
-                )
-                fig.update_layout(height=400)
-                st.plotly_chart(fig, use_container_width=True, config=PLOTLY_CONFIG)
+                st.plotly_chart(fig_jobs_by_city(), use_container_width=True, config=PLOTLY_CONFIG)
             
             with col2:
                 st.subheader("Market Distribution")
-                fig = px.pie(
-                    locations_df,
-                    values='job_count',
-                    names='city',
-                    hole=0.4
-                )
-                fig.update_traces(textposition='inside', textinfo='percent+label')
-                st.plotly_chart(fig, use_container_width=True, config=PLOTLY_CONFIG)
+                st.plotly_chart(fig_city_distribution(), use_container_width=True, config=PLOTLY_CONFIG)
             
             st.subheader("Location Statistics")
-            st.dataframe(locations_df, width='stretch', hide_index=True)
+            st.dataframe(locations_table(), width='stretch', hide_index=True)
             
             st.markdown("---")
             st.subheader("City Comparison")
@@ -656,19 +1067,7 @@ def show_location_analysis():
             )
             
             if selected_cities:
-                comparison_df = locations_df[locations_df['city'].isin(selected_cities)]
-                
-                fig = go.Figure(data=[
-                    go.Bar(name='Jobs', x=comparison_df['city'], y=comparison_df['job_count']),
-                    go.Bar(name='Companies', x=comparison_df['city'], y=comparison_df['company_count'])
-                ])
-                fig.update_layout(
-                    barmode='group',
-                    xaxis_title="City",
-                    yaxis_title="Count",
-                    height=400
-                )
-                st.plotly_chart(fig, use_container_width=True, config=PLOTLY_CONFIG)
+                st.plotly_chart(fig_city_comparison(tuple(selected_cities)), use_container_width=True, config=PLOTLY_CONFIG)
         else:
             st.warning("No location data available")
             
@@ -689,29 +1088,14 @@ def show_experience_analysis():
             
             with col1:
                 st.subheader("Distribution")
-                fig = px.pie(
-                    exp_df,
-                    values='job_count',
-                    names='experience_level',
-                    hole=0.4
-                )
-                fig.update_traces(textposition='inside', textinfo='percent+label')
-                st.plotly_chart(fig, use_container_width=True, config=PLOTLY_CONFIG)
+                st.plotly_chart(fig_experience_distribution(), use_container_width=True, config=PLOTLY_CONFIG)
             
             with col2:
                 st.subheader("Demand by Level")
-                fig = px.bar(
-                    exp_df,
-                    x='experience_level',
-                    y='job_count',
-                    labels={'job_count': 'Job Count', 'experience_level': 'Experience Level'},
-                    color='job_count',
-                    color_continuous_scale='Viridis'
-                )
-                st.plotly_chart(fig, use_container_width=True, config=PLOTLY_CONFIG)
+                st.plotly_chart(fig_experience_demand(), use_container_width=True, config=PLOTLY_CONFIG)
             
             st.subheader("Statistics")
-            st.dataframe(exp_df, width='stretch', hide_index=True)
+            st.dataframe(experience_table(), width='stretch', hide_index=True)
             
         else:
             st.warning("No experience data available")
@@ -751,73 +1135,56 @@ def show_salary_analysis():
         tab1, tab2 = st.tabs(["By Skill", "By City"])
         
         with tab1:
-            st.subheader("Average Salary by Skill")
-            
-            min_jobs = st.slider("Minimum jobs required", 3, 20, 5)
-            
-            with st.spinner("Loading..."):
-                salary_df = analytics.get_salary_by_skill(min_jobs=min_jobs, limit=20)
-            
-            if not salary_df.empty:
-                # Format salary for display
-                salary_df['avg_min_display'] = salary_df['avg_min_salary'].apply(
-                    lambda x: f"₹{x/100000:.1f}L" if pd.notna(x) else "N/A"
-                )
-                salary_df['avg_max_display'] = salary_df['avg_max_salary'].apply(
-                    lambda x: f"₹{x/100000:.1f}L" if pd.notna(x) else "N/A"
-                )
-                
-                # Bar chart
-                fig = px.bar(
-                    salary_df,
-                    x='avg_max_salary',
-                    y='skill_name',
-                    orientation='h',
-                    labels={'avg_max_salary': 'Average Max Salary', 'skill_name': 'Skill'},
-                    hover_data=['avg_min_display', 'avg_max_display', 'job_count']
-                )
-                fig.update_layout(height=500, yaxis={'categoryorder':'total ascending'})
-                st.plotly_chart(fig, use_container_width=True, config=PLOTLY_CONFIG)
-                
-                # Data table
-                display_df = salary_df[['skill_name', 'avg_min_display', 'avg_max_display', 'job_count']]
-                display_df.columns = ['Skill', 'Avg Min', 'Avg Max', 'Jobs']
-                st.dataframe(display_df, width='stretch', hide_index=True)
-            else:
-                st.info("Not enough data to display salary by skill")
+            _render_salary_by_skill()
         
         with tab2:
-            st.subheader("Average Salary by City")
+            _render_salary_by_city()
+    
+    except Exception as e:
+        st.error(f"Error: {str(e)}")
+
+
+@st.fragment
+def _render_salary_by_skill():
+    """Salary tab: average salary by skill"""
+    st.subheader("Average Salary by Skill")
+    
+    min_jobs = st.slider("Minimum jobs required", 3, 20, 5)
+    
+    try:
+        with st.spinner("Loading..."):
+            salary_df = load_salary_by_skill(min_jobs)
+        
+        if not salary_df.empty:
+            # Bar chart
+            st.plotly_chart(fig_salary_by_skill(min_jobs), use_container_width=True, config=PLOTLY_CONFIG)
             
-            with st.spinner("Loading..."):
-                city_salary_df = analytics.get_salary_by_city()
+            # Data table
+            st.dataframe(salary_by_skill_table(min_jobs), width='stretch', hide_index=True)
+        else:
+            st.info("Not enough data to display salary by skill")
+    
+    except Exception as e:
+        st.error(f"Error: {str(e)}")
+
+
+@st.fragment
+def _render_salary_by_city():
+    """Salary tab: average salary by city"""
+    st.subheader("Average Salary by City")
+    
+    try:
+        with st.spinner("Loading..."):
+            city_salary_df = load_salary_by_city()
+        
+        if not city_salary_df.empty:
+            # Bar chart
+            st.plotly_chart(fig_salary_by_city(), use_container_width=True, config=PLOTLY_CONFIG)
             
-            if not city_salary_df.empty:
-                # Format salary
-                city_salary_df['avg_min_display'] = city_salary_df['avg_min_salary'].apply(
-                    lambda x: f"₹{x/100000:.1f}L" if pd.notna(x) else "N/A"
-                )
-                city_salary_df['avg_max_display'] = city_salary_df['avg_max_salary'].apply(
-                    lambda x: f"₹{x/100000:.1f}L" if pd.notna(x) else "N/A"
-                )
-                
-                # Bar chart
-                fig = px.bar(
-                    city_salary_df,
-                    x='city',
-                    y='avg_max_salary',
-                    labels={'avg_max_salary': 'Average Max Salary', 'city': 'City'},
-                    hover_data=['avg_min_display', 'avg_max_display', 'job_count']
-                )
-                fig.update_layout(height=400)
-                st.plotly_chart(fig, use_container_width=True, config=PLOTLY_CONFIG)
-                
-                # Data table
-                display_df = city_salary_df[['city', 'avg_min_display', 'avg_max_display', 'job_count']]
-                display_df.columns = ['City', 'Avg Min', 'Avg Max', 'Jobs']
-                st.dataframe(display_df, width='stretch', hide_index=True)
-            else:
-                st.info("Not enough data to display salary by city")
+            # Data table
+            st.dataframe(salary_by_city_table(), width='stretch', hide_index=True)
+        else:
+            st.info("Not enough data to display salary by city")
     
     except Exception as e:
         st.error(f"Error: {str(e)}")
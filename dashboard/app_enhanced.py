@@ -3,32 +3,36 @@ Enhanced Job Intelligence Platform Dashboard
 Modern card-based UI with dark mode support
 """
 
+import os
 import sys
 from pathlib import Path
 sys.path.append(str(Path(__file__).parent.parent))
 
 import streamlit as st
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+import functools
+import hashlib
+import time
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from datetime import datetime
 import warnings
 
 # Import components
-from components.theme import init_theme, get_theme_colors, is_dark_mode
+from components.theme import init_theme, get_theme, get_theme_colors, is_dark_mode
 from components.cards import (
     metric_card, info_card, stat_card, company_card, 
-    job_card, skill_badge, progress_card, empty_state, loading_skeleton
+    job_card_html, skill_badge, skill_badges, progress_card, empty_state, loading_skeleton
 )
 from components.filters import search_bar, chip_selector, filter_panel, sort_selector
 from components.navigation import sidebar_navigation, theme_toggle, breadcrumb, collapsible_section
 from styles import get_all_styles
-from chart_utils import (
-    create_bar_chart, create_pie_chart, create_line_chart,
-    create_scatter_chart, create_sparkline, create_bubble_chart
-)
-
-# Import analytics
-from analytics.insights import JobMarketAnalytics
-from config import TEAM_MEMBERS, PLOTLY_CONFIG, CACHE_TTL
+# chart_utils (plotly) and analytics.insights are imported where they are
+# used, so a cold start only pays for them once a page needs them
+from config import TEAM_MEMBERS, PLOTLY_CONFIG, CACHE_TTL, MAX_PIE_SLICES, MAX_CHART_BARS
 
 # Suppress warnings
 warnings.filterwarnings('ignore', category=FutureWarning)
@@ -46,65 +50,185 @@ st.set_page_config(
 init_theme()
 
 # Apply custom styles
-st.markdown(get_all_styles(), unsafe_allow_html=True)
+@st.cache_data
+def page_styles(theme):
+    """Page CSS for the given theme, built once per theme"""
+    return get_all_styles()
+
+
+st.markdown(page_styles(get_theme()), unsafe_allow_html=True)
 
 # Plotly configuration
 # PLOTLY_CONFIG imported from config
 
 
+# Static sidebar blocks, themed through the CSS variables from get_all_styles()
+ABOUT_HTML = """
+        <div style="background: var(--card-secondary); padding: 1rem; border-radius: 8px; font-size: 0.85rem;">
+            <p style="margin: 0 0 0.5rem 0; color: var(--text-tertiary);">
+                <strong>DBMS Course Project</strong>
+            </p>
+            <p style="margin: 0; color: var(--text-tertiary);">
+                Last Updated: {last_updated}
+            </p>
+        </div>
+        """
+
+TEAM_HTML = "".join(f"""
+            <div style="margin-bottom: 0.75rem;">
+                <div style="font-weight: 600; color: var(--text-primary);">{member['icon']} {member['name']}</div>
+                <div style="font-size: 0.8rem; color: var(--text-tertiary); margin-top: 0.25rem;">{member['role']}</div>
+            </div>
+            """ for member in TEAM_MEMBERS)
+
+
 # Cache functions
 @st.cache_resource
 def get_analytics():
     """Initialize analytics instance"""
+    from analytics.insights import JobMarketAnalytics
     return JobMarketAnalytics()
 
 
-@st.cache_data(ttl=CACHE_TTL)
+# Second cache tier on disk, in the analytics layer's cache directory, so a
+# restarted worker reads recent results instead of re-running the queries
+def _parquet_cache_dir():
+    """The analytics cache directory, so invalidate_cache() clears these files too"""
+    # Taken from analytics.insights (after config.settings has read .env), not
+    # the environment at import time
+    from analytics.insights import CACHE_DIR
+    return CACHE_DIR
+
+
+def _prune_parquet_cache(cache_dir):
+    """Delete Parquet results older than CACHE_TTL (one-off searches are never read again)"""
+    now = time.time()
+    for cache_file in cache_dir.glob('*.parquet'):
+        try:
+            if now - cache_file.stat().st_mtime > CACHE_TTL:
+                cache_file.unlink(missing_ok=True)
+        except OSError:
+            pass
+
+
+def parquet_cached(fn):
+    """Keep fn's Arrow table results on disk as Parquet for CACHE_TTL seconds"""
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        cache_dir = _parquet_cache_dir()
+        key = hashlib.blake2b(f"{fn.__name__}{args}{kwargs}".encode()).hexdigest()
+        path = cache_dir / f"{key}.parquet"
+        try:
+            if time.time() - path.stat().st_mtime <= CACHE_TTL:
+                return pq.read_table(path)
+        except OSError:
+            pass
+        
+        # A miss: drop this and any other expired results before writing
+        _prune_parquet_cache(cache_dir)
+        table = fn(*args, **kwargs)
+        try:
+            cache_dir.mkdir(exist_ok=True)
+            # Write then rename so other workers never read a partial file
+            tmp_path = path.with_name(f"{key}.{os.getpid()}.tmp")
+            pq.write_table(table, tmp_path)
+            tmp_path.replace(path)
+        except OSError:
+            pass
+        return table
+    return wrapper
+
+
+# Low-cardinality label columns, held as categoricals (dictionary-encoded in
+# the Arrow tables) so filters and Plotly's color grouping work per category
+CATEGORY_COLUMNS = ('skill_category', 'city', 'state', 'experience_level')
+
+
+def categorized(df):
+    """df with its CATEGORY_COLUMNS converted to categoricals"""
+    return df.astype({col: 'category' for col in CATEGORY_COLUMNS if col in df.columns})
+
+
+# Read-only results are cached as shared resources: every rerun gets the same
+# object back, with no pickling or copying on a cache hit. Callers must not
+# mutate them. The overview's counts and DataFrames are only read, and the
+# Arrow tables returned by the other loaders are immutable; convert with .to_pandas() only where a
+# chart or a row-wise card layout needs a DataFrame. st.dataframe takes the
+# tables as-is.
+@st.cache_resource(ttl=CACHE_TTL)
 def load_market_overview():
+    """Overview counts plus each section as a ready-built DataFrame"""
     analytics = get_analytics()
-    return analytics.generate_market_overview()
+    counts, frames = analytics.get_market_overview_frames()
+    return {**counts, **{section: categorized(df) for section, df in frames.items()}}
 
 
-@st.cache_data(ttl=CACHE_TTL)
-def load_top_skills(limit=20):
+@st.cache_resource(ttl=CACHE_TTL, max_entries=64)
+@parquet_cached
+def load_top_skills(limit=20, search=None):
     analytics = get_analytics()
-    return analytics.get_top_skills(limit)
+    return pa.Table.from_pandas(categorized(analytics.get_top_skills(limit, search)), preserve_index=False)
 
 
-@st.cache_data(ttl=CACHE_TTL)
-def load_top_companies(limit=20):
+@st.cache_resource(ttl=CACHE_TTL, max_entries=64)
+@parquet_cached
+def load_top_companies(limit=20, search=None):
     analytics = get_analytics()
-    return analytics.get_top_hiring_companies(limit)
+    return pa.Table.from_pandas(analytics.get_top_hiring_companies(limit, search), preserve_index=False)
 
 
-@st.cache_data(ttl=CACHE_TTL)
+@st.cache_resource(ttl=CACHE_TTL, max_entries=64)
+@parquet_cached
 def load_jobs_by_city():
     analytics = get_analytics()
-    return analytics.get_jobs_by_city()
+    return pa.Table.from_pandas(categorized(analytics.get_jobs_by_city()), preserve_index=False)
 
 
-@st.cache_data(ttl=CACHE_TTL)
+@st.cache_resource(ttl=CACHE_TTL, max_entries=64)
+@parquet_cached
 def load_skill_cooccurrence(min_count=10, limit=50):
     analytics = get_analytics()
-    return analytics.get_skill_cooccurrence(min_count, limit)
+    return pa.Table.from_pandas(analytics.get_skill_cooccurrence(min_count, limit), preserve_index=False)
 
 
-@st.cache_data(ttl=CACHE_TTL)
+@st.cache_resource(ttl=CACHE_TTL, max_entries=64)
+@parquet_cached
 def load_experience_distribution():
     analytics = get_analytics()
-    return analytics.get_experience_distribution()
+    return pa.Table.from_pandas(categorized(analytics.get_experience_distribution()), preserve_index=False)
 
 
-@st.cache_data(ttl=CACHE_TTL)
-def load_top_skills_by_city(city, limit=20):
-    analytics = get_analytics()
-    return analytics.get_top_skills_by_city(city, limit)
+# Shared-resource loaders, cleared individually so get_analytics() keeps its pool
+SHARED_LOADERS = (
+    load_market_overview, load_top_skills, load_top_companies,
+    load_jobs_by_city, load_skill_cooccurrence, load_experience_distribution,
+)
+
+
+# Largest "Top N" the per-city sliders offer; one bundle per city covers every setting
+CITY_BUNDLE_LIMIT = 30
 
 
 @st.cache_data(ttl=CACHE_TTL)
-def load_companies_by_city(city, limit=20):
+def load_city_bundle(city):
+    """Top skills and companies for a city, fetched concurrently into one cache entry"""
     analytics = get_analytics()
-    return analytics.get_companies_by_city(city, limit)
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        skills = executor.submit(analytics.get_top_skills_by_city, city, CITY_BUNDLE_LIMIT)
+        companies = executor.submit(analytics.get_companies_by_city, city, CITY_BUNDLE_LIMIT)
+        return {'skills': categorized(skills.result()), 'companies': companies.result()}
+
+
+def cities_with_jobs(table):
+    """Rows of the jobs-by-city table for cities that have at least one job"""
+    return table.filter(pc.greater(table['job_count'], 0))
+
+
+def grid_rows(df, cols_per_row):
+    """Rows of df as namedtuples, in chunks of cols_per_row for a card grid"""
+    rows = df.itertuples(index=False)
+    while chunk := list(islice(rows, cols_per_row)):
+        yield chunk
 
 
 def main():
@@ -129,8 +253,7 @@ def main():
         st.markdown("---")
         
         # Theme toggle
-        if theme_toggle():
-            st.rerun()
+        theme_toggle()
         
         st.markdown("---")
         
@@ -151,6 +274,10 @@ def main():
         st.markdown("### Quick Actions")
         if st.button("🔄 Refresh Data", use_container_width=True):
             st.cache_data.clear()
+            for loader in SHARED_LOADERS:
+                loader.clear()
+            # Also drops the analytics query cache and the Parquet files
+            get_analytics().invalidate_cache()
             st.rerun()
         
         if st.button("📥 Export Data", use_container_width=True):
@@ -160,29 +287,15 @@ def main():
         
         # Project info
         st.markdown("### About")
-        st.markdown(f"""
-        <div style="background: var(--card-secondary); padding: 1rem; border-radius: 8px; font-size: 0.85rem;">
-            <p style="margin: 0 0 0.5rem 0; color: {colors['text_tertiary']};">
-                <strong>DBMS Course Project</strong>
-            </p>
-            <p style="margin: 0; color: {colors['text_tertiary']};">
-                Last Updated: {datetime.now().strftime("%Y-%m-%d %H:%M")}
-            </p>
-        </div>
-        """, unsafe_allow_html=True)
+        if 'last_updated' not in st.session_state:
+            st.session_state.last_updated = datetime.now().strftime("%Y-%m-%d %H:%M")
+        st.markdown(ABOUT_HTML.format(last_updated=st.session_state.last_updated), unsafe_allow_html=True)
         
         st.markdown("---")
         
         # Team
         st.markdown("### Team")
-        
-        for member in TEAM_MEMBERS:
-            st.markdown(f"""
-            <div style="margin-bottom: 0.75rem;">
-                <div style="font-weight: 600; color: {colors['text_primary']};">{member['icon']} {member['name']}</div>
-                <div style="font-size: 0.8rem; color: {colors['text_tertiary']}; margin-top: 0.25rem;">{member['role']}</div>
-            </div>
-            """, unsafe_allow_html=True)
+        st.markdown(TEAM_HTML, unsafe_allow_html=True)
     
     # Route to appropriate page
     if page == "Dashboard":
@@ -199,6 +312,8 @@ def main():
 
 def show_dashboard():
     """Dashboard/Overview Page - Modern card-based layout"""
+    from chart_utils import create_bar_chart, create_pie_chart
+    
     colors = get_theme_colors()
     
     # Hero Section
@@ -238,7 +353,7 @@ def show_dashboard():
         
         with col1:
             st.markdown("### 🔥 Top Skills in Demand")
-            top_skills_df = pd.DataFrame(overview['top_10_skills'])
+            top_skills_df = overview['top_10_skills']
             
             if not top_skills_df.empty:
                 fig = create_bar_chart(
@@ -253,16 +368,17 @@ def show_dashboard():
                 
                 # Show top 5 as badges
                 st.markdown("**Most Popular:**")
-                badges_html = ""
-                for _, row in top_skills_df.head(5).iterrows():
-                    badges_html += skill_badge(row['skill_name'], row['job_count'], row['skill_category'])
-                st.markdown(badges_html, unsafe_allow_html=True)
+                top5 = top_skills_df.head(5)
+                st.markdown(
+                    skill_badges(top5['skill_name'], top5['job_count'], top5['skill_category']),
+                    unsafe_allow_html=True
+                )
             else:
                 empty_state("No skills data available", "📊")
         
         with col2:
             st.markdown("### 🏆 Top Hiring Companies")
-            top_companies_df = pd.DataFrame(overview['top_10_companies'])
+            top_companies_df = overview['top_10_companies']
             
             if not top_companies_df.empty:
                 fig = create_bar_chart(
@@ -276,15 +392,21 @@ def show_dashboard():
                 
                 # Show top companies as mini cards
                 st.markdown("**Top Recruiters:**")
-                for _, row in top_companies_df.head(3).iterrows():
-                    with st.container():
-                        st.markdown(f"""
+                top3 = top_companies_df.head(3)
+                recruiters_html = (
+                    f"""
                         <div style="background: var(--card-secondary); padding: 0.75rem; border-radius: 8px; 
                                     margin-bottom: 0.5rem; display: flex; justify-content: space-between; align-items: center;">
-                            <span style="font-weight: 600; color: {colors['text_primary']};">{row['company_name']}</span>
-                            <span style="color: {colors['accent_primary']}; font-weight: 700;">{row['job_count']} jobs</span>
+                            <span style="font-weight: 600; color: {colors['text_primary']};">"""
+                    + top3['company_name'].astype(str)
+                    + f"""</span>
+                            <span style="color: {colors['accent_primary']}; font-weight: 700;">"""
+                    + top3['job_count'].astype(str)
+                    + """ jobs</span>
                         </div>
-                        """, unsafe_allow_html=True)
+                        """
+                ).str.cat()
+                st.markdown(recruiters_html, unsafe_allow_html=True)
             else:
                 empty_state("No company data available", "🏢")
         
@@ -295,7 +417,7 @@ def show_dashboard():
         
         with col1:
             st.markdown("### 📍 Geographic Distribution")
-            jobs_by_city_df = pd.DataFrame(overview['jobs_by_city'])
+            jobs_by_city_df = overview['jobs_by_city']
             jobs_by_city_df = jobs_by_city_df[jobs_by_city_df['job_count'] > 0]
             
             if not jobs_by_city_df.empty:
@@ -304,7 +426,8 @@ def show_dashboard():
                     values='job_count',
                     names='city',
                     hole=0.5,
-                    height=400
+                    height=400,
+                    max_slices=MAX_PIE_SLICES
                 )
                 st.plotly_chart(fig, use_container_width=True, config=PLOTLY_CONFIG)
             else:
@@ -312,7 +435,7 @@ def show_dashboard():
         
         with col2:
             st.markdown("### 👨‍💼 Experience Level Breakdown")
-            exp_dist_df = pd.DataFrame(overview['experience_distribution'])
+            exp_dist_df = overview['experience_distribution']
             
             if not exp_dist_df.empty:
                 fig = create_pie_chart(
@@ -326,20 +449,25 @@ def show_dashboard():
                 
                 # Experience stats
                 st.markdown("**Job Distribution:**")
-                for _, row in exp_dist_df.iterrows():
-                    percentage = (row['job_count'] / overview['total_jobs'] * 100) if overview['total_jobs'] > 0 else 0
-                    st.markdown(f"""
+                total_jobs = overview['total_jobs']
+                percentage = exp_dist_df['job_count'] * (100.0 / total_jobs if total_jobs > 0 else 0.0)
+                template = f"""
                     <div style="margin: 0.5rem 0;">
                         <div style="display: flex; justify-content: space-between; margin-bottom: 0.25rem;">
-                            <span style="color: {colors['text_secondary']};">{row['experience_level']}</span>
-                            <span style="color: {colors['accent_primary']}; font-weight: 600;">{percentage:.1f}%</span>
+                            <span style="color: {colors['text_secondary']};">{{experience_level}}</span>
+                            <span style="color: {colors['accent_primary']}; font-weight: 600;">{{percentage:.1f}}%</span>
                         </div>
                         <div style="background: {colors['card_secondary']}; height: 6px; border-radius: 3px; overflow: hidden;">
                             <div style="background: linear-gradient(90deg, {colors['accent_primary']}, {colors['accent_secondary']}); 
-                                        height: 100%; width: {percentage}%;"></div>
+                                        height: 100%; width: {{percentage}}%;"></div>
                         </div>
                     </div>
-                    """, unsafe_allow_html=True)
+                    """
+                rows = pd.DataFrame({'experience_level': exp_dist_df['experience_level'], 'percentage': percentage})
+                st.markdown(
+                    "\n".join(template.format(**row) for row in rows.to_dict('records')),
+                    unsafe_allow_html=True
+                )
             else:
                 empty_state("No experience data", "💼")
         
@@ -374,171 +502,190 @@ def show_skills_analysis():
     tab1, tab2, tab3 = st.tabs(["📊 Overall Demand", "🌍 By Location", "🔗 Co-occurrence"])
     
     with tab1:
-        col1, col2 = st.columns([3, 1])
-        with col1:
-            st.markdown("### Most In-Demand Skills")
-        with col2:
-            num_skills = st.slider("Top", 10, 50, 20, 5, label_visibility="collapsed")
-        
-        try:
-            with st.spinner("Loading skills..."):
-                skills_df = load_top_skills(num_skills)
-            
-            if not skills_df.empty:
-                # Filter by search
-                if search_query:
-                    skills_df = skills_df[skills_df['skill_name'].str.contains(search_query, case=False, na=False)]
-                
-                if skills_df.empty:
-                    empty_state(f"No skills found matching '{search_query}'", "🔍")
-                else:
-                    if view_mode == "Chart":
-                        fig = create_bar_chart(
-                            skills_df,
-                            x='job_count',
-                            y='skill_name',
-                            color='skill_category',
-                            orientation='h',
-                            height=600
-                        )
-                        st.plotly_chart(fig, use_container_width=True, config=PLOTLY_CONFIG)
-                    
-                    elif view_mode == "Cards":
-                        # Show as cards
-                        cols_per_row = 3
-                        for i in range(0, len(skills_df), cols_per_row):
-                            cols = st.columns(cols_per_row)
-                            for j, col in enumerate(cols):
-                                if i + j < len(skills_df):
-                                    row = skills_df.iloc[i + j]
-                                    with col:
-                                        stat_card(
-                                            row['skill_name'],
-                                            {
-                                                "Job Count": row['job_count'],
-                                                "Category": row['skill_category'],
-                                                "Percentage": f"{row['percentage']:.1f}%"
-                                            }
-                                        )
-                    
-                    else:  # List view
-                        st.dataframe(
-                            skills_df[['skill_name', 'skill_category', 'job_count', 'percentage']],
-                            use_container_width=True,
-                            hide_index=True
-                        )
-                    
-                    # Download button
-                    st.markdown("<br>", unsafe_allow_html=True)
-                    csv = skills_df.to_csv(index=False).encode('utf-8')
-                    st.download_button(
-                        "📥 Download CSV",
-                        csv,
-                        f"top_skills_{datetime.now().strftime('%Y%m%d')}.csv",
-                        "text/csv",
-                        key='download-skills'
-                    )
-            else:
-                empty_state("No skills data available", "📊")
-        
-        except Exception as e:
-            st.error(f"Error: {str(e)}")
+        _render_skills_overall(search_query, view_mode)
     
     with tab2:
-        st.markdown("### Skills by Location")
-        
-        try:
-            cities_df = load_jobs_by_city()
-            cities = cities_df[cities_df['job_count'] > 0]['city'].tolist()
-            
-            if cities:
-                col1, col2 = st.columns([2, 1])
-                with col1:
-                    selected_city = st.selectbox("Select City", cities, key="city_skills_select")
-                with col2:
-                    num_skills_city = st.slider("Top Skills", 10, 30, 15, 5, key="city_skills_slider")
-                
-                with st.spinner("Loading city skills..."):
-                    city_skills_df = load_top_skills_by_city(selected_city, num_skills_city)
-                
-                if not city_skills_df.empty:
-                    fig = create_bar_chart(
-                        city_skills_df,
-                        x='job_count',
-                        y='skill_name',
-                        orientation='h',
-                        height=500
-                    )
-                    st.plotly_chart(fig, use_container_width=True, config=PLOTLY_CONFIG)
-                    
-                    # Show top 10 as badges
-                    st.markdown(f"**Top Skills in {selected_city}:**")
-                    badges_html = ""
-                    for _, row in city_skills_df.head(10).iterrows():
-                        badges_html += skill_badge(row['skill_name'], row['job_count'])
-                    st.markdown(badges_html, unsafe_allow_html=True)
-                else:
-                    empty_state(f"No skill data for {selected_city}", "📍")
-            else:
-                empty_state("No city data available", "🌍")
-        
-        except Exception as e:
-            st.error(f"Error: {str(e)}")
+        _render_skills_by_city()
     
     with tab3:
-        st.markdown("### Skill Co-occurrence Analysis")
-        st.caption("Skills frequently requested together in job postings")
-        
-        col1, col2 = st.columns(2)
-        with col1:
-            min_count = st.number_input("Minimum occurrences", 5, 50, 10, 5)
-        with col2:
-            limit = st.number_input("Number of pairs", 10, 100, 30, 10)
+        _render_skill_cooccurrence()
+
+
+@st.fragment
+def _render_skills_overall(search_query, view_mode):
+    """Overall skill demand tab; a fragment so its slider only reruns this tab"""
+    from chart_utils import create_bar_chart
+    
+    col1, col2 = st.columns([3, 1])
+    with col1:
+        st.markdown("### Most In-Demand Skills")
+    with col2:
+        num_skills = st.slider("Top", 10, 50, 20, 5, label_visibility="collapsed")
+    
+    try:
+        with st.spinner("Loading skills..."):
+            # The search is applied in SQL, so matches outside the overall top N still show up
+            skills_table = load_top_skills(num_skills, search_query or None)
         
-        try:
-            with st.spinner("Analyzing skill pairs..."):
-                cooccurrence_df = load_skill_cooccurrence(min_count, limit)
+        if skills_table.num_rows == 0:
+            if search_query:
+                empty_state(f"No skills found matching '{search_query}'", "🔍")
+            else:
+                empty_state("No skills data available", "📊")
+        else:
+            skills_df = skills_table.to_pandas()
             
-            if not cooccurrence_df.empty:
-                cooccurrence_df['skill_pair'] = cooccurrence_df['skill_1'] + ' + ' + cooccurrence_df['skill_2']
-                
+            if view_mode == "Chart":
                 fig = create_bar_chart(
-                    cooccurrence_df,
-                    x='co_occurrence_count',
-                    y='skill_pair',
+                    skills_df,
+                    x='job_count',
+                    y='skill_name',
+                    color='skill_category',
                     orientation='h',
                     height=600
                 )
                 st.plotly_chart(fig, use_container_width=True, config=PLOTLY_CONFIG)
-                
+            
+            elif view_mode == "Cards":
                 # Show as cards
-                st.markdown("**Common Skill Combinations:**")
-                cols_per_row = 2
-                for i in range(0, min(6, len(cooccurrence_df)), cols_per_row):
+                cols_per_row = 3
+                for chunk in grid_rows(skills_df, cols_per_row):
                     cols = st.columns(cols_per_row)
-                    for j, col in enumerate(cols):
-                        if i + j < len(cooccurrence_df):
-                            row = cooccurrence_df.iloc[i + j]
-                            with col:
-                                st.markdown(f"""
-                                <div class="modern-card">
-                                    <div style="display: flex; justify-content: space-between; align-items: center;">
-                                        <div>
-                                            <span class="badge badge-primary">{row['skill_1']}</span>
-                                            <span style="margin: 0 0.5rem; color: {colors['text_tertiary']};">+</span>
-                                            <span class="badge badge-info">{row['skill_2']}</span>
-                                        </div>
-                                        <div style="font-size: 1.5rem; font-weight: 700; color: {colors['accent_primary']};">
-                                            {row['co_occurrence_count']}
-                                        </div>
-                                    </div>
-                                </div>
-                                """, unsafe_allow_html=True)
+                    for col, row in zip(cols, chunk):
+                        with col:
+                            stat_card(
+                                row.skill_name,
+                                {
+                                    "Job Count": row.job_count,
+                                    "Category": row.skill_category,
+                                    "Percentage": f"{row.percentage:.1f}%"
+                                }
+                            )
+            
+            else:  # List view
+                st.dataframe(
+                    skills_table.select(['skill_name', 'skill_category', 'job_count', 'percentage']),
+                    use_container_width=True,
+                    hide_index=True
+                )
+            
+            # Download button
+            st.markdown("<br>", unsafe_allow_html=True)
+            # Built only when the button is clicked, not on every rerun
+            st.download_button(
+                "📥 Download CSV",
+                lambda: skills_df.to_csv(index=False),
+                f"top_skills_{datetime.now().strftime('%Y%m%d')}.csv",
+                "text/csv",
+                key='download-skills'
+            )
+    
+    except Exception as e:
+        st.error(f"Error: {str(e)}")
+
+
+@st.fragment
+def _render_skills_by_city():
+    """Skills by location tab; a fragment so its widgets only rerun this tab"""
+    from chart_utils import create_bar_chart
+    
+    st.markdown("### Skills by Location")
+    
+    try:
+        cities = cities_with_jobs(load_jobs_by_city())['city'].to_pylist()
+        
+        if cities:
+            col1, col2 = st.columns([2, 1])
+            with col1:
+                selected_city = st.selectbox("Select City", cities, key="city_skills_select")
+            with col2:
+                num_skills_city = st.slider("Top Skills", 10, CITY_BUNDLE_LIMIT, 15, 5, key="city_skills_slider")
+            
+            with st.spinner("Loading city skills..."):
+                city_skills_df = load_city_bundle(selected_city)['skills'].head(num_skills_city)
+            
+            if not city_skills_df.empty:
+                fig = create_bar_chart(
+                    city_skills_df,
+                    x='job_count',
+                    y='skill_name',
+                    orientation='h',
+                    height=500
+                )
+                st.plotly_chart(fig, use_container_width=True, config=PLOTLY_CONFIG)
+                
+                # Show top 10 as badges
+                st.markdown(f"**Top Skills in {selected_city}:**")
+                top10 = city_skills_df.head(10)
+                st.markdown(skill_badges(top10['skill_name'], top10['job_count']), unsafe_allow_html=True)
             else:
-                empty_state("No co-occurrence data with current filters", "🔗")
+                empty_state(f"No skill data for {selected_city}", "📍")
+        else:
+            empty_state("No city data available", "🌍")
+    
+    except Exception as e:
+        st.error(f"Error: {str(e)}")
+
+
+@st.fragment
+def _render_skill_cooccurrence():
+    """Skill co-occurrence tab; a fragment so its inputs only rerun this tab"""
+    from chart_utils import create_bar_chart
+    
+    colors = get_theme_colors()
+    
+    st.markdown("### Skill Co-occurrence Analysis")
+    st.caption("Skills frequently requested together in job postings")
+    
+    col1, col2 = st.columns(2)
+    with col1:
+        min_count = st.number_input("Minimum occurrences", 5, 50, 10, 5)
+    with col2:
+        limit = st.number_input("Number of pairs", 10, 100, 30, 10)
+    
+    try:
+        with st.spinner("Analyzing skill pairs..."):
+            cooccurrence_table = load_skill_cooccurrence(min_count, limit)
         
-        except Exception as e:
-            st.error(f"Error: {str(e)}")
+        if cooccurrence_table.num_rows > 0:
+            cooccurrence_df = cooccurrence_table.to_pandas()
+            
+            fig = create_bar_chart(
+                cooccurrence_df,
+                x='co_occurrence_count',
+                y='skill_pair',
+                orientation='h',
+                height=600,
+                max_bars=MAX_CHART_BARS
+            )
+            st.plotly_chart(fig, use_container_width=True, config=PLOTLY_CONFIG)
+            
+            # Show as cards
+            st.markdown("**Common Skill Combinations:**")
+            cols_per_row = 2
+            for chunk in grid_rows(cooccurrence_df.head(6), cols_per_row):
+                cols = st.columns(cols_per_row)
+                for col, row in zip(cols, chunk):
+                    with col:
+                        st.markdown(f"""
+                        <div class="modern-card">
+                            <div style="display: flex; justify-content: space-between; align-items: center;">
+                                <div>
+                                    <span class="badge badge-primary">{row.skill_1}</span>
+                                    <span style="margin: 0 0.5rem; color: {colors['text_tertiary']};">+</span>
+                                    <span class="badge badge-info">{row.skill_2}</span>
+                                </div>
+                                <div style="font-size: 1.5rem; font-weight: 700; color: {colors['accent_primary']};">
+                                    {row.co_occurrence_count}
+                                </div>
+                            </div>
+                        </div>
+                        """, unsafe_allow_html=True)
+        else:
+            empty_state("No co-occurrence data with current filters", "🔗")
+    
+    except Exception as e:
+        st.error(f"Error: {str(e)}")
 
 
 def show_company_insights():
@@ -563,112 +710,124 @@ def show_company_insights():
     tab1, tab2 = st.tabs(["🏆 Top Companies", "🌍 By Location"])
     
     with tab1:
-        col1, col2 = st.columns([3, 1])
-        with col1:
-            st.markdown("### Top Hiring Companies")
-        with col2:
-            num_companies = st.slider("Show", 10, 50, 20, 5, label_visibility="collapsed")
+        _render_top_companies(search_query)
+    
+    with tab2:
+        _render_companies_by_city()
+
+
+@st.fragment
+def _render_top_companies(search_query):
+    """Top companies tab; a fragment so its slider only reruns this tab"""
+    from chart_utils import create_bar_chart
+    
+    col1, col2 = st.columns([3, 1])
+    with col1:
+        st.markdown("### Top Hiring Companies")
+    with col2:
+        num_companies = st.slider("Show", 10, 50, 20, 5, label_visibility="collapsed")
+    
+    try:
+        with st.spinner("Loading companies..."):
+            # The search is applied in SQL, so matches outside the overall top N still show up
+            companies_table = load_top_companies(num_companies, search_query or None)
         
-        try:
-            with st.spinner("Loading companies..."):
-                companies_df = load_top_companies(num_companies)
-            
-            if not companies_df.empty:
-                # Filter by search
-                if search_query:
-                    companies_df = companies_df[companies_df['company_name'].str.contains(search_query, case=False, na=False)]
-                
-                if companies_df.empty:
-                    empty_state(f"No companies found matching '{search_query}'", "🔍")
-                else:
-                    # Show chart
-                    fig = create_bar_chart(
-                        companies_df,
-                        x='job_count',
-                        y='company_name',
-                        orientation='h',
-                        height=600
-                    )
-                    st.plotly_chart(fig, use_container_width=True, config=PLOTLY_CONFIG)
-                    
-                    # Show as company cards
-                    st.markdown("### Company Profiles")
-                    cols_per_row = 3
-                    for i in range(0, min(12, len(companies_df)), cols_per_row):
-                        cols = st.columns(cols_per_row)
-                        for j, col in enumerate(cols):
-                            if i + j < len(companies_df):
-                                row = companies_df.iloc[i + j]
-                                with col:
-                                    company_card(
-                                        row['company_name'],
-                                        row['job_count'],
-                                        None  # We don't have locations in this view
-                                    )
-                    
-                    # Download
-                    st.markdown("<br>", unsafe_allow_html=True)
-                    csv = companies_df.to_csv(index=False).encode('utf-8')
-                    st.download_button(
-                        "📥 Download CSV",
-                        csv,
-                        f"top_companies_{datetime.now().strftime('%Y%m%d')}.csv",
-                        "text/csv"
-                    )
+        if companies_table.num_rows == 0:
+            if search_query:
+                empty_state(f"No companies found matching '{search_query}'", "🔍")
             else:
                 empty_state("No company data available", "🏢")
-        
-        except Exception as e:
-            st.error(f"Error: {str(e)}")
+        else:
+            companies_df = companies_table.to_pandas()
+            
+            # Show chart
+            fig = create_bar_chart(
+                companies_df,
+                x='job_count',
+                y='company_name',
+                orientation='h',
+                height=600
+            )
+            st.plotly_chart(fig, use_container_width=True, config=PLOTLY_CONFIG)
+            
+            # Show as company cards
+            st.markdown("### Company Profiles")
+            cols_per_row = 3
+            for chunk in grid_rows(companies_df.head(12), cols_per_row):
+                cols = st.columns(cols_per_row)
+                for col, row in zip(cols, chunk):
+                    with col:
+                        company_card(
+                            row.company_name,
+                            row.job_count,
+                            None  # We don't have locations in this view
+                        )
+            
+            # Download
+            st.markdown("<br>", unsafe_allow_html=True)
+            # Built only when the button is clicked, not on every rerun
+            st.download_button(
+                "📥 Download CSV",
+                lambda: companies_df.to_csv(index=False),
+                f"top_companies_{datetime.now().strftime('%Y%m%d')}.csv",
+                "text/csv"
+            )
     
-    with tab2:
-        st.markdown("### Companies by City")
+    except Exception as e:
+        st.error(f"Error: {str(e)}")
+
+
+@st.fragment
+def _render_companies_by_city():
+    """Companies by city tab; a fragment so its widgets only rerun this tab"""
+    from chart_utils import create_bar_chart
+    
+    st.markdown("### Companies by City")
+    
+    try:
+        cities = cities_with_jobs(load_jobs_by_city())['city'].to_pylist()
         
-        try:
-            cities_df = load_jobs_by_city()
-            cities = cities_df[cities_df['job_count'] > 0]['city'].tolist()
+        if cities:
+            col1, col2 = st.columns([2, 1])
+            with col1:
+                selected_city = st.selectbox("Select City", cities, key="company_city")
+            with col2:
+                num_companies_city = st.slider("Top Companies", 10, CITY_BUNDLE_LIMIT, 15, 5, key="city_companies")
             
-            if cities:
-                col1, col2 = st.columns([2, 1])
-                with col1:
-                    selected_city = st.selectbox("Select City", cities, key="company_city")
-                with col2:
-                    num_companies_city = st.slider("Top Companies", 10, 30, 15, 5, key="city_companies")
-                
-                with st.spinner("Loading city companies..."):
-                    city_companies_df = load_companies_by_city(selected_city, num_companies_city)
+            with st.spinner("Loading city companies..."):
+                city_companies_df = load_city_bundle(selected_city)['companies'].head(num_companies_city)
+            
+            if not city_companies_df.empty:
+                fig = create_bar_chart(
+                    city_companies_df,
+                    x='job_count',
+                    y='company_name',
+                    orientation='h',
+                    height=500
+                )
+                st.plotly_chart(fig, use_container_width=True, config=PLOTLY_CONFIG)
                 
-                if not city_companies_df.empty:
-                    fig = create_bar_chart(
-                        city_companies_df,
-                        x='job_count',
-                        y='company_name',
-                        orientation='h',
-                        height=500
-                    )
-                    st.plotly_chart(fig, use_container_width=True, config=PLOTLY_CONFIG)
-                    
-                    # Show as cards
-                    st.markdown(f"**Top Recruiters in {selected_city}:**")
-                    cols_per_row = 3
-                    for i in range(0, min(9, len(city_companies_df)), cols_per_row):
-                        cols = st.columns(cols_per_row)
-                        for j, col in enumerate(cols):
-                            if i + j < len(city_companies_df):
-                                row = city_companies_df.iloc[i + j]
-                                with col:
-                                    company_card(row['company_name'], row['job_count'])
-                else:
-                    empty_state(f"No company data for {selected_city}", "📍")
+                # Show as cards
+                st.markdown(f"**Top Recruiters in {selected_city}:**")
+                cols_per_row = 3
+                for chunk in grid_rows(city_companies_df.head(9), cols_per_row):
+                    cols = st.columns(cols_per_row)
+                    for col, row in zip(cols, chunk):
+                        with col:
+                            company_card(row.company_name, row.job_count)
             else:
-                empty_state("No city data available", "🌍")
-        
-        except Exception as e:
-            st.error(f"Error: {str(e)}")
+                empty_state(f"No company data for {selected_city}", "📍")
+        else:
+            empty_state("No city data available", "🌍")
+    
+    except Exception as e:
+        st.error(f"Error: {str(e)}")
 
 
 def show_location_analysis():
     """Location Analysis Page - Interactive comparison"""
+    from chart_utils import create_bar_chart, create_pie_chart
+    
     colors = get_theme_colors()
     
     breadcrumb(["Home", "Location Analysis"])
@@ -682,26 +841,23 @@ def show_location_analysis():
     
     try:
         with st.spinner("Loading location data..."):
-            locations_df = load_jobs_by_city()
-            locations_df = locations_df[locations_df['job_count'] > 0]
+            locations_df = cities_with_jobs(load_jobs_by_city()).to_pandas()
         
         if not locations_df.empty:
             # City cards at top
             st.markdown("### City Overview")
             cols_per_row = 4
-            for i in range(0, len(locations_df), cols_per_row):
+            for chunk in grid_rows(locations_df, cols_per_row):
                 cols = st.columns(cols_per_row)
-                for j, col in enumerate(cols):
-                    if i + j < len(locations_df):
-                        row = locations_df.iloc[i + j]
-                        with col:
-                            stat_card(
-                                f"📍 {row['city']}",
-                                {
-                                    "Jobs": f"{row['job_count']:,}",
-                                    "Companies": f"{row['company_count']:,}",
-                                }
-                            )
+                for col, row in zip(cols, chunk):
+                    with col:
+                        stat_card(
+                            f"📍 {row.city}",
+                            {
+                                "Jobs": f"{row.job_count:,}",
+                                "Companies": f"{row.company_count:,}",
+                            }
+                        )
             
             st.markdown("<br>", unsafe_allow_html=True)
             
@@ -714,7 +870,8 @@ def show_location_analysis():
                     locations_df,
                     x='city',
                     y='job_count',
-                    height=400
+                    height=400,
+                    max_bars=MAX_CHART_BARS
                 )
                 st.plotly_chart(fig, use_container_width=True, config=PLOTLY_CONFIG)
             
@@ -725,35 +882,13 @@ def show_location_analysis():
                     values='job_count',
                     names='city',
                     hole=0.5,
-                    height=400
+                    height=400,
+                    max_slices=MAX_PIE_SLICES
                 )
                 st.plotly_chart(fig, use_container_width=True, config=PLOTLY_CONFIG)
             
             # City comparison
-            st.markdown("<br>", unsafe_allow_html=True)
-            st.markdown("### 🔄 Compare Cities")
-            
-            selected_cities = st.multiselect(
-                "Select cities to compare",
-                locations_df['city'].tolist(),
-                default=locations_df['city'].tolist()[:min(3, len(locations_df))],
-                key="city_comparison"
-            )
-            
-            if selected_cities:
-                comparison_df = locations_df[locations_df['city'].isin(selected_cities)]
-                
-                # Side-by-side comparison cards
-                cols = st.columns(len(selected_cities))
-                for idx, city in enumerate(selected_cities):
-                    city_data = comparison_df[comparison_df['city'] == city].iloc[0]
-                    with cols[idx]:
-                        progress_card(
-                            city,
-                            city_data['job_count'],
-                            locations_df['job_count'].max(),
-                            f"{city_data['company_count']} companies"
-                        )
+            _render_city_comparison(locations_df)
             
         else:
             empty_state("No location data available", "🗺️")
@@ -762,6 +897,35 @@ def show_location_analysis():
         st.error(f"Error: {str(e)}")
 
 
+@st.fragment
+def _render_city_comparison(locations_df):
+    """City comparison; a fragment so changing the selection only reruns this section"""
+    st.markdown("<br>", unsafe_allow_html=True)
+    st.markdown("### 🔄 Compare Cities")
+    
+    selected_cities = st.multiselect(
+        "Select cities to compare",
+        locations_df['city'].tolist(),
+        default=locations_df['city'].tolist()[:min(3, len(locations_df))],
+        key="city_comparison"
+    )
+    
+    if selected_cities:
+        comparison_df = locations_df[locations_df['city'].isin(selected_cities)]
+        
+        # Side-by-side comparison cards
+        cols = st.columns(len(selected_cities))
+        for idx, city in enumerate(selected_cities):
+            city_data = comparison_df[comparison_df['city'] == city].iloc[0]
+            with cols[idx]:
+                progress_card(
+                    city,
+                    city_data['job_count'],
+                    locations_df['job_count'].max(),
+                    f"{city_data['company_count']} companies"
+                )
+
+
 def show_job_explorer():
     """Job Explorer - Browse individual job postings (placeholder)"""
     colors = get_theme_colors()
@@ -829,21 +993,12 @@ def show_job_explorer():
         },
     ]
     
-    cols_per_row = 2
-    for i in range(0, len(sample_jobs), cols_per_row):
-        cols = st.columns(cols_per_row)
-        for j, col in enumerate(cols):
-            if i + j < len(sample_jobs):
-                job = sample_jobs[i + j]
-                with col:
-                    job_card(
-                        job["title"],
-                        job["company"],
-                        job["location"],
-                        job["salary"],
-                        job["skills"],
-                        job["posted"]
-                    )
+    # The whole grid goes out as one element instead of a column layout per row
+    cards_html = "".join(
+        job_card_html(job["title"], job["company"], job["location"], job["salary"], job["skills"], job["posted"])
+        for job in sample_jobs
+    )
+    st.markdown(f'<div class="grid-2">{cards_html}</div>', unsafe_allow_html=True)
 
 
 if __name__ == "__main__":
@@ -4,19 +4,19 @@ Modern, professional UI/UX with comprehensive features
 """
 
 import sys
+import hashlib
 from pathlib import Path
 sys.path.append(str(Path(__file__).parent.parent))
 
 import streamlit as st
 import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
+import numpy as np
 from datetime import datetime
 import warnings
 
-# Import analytics and database
-from analytics.insights import JobMarketAnalytics
-from database.db_operations import JobDatabase
+# plotly (and chart_utils), analytics.insights and database.db_operations are
+# imported where they are used, so a cold start only pays for them once a
+# page needs them
 
 # Import theme system
 from theme import (
@@ -52,6 +52,10 @@ if 'theme_mode' not in st.session_state:
 if 'current_page' not in st.session_state:
     st.session_state.current_page = 'Overview'
 
+# Stamped once per session so the sidebar markup is identical across reruns
+if 'session_started' not in st.session_state:
+    st.session_state.session_started = datetime.now().strftime('%Y-%m-%d %H:%M')
+
 # ============================================================================
 # THEME FUNCTIONS
 # ============================================================================
@@ -59,40 +63,46 @@ if 'current_page' not in st.session_state:
 def toggle_theme():
     """Toggle between light and dark theme"""
     st.session_state.theme_mode = 'dark' if st.session_state.theme_mode == 'light' else 'light'
-    st.rerun()
+
+def set_page(page_key):
+    """Switch to another page"""
+    st.session_state.current_page = page_key
 
 def get_current_theme():
     """Get current theme colors"""
     return get_theme(st.session_state.theme_mode)
 
-def apply_theme_styles():
-    """Apply theme-specific CSS styles"""
-    theme = get_current_theme()
-    tokens = create_design_tokens(st.session_state.theme_mode)
-    
-    # Load external CSS
+@st.cache_resource
+def _load_css_file():
+    """Read styles_v2.css once per process"""
     css_path = Path(__file__).parent / "styles_v2.css"
     try:
         if css_path.exists():
             with open(css_path, 'r', encoding='utf-8') as f:
-                css_content = f.read()
-        else:
-            css_content = ""
+                return f.read()
+        return ""
     except Exception as e:
         st.warning(f"Could not load CSS file: {e}")
-        css_content = ""
+        return ""
+
+@st.cache_resource
+def _build_theme_css(mode: str) -> str:
+    """Full <style> block (CSS variables + stylesheet) for a theme mode"""
+    tokens = create_design_tokens(mode)
     
     # Generate CSS variables
-    css_vars = ":root {\n"
-    for key, value in tokens.items():
-        css_vars += f"    {key}: {value};\n"
-    css_vars += "}\n\n"
+    body = "\n".join(f"    {key}: {value};" for key, value in tokens.items())
+    css_vars = f":root {{\n{body}\n}}\n\n"
     
+    return f"<style>{css_vars}{_load_css_file()}</style>"
+
+def apply_theme_styles():
+    """Apply theme-specific CSS styles"""
     # Add theme data attribute
     theme_attr = f'<div data-theme="{st.session_state.theme_mode}"></div>'
     
     # Combine all styles
-    st.markdown(f"<style>{css_vars}{css_content}</style>{theme_attr}", unsafe_allow_html=True)
+    st.markdown(_build_theme_css(st.session_state.theme_mode) + theme_attr, unsafe_allow_html=True)
 
 # ============================================================================
 # DATA LOADING FUNCTIONS
@@ -101,63 +111,168 @@ def apply_theme_styles():
 @st.cache_resource
 def get_analytics():
     """Initialize analytics instance"""
+    from analytics.insights import JobMarketAnalytics
     return JobMarketAnalytics()
 
 @st.cache_resource
 def get_database():
     """Initialize database instance"""
+    from database.db_operations import JobDatabase
     return JobDatabase()
 
-@st.cache_data(ttl=CACHE_TTL)
-def load_market_overview():
+# Loaders whose results are only read are cached as shared resources: every
+# rerun gets the same object back, with no pickling or copying on a hit.
+# Callers must not mutate them (copy first if a column has to be added).
+@st.cache_resource(ttl=CACHE_TTL, show_spinner=False)
+def load_overview_bundle():
+    """
+    Market overview and data quality stats for the Overview page
+    
+    Both are fetched at once on separate pooled connections, so a cold load
+    waits for the slower of the two rather than their sum. The overview is
+    its counts plus its sections as Arrow-backed DataFrames, in one dict.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+    
     analytics = get_analytics()
-    return analytics.generate_market_overview()
-
-@st.cache_data(ttl=CACHE_TTL)
-def load_data_quality():
-    """Load data quality statistics"""
     db = get_database()
-    return db.get_data_quality_stats()
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        overview = executor.submit(analytics.get_market_overview_frames)
+        quality = executor.submit(db.get_data_quality_stats)
+        counts, frames = overview.result()
+        return {**counts, **frames}, quality.result()
 
-@st.cache_data(ttl=CACHE_TTL)
+@st.cache_resource(ttl=CACHE_TTL, show_spinner=False)
 def load_top_skills(limit=20):
     analytics = get_analytics()
     return analytics.get_top_skills(limit)
 
-@st.cache_data(ttl=CACHE_TTL)
+@st.cache_resource(ttl=CACHE_TTL, show_spinner=False)
 def load_top_companies(limit=20):
     analytics = get_analytics()
     return analytics.get_top_hiring_companies(limit)
 
-@st.cache_data(ttl=CACHE_TTL)
-def load_jobs_by_city():
-    analytics = get_analytics()
-    return analytics.get_jobs_by_city()
-
-@st.cache_data(ttl=CACHE_TTL)
+@st.cache_resource(ttl=CACHE_TTL, show_spinner=False)
 def load_skill_cooccurrence(min_count=10, limit=50):
     analytics = get_analytics()
     return analytics.get_skill_cooccurrence(min_count, limit)
 
-@st.cache_data(ttl=CACHE_TTL)
+@st.cache_resource(ttl=CACHE_TTL, show_spinner=False)
+def load_jobs_by_city_filtered():
+    """Jobs by city, leaving out unnamed cities and cities with no jobs (filtered in SQL)"""
+    analytics = get_analytics()
+    return analytics.get_active_jobs_by_city()
+
+@st.cache_resource(ttl=CACHE_TTL, show_spinner=False)
+def load_city_names():
+    """Cities with at least one job, busiest first"""
+    return tuple(load_jobs_by_city_filtered()['city'])
+
+@st.cache_resource(ttl=CACHE_TTL, show_spinner=False)
+def load_salary_counts():
+    """Total jobs and jobs with salary information, as a (total, with_salary) pair"""
+    analytics = get_analytics()
+    return analytics.get_total_jobs(), analytics.get_jobs_with_salary()
+
+def format_lakhs(values):
+    """Format amounts as '₹X.YL' strings ('N/A' when missing) without a per-row loop"""
+    amounts = pd.to_numeric(values, errors='coerce').to_numpy(dtype=float, na_value=np.nan)
+    return np.where(np.isnan(amounts), "N/A", np.char.mod("₹%.1fL", amounts / 100000)).astype(object)
+
+# Not persisted: these expire after CACHE_TTL together with the
+# shared-resource loaders they are shown next to
+@st.cache_data(ttl=CACHE_TTL, show_spinner=False, max_entries=64)
+def load_salary_by_skill(min_jobs=5, limit=20):
+    """Average salary per skill, with formatted display columns"""
+    analytics = get_analytics()
+    df = analytics.get_salary_by_skill(min_jobs=min_jobs, limit=limit)
+    df['avg_min_display'] = format_lakhs(df['avg_min_salary'])
+    df['avg_max_display'] = format_lakhs(df['avg_max_salary'])
+    return df
+
+@st.cache_data(ttl=CACHE_TTL, show_spinner=False, max_entries=64)
+def load_salary_by_city():
+    """Average salary per city, with formatted display columns"""
+    analytics = get_analytics()
+    df = analytics.get_salary_by_city()
+    df['avg_min_display'] = format_lakhs(df['avg_min_salary'])
+    df['avg_max_display'] = format_lakhs(df['avg_max_salary'])
+    return df
+
+@st.cache_resource(ttl=CACHE_TTL, show_spinner=False)
 def load_experience_distribution():
     analytics = get_analytics()
     return analytics.get_experience_distribution()
 
-@st.cache_data(ttl=CACHE_TTL)
-def load_top_skills_by_city(city, limit=20):
+def _csv_bytes(df):
+    """Encode a DataFrame as CSV with Arrow's C++ writer, falling back to pandas"""
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+    
+    try:
+        table = pa.Table.from_pandas(df, preserve_index=False)
+    except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+        return df.to_csv(index=False).encode('utf-8')
+    
+    sink = pa.BufferOutputStream()
+    pacsv.write_csv(table, sink)
+    return sink.getvalue().to_pybytes()
+
+@st.cache_data(ttl=CACHE_TTL, show_spinner=False, max_entries=64)
+def skills_csv(limit):
+    """CSV download of load_top_skills(limit), encoded once per limit"""
+    return _csv_bytes(load_top_skills(limit))
+
+@st.cache_data(ttl=CACHE_TTL, show_spinner=False, max_entries=64)
+def companies_csv(limit):
+    """CSV download of load_top_companies(limit), encoded once per limit"""
+    return _csv_bytes(load_top_companies(limit))
+
+# Largest "Number of ..." the per-city sliders offer; one load covers every setting
+CITY_TOP_N = 30
+
+@st.cache_resource(ttl=CACHE_TTL, show_spinner=False)
+def load_top_skills_for_cities(cities, limit=CITY_TOP_N):
+    """Top skills of every city in one query, as a {city: DataFrame} dict"""
     analytics = get_analytics()
-    return analytics.get_top_skills_by_city(city, limit)
+    df = analytics.get_top_skills_for_cities(list(cities), limit)
+    return dict(iter(df.groupby('city', sort=False, observed=True)))
 
-@st.cache_data(ttl=CACHE_TTL)
-def load_companies_by_city(city, limit=20):
+@st.cache_resource(ttl=CACHE_TTL, show_spinner=False)
+def load_companies_for_cities(cities, limit=CITY_TOP_N):
+    """Top hiring companies of every city in one query, as a {city: DataFrame} dict"""
     analytics = get_analytics()
-    return analytics.get_companies_by_city(city, limit)
+    df = analytics.get_companies_for_cities(list(cities), limit)
+    return dict(iter(df.groupby('city', sort=False, observed=True)))
+
+# Shared-resource loaders, cleared individually so get_analytics() and
+# get_database() keep their connection pools
+SHARED_LOADERS = (
+    load_overview_bundle, load_top_skills, load_top_companies, load_jobs_by_city_filtered,
+    load_city_names, load_salary_counts, load_skill_cooccurrence, load_experience_distribution,
+    load_top_skills_for_cities, load_companies_for_cities,
+)
 
 # ============================================================================
 # UI COMPONENTS
 # ============================================================================
 
+# Count columns are typed up front so the grid doesn't infer each one's format
+COUNT_COLUMN_CONFIG = {
+    col: st.column_config.NumberColumn(format="%d")
+    for col in ('job_count', 'company_count', 'cities_hiring_in', 'co_occurrence_count', 'Jobs')
+}
+
+def render_table(df):
+    """Show a table in a grid sized to its rows, scrolling (virtualized) past max_table_height"""
+    st.dataframe(
+        df,
+        width='stretch',
+        hide_index=True,
+        height=min(UI_CONFIG['max_table_height'], 35 * (len(df) + 1) + 3),
+        column_config=COUNT_COLUMN_CONFIG
+    )
+
 def render_header():
     """Render modern dashboard header"""
     theme = get_current_theme()
@@ -173,102 +288,158 @@ def render_header():
     """
     st.markdown(header_html, unsafe_allow_html=True)
 
-def render_metric_card(label, value, icon="📊", delta=None, delta_color="success"):
-    """Render a modern metric card"""
-    theme = get_current_theme()
-    
+def metric_card_html(label, value, icon="📊", delta=None, delta_color="success"):
+    """HTML for a modern metric card"""
     delta_html = ""
     if delta:
         delta_class = "positive" if delta_color == "success" else "negative"
         delta_html = f'<div class="metric-delta {delta_class}">{delta}</div>'
     
-    card_html = f"""
-    <div class="metric-card">
-        <div class="metric-label">{icon} {label}</div>
-        <div class="metric-value">{value}</div>
-        {delta_html}
-    </div>
-    """
-    st.markdown(card_html, unsafe_allow_html=True)
+    # No blank or indented lines, so Markdown keeps a row of cards as one HTML block
+    return (
+        '<div class="metric-card">'
+        f'<div class="metric-label">{icon} {label}</div>'
+        f'<div class="metric-value">{value}</div>'
+        f'{delta_html}'
+        '</div>'
+    )
+
+def render_metric_card(label, value, icon="📊", delta=None, delta_color="success"):
+    """Render a modern metric card"""
+    st.markdown(metric_card_html(label, value, icon, delta, delta_color), unsafe_allow_html=True)
+
+def render_metric_cards(cards):
+    """Render a row of metric cards (dicts of render_metric_card arguments) in one element"""
+    cards_html = "".join(metric_card_html(**card) for card in cards)
+    st.markdown(f'<div class="metric-grid">{cards_html}</div>', unsafe_allow_html=True)
+
+# Sidebar content that never changes, built once at import
+PAGES = (
+    ("🏠 Overview", "Overview"),
+    ("🎯 Skills Analysis", "Skills"),
+    ("🏢 Company Insights", "Companies"),
+    ("📍 Location Analysis", "Locations"),
+    ("📈 Experience Trends", "Experience"),
+    ("💰 Salary Analysis", "Salary"),
+)
+
+# Theme button label per current theme mode (it offers the other mode)
+THEME_BUTTON_LABELS = {'light': "🌙 Dark Mode", 'dark': "☀️ Light Mode"}
+
+PROJECT_INFO_MARKDOWN = "### 📋 Project Info\n\n**DBMS Course Project**\n\n**Updated:** {updated}"
+
+TEAM_MARKDOWN = "\n\n".join(
+    f"{member['icon']} **{member['name']}**  \n*{member['role']}*" for member in TEAM_MEMBERS
+)
 
 def render_sidebar():
     """Render modern sidebar with navigation"""
     with st.sidebar:
-        # Theme toggle button
-        theme_icon = "🌙" if st.session_state.theme_mode == 'light' else "☀️"
-        theme_label = "Dark Mode" if st.session_state.theme_mode == 'light' else "Light Mode"
+        # Buttons act through on_click callbacks, which Streamlit runs before
+        # the rerun a click triggers, so styles and page reflect the new state
+        # without a second st.rerun()
         
-        if st.button(f"{theme_icon} {theme_label}", use_container_width=True):
-            toggle_theme()
+        # Theme toggle button
+        st.button(THEME_BUTTON_LABELS[st.session_state.theme_mode], width='stretch',
+                  on_click=toggle_theme)
         
         st.markdown("---")
         
         # Navigation
         st.markdown("### 📊 Navigation")
         
-        pages = [
-            ("🏠 Overview", "Overview"),
-            ("🎯 Skills Analysis", "Skills"),
-            ("🏢 Company Insights", "Companies"),
-            ("📍 Location Analysis", "Locations"),
-            ("📈 Experience Trends", "Experience"),
-            ("💰 Salary Analysis", "Salary"),
-        ]
-        
-        for icon_label, page_key in pages:
-            if st.button(icon_label, use_container_width=True, 
-                        type="primary" if st.session_state.current_page == page_key else "secondary"):
-                st.session_state.current_page = page_key
-                st.rerun()
+        for icon_label, page_key in PAGES:
+            st.button(icon_label, width='stretch', 
+                      type="primary" if st.session_state.current_page == page_key else "secondary",
+                      on_click=set_page, args=(page_key,))
         
         st.markdown("---")
         
-        # Data refresh
-        if st.button("🔄 Refresh Data", use_container_width=True):
+        # Data refresh; the sidebar renders before the page, so the page
+        # below already loads fresh data in this run
+        if st.button("🔄 Refresh Data", width='stretch'):
             st.cache_data.clear()
-            st.success("Data refreshed!")
-            st.rerun()
+            for loader in SHARED_LOADERS:
+                loader.clear()
+            get_analytics().invalidate_cache()
+            st.toast("Data refreshed!")
         
         st.markdown("---")
         
         # Project info
-        st.markdown("### 📋 Project Info")
-        st.markdown("**DBMS Course Project**")
-        st.markdown(f"**Updated:** {datetime.now().strftime('%Y-%m-%d %H:%M')}")
+        st.markdown(PROJECT_INFO_MARKDOWN.format(updated=st.session_state.session_started))
         
         if UI_CONFIG['show_team_info']:
             st.markdown("---")
             st.markdown("### 👥 Team")
-            for member in TEAM_MEMBERS:
-                st.markdown(f"{member['icon']} **{member['name']}**  \n*{member['role']}*")
+            st.markdown(TEAM_MARKDOWN)
 
-def create_modern_chart(data, chart_type, **kwargs):
-    """Create a modern styled chart"""
-    theme = get_current_theme()
-    
-    # Common layout settings
-    layout_args = {
-        'template': 'plotly_white' if st.session_state.theme_mode == 'light' else 'plotly_dark',
+# Common chart layout settings per theme mode, built once at import
+_LAYOUTS = {
+    mode: {
+        'template': 'plotly_white' if mode == 'light' else 'plotly_dark',
         'font': {'family': TYPOGRAPHY['font_family']['sans']},
-        'paper_bgcolor': theme['background']['paper'],
-        'plot_bgcolor': theme['background']['paper'],
+        'paper_bgcolor': get_theme(mode)['background']['paper'],
+        'plot_bgcolor': get_theme(mode)['background']['paper'],
         'margin': dict(l=20, r=20, t=40, b=20),
     }
+    for mode in ('light', 'dark')
+}
+
+@st.cache_resource(max_entries=64)
+def _build_figure(chart_type, data_key, kwargs_key, theme_mode, _data, _kwargs):
+    """Build a styled chart once per (chart type, data, arguments, theme)"""
+    import plotly.express as px
     
-    if chart_type == 'bar':
-        fig = px.bar(data, **kwargs)
+    if chart_type == 'bar' and _kwargs.get('orientation') == 'h':
+        # Plotly draws the first row at the bottom, so ranked horizontal bars
+        # are sorted ascending here, once per cached figure, and the order is
+        # pinned (also across color groups) rather than sorted in the browser
+        _data = _data.sort_values(_kwargs['x'], kind='stable')
+        fig = px.bar(_data, **{'category_orders': {_kwargs['y']: list(_data[_kwargs['y']])}, **_kwargs})
+    elif chart_type == 'bar':
+        fig = px.bar(_data, **_kwargs)
     elif chart_type == 'pie':
-        fig = px.pie(data, **kwargs)
+        fig = px.pie(_data, **_kwargs)
+        fig.update_traces(textposition='inside', textinfo='percent+label')
     elif chart_type == 'line':
-        fig = px.line(data, **kwargs)
+        # WebGL (scattergl) traces stay fast with thousands of points, where SVG bogs down
+        fig = px.line(_data, **{'render_mode': 'webgl', **_kwargs})
     elif chart_type == 'scatter':
-        fig = px.scatter(data, **kwargs)
+        fig = px.scatter(_data, **{'render_mode': 'webgl', **_kwargs})
     else:
-        fig = px.bar(data, **kwargs)
+        fig = px.bar(_data, **_kwargs)
     
-    fig.update_layout(**layout_args)
+    # While the data is unchanged, Plotly.react keeps the user's zoom, pan
+    # and legend selection across reruns instead of resetting the view
+    fig.update_layout(**_LAYOUTS[theme_mode], uirevision=data_key)
     return fig
 
+def create_modern_chart(data, chart_type, **kwargs):
+    """Create a modern styled chart"""
+    from chart_utils import top_bars, fold_small_slices
+    
+    # Only send the browser what the chart can show: the top bars of long
+    # rankings, and small pie slices folded into "Other"
+    if chart_type == 'bar':
+        values = kwargs['x'] if kwargs.get('orientation') == 'h' else kwargs['y']
+        data = top_bars(data, values, UI_CONFIG['max_chart_bars'])
+    elif chart_type == 'pie':
+        data = fold_small_slices(data, kwargs['values'], kwargs['names'], UI_CONFIG['max_pie_slices'])
+    
+    # Hashing the rows is far cheaper than px grouping and validating them again
+    data_key = hashlib.blake2b(
+        pd.util.hash_pandas_object(data, index=True).values.tobytes()
+        + repr(list(data.columns)).encode()
+    ).hexdigest()
+    kwargs_key = repr(sorted(kwargs.items()))
+    
+    # The cached figure itself is handed out, template and all, rather than a
+    # deep copy per render: callers pass sizing as px arguments (height=...)
+    # and must not mutate it. Pages show it with a stable st.plotly_chart
+    # key, so a rerun updates the same chart element in place
+    return _build_figure(chart_type, data_key, kwargs_key, st.session_state.theme_mode, data, kwargs)
+
 # ============================================================================
 # PAGE VIEWS
 # ============================================================================
@@ -280,8 +451,7 @@ def show_overview():
     
     try:
         with st.spinner("Loading market data..."):
-            overview = load_market_overview()
-            quality_stats = load_data_quality()
+            overview, quality_stats = load_overview_bundle()
         
         # Data quality warning
         if quality_stats['location_coverage'] < 100:
@@ -294,34 +464,22 @@ def show_overview():
         
         # Key metrics in cards
         st.markdown("### 🎯 Key Metrics")
-        col1, col2, col3, col4 = st.columns(4)
-        
-        with col1:
-            render_metric_card("Total Jobs", f"{overview['total_jobs']:,}", "💼")
-        
-        with col2:
-            render_metric_card("Companies Hiring", f"{overview['total_companies']:,}", "🏢")
-        
-        with col3:
-            render_metric_card("Unique Skills", f"{overview['total_skills']:,}", "🎯")
-        
-        with col4:
-            render_metric_card("Cities Covered", f"{overview['total_cities']:,}", "📍")
+        render_metric_cards([
+            {'label': "Total Jobs", 'value': f"{overview['total_jobs']:,}", 'icon': "💼"},
+            {'label': "Companies Hiring", 'value': f"{overview['total_companies']:,}", 'icon': "🏢"},
+            {'label': "Unique Skills", 'value': f"{overview['total_skills']:,}", 'icon': "🎯"},
+            {'label': "Cities Covered", 'value': f"{overview['total_cities']:,}", 'icon': "📍"},
+        ])
         
         st.markdown("---")
         
         # Data coverage metrics
         st.markdown("### 📈 Data Coverage")
-        col1, col2, col3 = st.columns(3)
-        
-        with col1:
-            render_metric_card("Location Data", f"{quality_stats['location_coverage']:.1f}%", "📍")
-        
-        with col2:
-            render_metric_card("Salary Data", f"{quality_stats['salary_coverage']:.1f}%", "💰")
-        
-        with col3:
-            render_metric_card("Description Data", f"{quality_stats['description_coverage']:.1f}%", "📝")
+        render_metric_cards([
+            {'label': "Location Data", 'value': f"{quality_stats['location_coverage']:.1f}%", 'icon': "📍"},
+            {'label': "Salary Data", 'value': f"{quality_stats['salary_coverage']:.1f}%", 'icon': "💰"},
+            {'label': "Description Data", 'value': f"{quality_stats['description_coverage']:.1f}%", 'icon': "📝"},
+        ])
         
         st.markdown("---")
         
@@ -333,7 +491,7 @@ def show_overview():
         with col1:
             st.markdown('<div class="modern-card">', unsafe_allow_html=True)
             st.markdown("#### 🎯 Top 10 In-Demand Skills")
-            top_skills_df = pd.DataFrame(overview['top_10_skills'])
+            top_skills_df = overview['top_10_skills']
             
             if not top_skills_df.empty:
                 fig = create_modern_chart(
@@ -343,10 +501,10 @@ def show_overview():
                     y='skill_name',
                     orientation='h',
                     color='skill_category',
-                    labels={'job_count': 'Job Count', 'skill_name': 'Skill'}
+                    labels={'job_count': 'Job Count', 'skill_name': 'Skill'},
+                    height=400
                 )
-                fig.update_layout(height=400, yaxis={'categoryorder': 'total ascending'})
-                st.plotly_chart(fig, use_container_width=True, config=PLOTLY_CONFIG)
+                st.plotly_chart(fig, use_container_width=True, config=PLOTLY_CONFIG, key="overview_top_skills")
             else:
                 st.info("No skills data available")
             st.markdown('</div>', unsafe_allow_html=True)
@@ -354,7 +512,7 @@ def show_overview():
         with col2:
             st.markdown('<div class="modern-card">', unsafe_allow_html=True)
             st.markdown("#### 🏢 Top 10 Hiring Companies")
-            top_companies_df = pd.DataFrame(overview['top_10_companies'])
+            top_companies_df = overview['top_10_companies']
             
             if not top_companies_df.empty:
                 fig = create_modern_chart(
@@ -363,10 +521,10 @@ def show_overview():
                     x='job_count',
                     y='company_name',
                     orientation='h',
-                    labels={'job_count': 'Job Count', 'company_name': 'Company'}
+                    labels={'job_count': 'Job Count', 'company_name': 'Company'},
+                    height=400
                 )
-                fig.update_layout(height=400, yaxis={'categoryorder': 'total ascending'})
-                st.plotly_chart(fig, use_container_width=True, config=PLOTLY_CONFIG)
+                st.plotly_chart(fig, use_container_width=True, config=PLOTLY_CONFIG, key="overview_top_companies")
             else:
                 st.info("No company data available")
             st.markdown('</div>', unsafe_allow_html=True)
@@ -378,12 +536,7 @@ def show_overview():
         with col1:
             st.markdown('<div class="modern-card">', unsafe_allow_html=True)
             st.markdown("#### 📍 Job Distribution by City")
-            jobs_by_city_df = pd.DataFrame(overview['jobs_by_city'])
-            jobs_by_city_df = jobs_by_city_df[
-                (jobs_by_city_df['city'].notna()) & 
-                (jobs_by_city_df['city'] != '') & 
-                (jobs_by_city_df['job_count'] > 0)
-            ]
+            jobs_by_city_df = load_jobs_by_city_filtered()
             
             if not jobs_by_city_df.empty:
                 fig = create_modern_chart(
@@ -393,8 +546,7 @@ def show_overview():
                     names='city',
                     hole=0.4
                 )
-                fig.update_traces(textposition='inside', textinfo='percent+label')
-                st.plotly_chart(fig, use_container_width=True, config=PLOTLY_CONFIG)
+                st.plotly_chart(fig, use_container_width=True, config=PLOTLY_CONFIG, key="overview_city_share")
             else:
                 st.info("No location data available")
             st.markdown('</div>', unsafe_allow_html=True)
@@ -402,7 +554,7 @@ def show_overview():
         with col2:
             st.markdown('<div class="modern-card">', unsafe_allow_html=True)
             st.markdown("#### 📈 Experience Level Distribution")
-            exp_dist_df = pd.DataFrame(overview['experience_distribution'])
+            exp_dist_df = overview['experience_distribution']
             
             if not exp_dist_df.empty:
                 fig = create_modern_chart(
@@ -412,8 +564,7 @@ def show_overview():
                     names='experience_level',
                     hole=0.4
                 )
-                fig.update_traces(textposition='inside', textinfo='percent+label')
-                st.plotly_chart(fig, use_container_width=True, config=PLOTLY_CONFIG)
+                st.plotly_chart(fig, use_container_width=True, config=PLOTLY_CONFIG, key="overview_experience")
             else:
                 st.info("No experience data available")
             st.markdown('</div>', unsafe_allow_html=True)
@@ -422,230 +573,281 @@ def show_overview():
         st.error(f"❌ Error loading data: {str(e)}")
         st.info("Ensure database is populated with job data.")
 
-def show_skills_analysis():
-    """Skills Analysis Page - Redesigned"""
-    st.markdown("## 🎯 Skills Analysis")
-    st.caption("Deep dive into skill demand across the job market")
+SKILLS_VIEWS = ["📊 Overall Demand", "📍 By Location", "🔗 Co-occurrence"]
+COMPANY_VIEWS = ["🏆 Top Companies", "📍 By Location"]
+
+@st.fragment
+def _render_skills_overall():
+    """Overall skill demand view; a fragment so its slider only reruns this view"""
+    st.markdown('<div class="modern-card">', unsafe_allow_html=True)
+    st.markdown("### 🎯 Most In-Demand Skills")
     
-    tab1, tab2, tab3 = st.tabs(["📊 Overall Demand", "📍 By Location", "🔗 Co-occurrence"])
+    num_skills = st.slider("Number of skills to display", 10, 50, 20, 5)
     
-    with tab1:
-        st.markdown('<div class="modern-card">', unsafe_allow_html=True)
-        st.markdown("### 🎯 Most In-Demand Skills")
+    try:
+        with st.spinner("Loading skills data..."):
+            skills_df = load_top_skills(num_skills)
         
-        num_skills = st.slider("Number of skills to display", 10, 50, 20, 5)
+        if not skills_df.empty:
+            fig = create_modern_chart(
+                skills_df,
+                'bar',
+                x='job_count',
+                y='skill_name',
+                orientation='h',
+                color='skill_category',
+                labels={'job_count': 'Job Count', 'skill_name': 'Skill'},
+                hover_data=['percentage'],
+                height=600
+            )
+            st.plotly_chart(fig, use_container_width=True, config=PLOTLY_CONFIG, key="skills_top")
+            
+            st.markdown("### 📋 Detailed Data")
+            render_table(skills_df)
+            
+            csv = skills_csv(num_skills)
+            st.download_button(
+                label="📥 Download CSV",
+                data=csv,
+                file_name=f"top_skills_{datetime.now().strftime('%Y%m%d')}.csv",
+                mime="text/csv"
+            )
+        else:
+            st.info("No skills data available")
+    
+    except Exception as e:
+        st.error(f"❌ Error: {str(e)}")
+    
+    st.markdown('</div>', unsafe_allow_html=True)
+
+@st.fragment
+def _render_skills_by_city():
+    """Skills by location view; a fragment so its widgets only rerun this view"""
+    st.markdown('<div class="modern-card">', unsafe_allow_html=True)
+    st.markdown("### 📍 Skills by City")
+    
+    try:
+        cities = load_city_names()
         
-        try:
-            with st.spinner("Loading skills data..."):
-                skills_df = load_top_skills(num_skills)
+        if cities:
+            selected_city = st.selectbox("Select City", cities)
+            num_skills_city = st.slider("Number of skills", 10, CITY_TOP_N, 15, 5, key="city_skills")
+            
+            with st.spinner("Loading skills data by city..."):
+                skills_by_city = load_top_skills_for_cities(cities)
+            city_skills_df = skills_by_city.get(selected_city, pd.DataFrame()).head(num_skills_city)
             
-            if not skills_df.empty:
+            if not city_skills_df.empty:
                 fig = create_modern_chart(
-                    skills_df,
+                    city_skills_df,
                     'bar',
                     x='job_count',
                     y='skill_name',
                     orientation='h',
-                    color='skill_category',
                     labels={'job_count': 'Job Count', 'skill_name': 'Skill'},
-                    hover_data=['percentage']
+                    height=500
                 )
-                fig.update_layout(height=600, yaxis={'categoryorder': 'total ascending'})
-                st.plotly_chart(fig, use_container_width=True, config=PLOTLY_CONFIG)
-                
-                st.markdown("### 📋 Detailed Data")
-                st.dataframe(skills_df, use_container_width=True, hide_index=True)
+                st.plotly_chart(fig, use_container_width=True, config=PLOTLY_CONFIG, key="skills_by_city")
                 
-                csv = skills_df.to_csv(index=False).encode('utf-8')
-                st.download_button(
-                    label="📥 Download CSV",
-                    data=csv,
-                    file_name=f"top_skills_{datetime.now().strftime('%Y%m%d')}.csv",
-                    mime="text/csv"
-                )
+                render_table(city_skills_df)
             else:
-                st.info("No skills data available")
-        
-        except Exception as e:
-            st.error(f"❌ Error: {str(e)}")
-        
-        st.markdown('</div>', unsafe_allow_html=True)
+                st.warning(f"No skills data for {selected_city}")
+        else:
+            st.warning("No city data available")
     
-    with tab2:
-        st.markdown('<div class="modern-card">', unsafe_allow_html=True)
-        st.markdown("### 📍 Skills by City")
+    except Exception as e:
+        st.error(f"❌ Error: {str(e)}")
+    
+    st.markdown('</div>', unsafe_allow_html=True)
+
+@st.fragment
+def _render_skill_cooccurrence():
+    """Skill co-occurrence view; a fragment so its inputs only rerun this view"""
+    st.markdown('<div class="modern-card">', unsafe_allow_html=True)
+    st.markdown("### 🔗 Skill Co-occurrence")
+    st.caption("Discover which skills are frequently requested together")
+    
+    col1, col2 = st.columns(2)
+    with col1:
+        min_count = st.number_input("Minimum occurrences", 5, 50, 10, 5)
+    with col2:
+        limit = st.number_input("Number of pairs", 10, 100, 30, 10)
+    
+    try:
+        with st.spinner("Analyzing skill combinations..."):
+            cooccurrence_df = load_skill_cooccurrence(min_count, limit)
         
-        try:
-            cities_df = load_jobs_by_city()
-            cities_df_filtered = cities_df[
-                (cities_df['city'].notna()) & 
-                (cities_df['city'] != '') & 
-                (cities_df['job_count'] > 0)
-            ]
-            cities = cities_df_filtered['city'].tolist()
+        if not cooccurrence_df.empty:
+            fig = create_modern_chart(
+                cooccurrence_df,
+                'bar',
+                x='co_occurrence_count',
+                y='skill_pair',
+                orientation='h',
+                labels={'co_occurrence_count': 'Job Count', 'skill_pair': 'Skill Pair'},
+                height=600
+            )
+            st.plotly_chart(fig, use_container_width=True, config=PLOTLY_CONFIG, key="skills_cooccurrence")
             
-            if cities:
-                selected_city = st.selectbox("Select City", cities)
-                num_skills_city = st.slider("Number of skills", 10, 30, 15, 5, key="city_skills")
-                
-                with st.spinner(f"Loading skills data for {selected_city}..."):
-                    city_skills_df = load_top_skills_by_city(selected_city, num_skills_city)
-                
-                if not city_skills_df.empty:
-                    fig = create_modern_chart(
-                        city_skills_df,
-                        'bar',
-                        x='job_count',
-                        y='skill_name',
-                        orientation='h',
-                        labels={'job_count': 'Job Count', 'skill_name': 'Skill'}
-                    )
-                    fig.update_layout(height=500, yaxis={'categoryorder': 'total ascending'})
-                    st.plotly_chart(fig, use_container_width=True, config=PLOTLY_CONFIG)
-                    
-                    st.dataframe(city_skills_df, use_container_width=True, hide_index=True)
-                else:
-                    st.warning(f"No skills data for {selected_city}")
-            else:
-                st.warning("No city data available")
-        
-        except Exception as e:
-            st.error(f"❌ Error: {str(e)}")
-        
-        st.markdown('</div>', unsafe_allow_html=True)
+            render_table(cooccurrence_df[['skill_1', 'skill_2', 'co_occurrence_count']])
+        else:
+            st.info("No co-occurrence data with current filters")
+    
+    except Exception as e:
+        st.error(f"❌ Error: {str(e)}")
     
-    with tab3:
-        st.markdown('<div class="modern-card">', unsafe_allow_html=True)
-        st.markdown("### 🔗 Skill Co-occurrence")
-        st.caption("Discover which skills are frequently requested together")
+    st.markdown('</div>', unsafe_allow_html=True)
+
+def show_skills_analysis():
+    """Skills Analysis Page - Redesigned"""
+    st.markdown("## 🎯 Skills Analysis")
+    st.caption("Deep dive into skill demand across the job market")
+    
+    # A radio rather than st.tabs: tabs run every body on each rerun, this
+    # only runs (and queries for) the view being looked at
+    view = st.radio("View", SKILLS_VIEWS, horizontal=True, key="skills_view",
+                    label_visibility="collapsed")
+    
+    if view == SKILLS_VIEWS[0]:
+        _render_skills_overall()
+    
+    elif view == SKILLS_VIEWS[1]:
+        _render_skills_by_city()
+    
+    elif view == SKILLS_VIEWS[2]:
+        _render_skill_cooccurrence()
+
+@st.fragment
+def _render_top_companies():
+    """Top companies view; a fragment so its slider only reruns this view"""
+    st.markdown('<div class="modern-card">', unsafe_allow_html=True)
+    st.markdown("### 🏆 Top Hiring Companies")
+    
+    num_companies = st.slider("Number of companies", 10, 50, 20, 5)
+    
+    try:
+        with st.spinner("Loading company data..."):
+            companies_df = load_top_companies(num_companies)
         
-        col1, col2 = st.columns(2)
-        with col1:
-            min_count = st.number_input("Minimum occurrences", 5, 50, 10, 5)
-        with col2:
-            limit = st.number_input("Number of pairs", 10, 100, 30, 10)
+        if not companies_df.empty:
+            fig = create_modern_chart(
+                companies_df,
+                'bar',
+                x='job_count',
+                y='company_name',
+                orientation='h',
+                color='cities_hiring_in',
+                labels={'job_count': 'Job Count', 'company_name': 'Company', 'cities_hiring_in': 'Cities'},
+                height=600
+            )
+            st.plotly_chart(fig, use_container_width=True, config=PLOTLY_CONFIG, key="companies_top")
+            
+            st.markdown("### 📋 Detailed Data")
+            render_table(companies_df)
+            
+            csv = companies_csv(num_companies)
+            st.download_button(
+                label="📥 Download CSV",
+                data=csv,
+                file_name=f"top_companies_{datetime.now().strftime('%Y%m%d')}.csv",
+                mime="text/csv"
+            )
+        else:
+            st.info("No company data available")
+    
+    except Exception as e:
+        st.error(f"❌ Error: {str(e)}")
+    
+    st.markdown('</div>', unsafe_allow_html=True)
+
+@st.fragment
+def _render_companies_by_city():
+    """Companies by city view; a fragment so its widgets only rerun this view"""
+    st.markdown('<div class="modern-card">', unsafe_allow_html=True)
+    st.markdown("### 📍 Companies by City")
+    
+    try:
+        cities = load_city_names()
         
-        try:
-            with st.spinner("Analyzing skill combinations..."):
-                cooccurrence_df = load_skill_cooccurrence(min_count, limit)
+        if cities:
+            selected_city = st.selectbox("Select City", cities, key="company_city")
+            num_companies_city = st.slider("Number of companies", 10, CITY_TOP_N, 15, 5, key="city_companies")
             
-            if not cooccurrence_df.empty:
-                cooccurrence_df['skill_pair'] = cooccurrence_df['skill_1'] + ' + ' + cooccurrence_df['skill_2']
-                
+            with st.spinner("Loading companies by city..."):
+                companies_by_city = load_companies_for_cities(cities)
+            city_companies_df = companies_by_city.get(selected_city, pd.DataFrame()).head(num_companies_city)
+            
+            if not city_companies_df.empty:
                 fig = create_modern_chart(
-                    cooccurrence_df,
+                    city_companies_df,
                     'bar',
-                    x='co_occurrence_count',
-                    y='skill_pair',
+                    x='job_count',
+                    y='company_name',
                     orientation='h',
-                    labels={'co_occurrence_count': 'Job Count', 'skill_pair': 'Skill Pair'}
+                    labels={'job_count': 'Job Count', 'company_name': 'Company'},
+                    height=500
                 )
-                fig.update_layout(height=600, yaxis={'categoryorder': 'total ascending'})
-                st.plotly_chart(fig, use_container_width=True, config=PLOTLY_CONFIG)
+                st.plotly_chart(fig, use_container_width=True, config=PLOTLY_CONFIG, key="companies_by_city")
                 
-                st.dataframe(
-                    cooccurrence_df[['skill_1', 'skill_2', 'co_occurrence_count']],
-                    use_container_width=True,
-                    hide_index=True
-                )
+                render_table(city_companies_df)
             else:
-                st.info("No co-occurrence data with current filters")
-        
-        except Exception as e:
-            st.error(f"❌ Error: {str(e)}")
-        
-        st.markdown('</div>', unsafe_allow_html=True)
+                st.warning(f"No company data for {selected_city}")
+        else:
+            st.warning("No city data available")
+    
+    except Exception as e:
+        st.error(f"❌ Error: {str(e)}")
+    
+    st.markdown('</div>', unsafe_allow_html=True)
 
 def show_company_insights():
     """Company Insights Page - Redesigned"""
     st.markdown("## 🏢 Company Insights")
     st.caption("Explore which companies are hiring and where")
     
-    tab1, tab2 = st.tabs(["🏆 Top Companies", "📍 By Location"])
+    view = st.radio("View", COMPANY_VIEWS, horizontal=True, key="company_view",
+                    label_visibility="collapsed")
     
-    with tab1:
-        st.markdown('<div class="modern-card">', unsafe_allow_html=True)
-        st.markdown("### 🏆 Top Hiring Companies")
-        
-        num_companies = st.slider("Number of companies", 10, 50, 20, 5)
-        
-        try:
-            with st.spinner("Loading company data..."):
-                companies_df = load_top_companies(num_companies)
-            
-            if not companies_df.empty:
-                fig = create_modern_chart(
-                    companies_df,
-                    'bar',
-                    x='job_count',
-                    y='company_name',
-                    orientation='h',
-                    color='cities_hiring_in',
-                    labels={'job_count': 'Job Count', 'company_name': 'Company', 'cities_hiring_in': 'Cities'}
-                )
-                fig.update_layout(height=600, yaxis={'categoryorder': 'total ascending'})
-                st.plotly_chart(fig, use_container_width=True, config=PLOTLY_CONFIG)
-                
-                st.markdown("### 📋 Detailed Data")
-                st.dataframe(companies_df, use_container_width=True, hide_index=True)
-                
-                csv = companies_df.to_csv(index=False).encode('utf-8')
-                st.download_button(
-                    label="📥 Download CSV",
-                    data=csv,
-                    file_name=f"top_companies_{datetime.now().strftime('%Y%m%d')}.csv",
-                    mime="text/csv"
-                )
-            else:
-                st.info("No company data available")
-        
-        except Exception as e:
-            st.error(f"❌ Error: {str(e)}")
-        
-        st.markdown('</div>', unsafe_allow_html=True)
+    if view == COMPANY_VIEWS[0]:
+        _render_top_companies()
     
-    with tab2:
-        st.markdown('<div class="modern-card">', unsafe_allow_html=True)
-        st.markdown("### 📍 Companies by City")
-        
-        try:
-            cities_df = load_jobs_by_city()
-            cities_df_filtered = cities_df[
-                (cities_df['city'].notna()) & 
-                (cities_df['city'] != '') & 
-                (cities_df['job_count'] > 0)
-            ]
-            cities = cities_df_filtered['city'].tolist()
-            
-            if cities:
-                selected_city = st.selectbox("Select City", cities, key="company_city")
-                num_companies_city = st.slider("Number of companies", 10, 30, 15, 5, key="city_companies")
-                
-                with st.spinner(f"Loading companies in {selected_city}..."):
-                    city_companies_df = load_companies_by_city(selected_city, num_companies_city)
-                
-                if not city_companies_df.empty:
-                    fig = create_modern_chart(
-                        city_companies_df,
-                        'bar',
-                        x='job_count',
-                        y='company_name',
-                        orientation='h',
-                        labels={'job_count': 'Job Count', 'company_name': 'Company'}
-                    )
-                    fig.update_layout(height=500, yaxis={'categoryorder': 'total ascending'})
-                    st.plotly_chart(fig, use_container_width=True, config=PLOTLY_CONFIG)
-                    
-                    st.dataframe(city_companies_df, use_container_width=True, hide_index=True)
-                else:
-                    st.warning(f"No company data for {selected_city}")
-            else:
-                st.warning("No city data available")
-        
-        except Exception as e:
-            st.error(f"❌ Error: {str(e)}")
+    elif view == COMPANY_VIEWS[1]:
+        _render_companies_by_city()
+
+@st.fragment
+def _render_city_comparison(locations_df):
+    """City comparison; a fragment so changing the selection only reruns this section"""
+    st.markdown('<div class="modern-card">', unsafe_allow_html=True)
+    st.markdown("### 🔄 City Comparison")
+    
+    cities = load_city_names()
+    selected_cities = st.multiselect(
+        "Select cities to compare",
+        cities,
+        default=cities[:3]
+    )
+    
+    if selected_cities:
+        comparison_df = (
+            locations_df.loc[locations_df['city'].isin(selected_cities), ['city', 'job_count', 'company_count']]
+            .rename(columns={'job_count': 'Jobs', 'company_count': 'Companies'})
+            .melt(id_vars='city', var_name='metric', value_name='count')
+        )
         
-        st.markdown('</div>', unsafe_allow_html=True)
+        # Built through the figure cache like every other chart, so picking
+        # back a selection seen before reuses its figure
+        fig = create_modern_chart(
+            comparison_df,
+            'bar',
+            x='city',
+            y='count',
+            color='metric',
+            barmode='group',
+            labels={'city': 'City', 'count': 'Count', 'metric': ''},
+            height=400
+        )
+        st.plotly_chart(fig, use_container_width=True, config=PLOTLY_CONFIG, key="locations_comparison")
+    st.markdown('</div>', unsafe_allow_html=True)
 
 def show_location_analysis():
     """Location Analysis Page - Redesigned"""
@@ -654,12 +856,7 @@ def show_location_analysis():
     
     try:
         with st.spinner("Loading location data..."):
-            locations_df = load_jobs_by_city()
-            locations_df = locations_df[
-                (locations_df['city'].notna()) & 
-                (locations_df['city'] != '') & 
-                (locations_df['job_count'] > 0)
-            ]
+            locations_df = load_jobs_by_city_filtered()
         
         if not locations_df.empty:
             col1, col2 = st.columns(2)
@@ -674,10 +871,10 @@ def show_location_analysis():
                     y='job_count',
                     labels={'job_count': 'Job Count', 'city': 'City'},
                     color='job_count',
-                    color_continuous_scale='Blues'
+                    color_continuous_scale='Blues',
+                    height=400
                 )
-                fig.update_layout(height=400)
-                st.plotly_chart(fig, use_container_width=True, config=PLOTLY_CONFIG)
+                st.plotly_chart(fig, use_container_width=True, config=PLOTLY_CONFIG, key="locations_jobs")
                 st.markdown('</div>', unsafe_allow_html=True)
             
             with col2:
@@ -690,44 +887,19 @@ def show_location_analysis():
                     names='city',
                     hole=0.4
                 )
-                fig.update_traces(textposition='inside', textinfo='percent+label')
-                st.plotly_chart(fig, use_container_width=True, config=PLOTLY_CONFIG)
+                st.plotly_chart(fig, use_container_width=True, config=PLOTLY_CONFIG, key="locations_share")
                 st.markdown('</div>', unsafe_allow_html=True)
             
             st.markdown("---")
             
             st.markdown('<div class="modern-card">', unsafe_allow_html=True)
             st.markdown("### 📋 Location Statistics")
-            st.dataframe(locations_df, use_container_width=True, hide_index=True)
+            render_table(locations_df)
             st.markdown('</div>', unsafe_allow_html=True)
             
             st.markdown("---")
             
-            st.markdown('<div class="modern-card">', unsafe_allow_html=True)
-            st.markdown("### 🔄 City Comparison")
-            
-            selected_cities = st.multiselect(
-                "Select cities to compare",
-                locations_df['city'].tolist(),
-                default=locations_df['city'].tolist()[:3]
-            )
-            
-            if selected_cities:
-                comparison_df = locations_df[locations_df['city'].isin(selected_cities)]
-                
-                fig = go.Figure(data=[
-                    go.Bar(name='Jobs', x=comparison_df['city'], y=comparison_df['job_count']),
-                    go.Bar(name='Companies', x=comparison_df['city'], y=comparison_df['company_count'])
-                ])
-                fig.update_layout(
-                    barmode='group',
-                    xaxis_title="City",
-                    yaxis_title="Count",
-                    height=400,
-                    template='plotly_white' if st.session_state.theme_mode == 'light' else 'plotly_dark'
-                )
-                st.plotly_chart(fig, use_container_width=True, config=PLOTLY_CONFIG)
-            st.markdown('</div>', unsafe_allow_html=True)
+            _render_city_comparison(locations_df)
         else:
             st.warning("No location data available")
     
@@ -756,8 +928,7 @@ def show_experience_analysis():
                     names='experience_level',
                     hole=0.4
                 )
-                fig.update_traces(textposition='inside', textinfo='percent+label')
-                st.plotly_chart(fig, use_container_width=True, config=PLOTLY_CONFIG)
+                st.plotly_chart(fig, use_container_width=True, config=PLOTLY_CONFIG, key="experience_share")
                 st.markdown('</div>', unsafe_allow_html=True)
             
             with col2:
@@ -772,14 +943,14 @@ def show_experience_analysis():
                     color='job_count',
                     color_continuous_scale='Viridis'
                 )
-                st.plotly_chart(fig, use_container_width=True, config=PLOTLY_CONFIG)
+                st.plotly_chart(fig, use_container_width=True, config=PLOTLY_CONFIG, key="experience_demand")
                 st.markdown('</div>', unsafe_allow_html=True)
             
             st.markdown("---")
             
             st.markdown('<div class="modern-card">', unsafe_allow_html=True)
             st.markdown("### 📋 Statistics")
-            st.dataframe(exp_df, use_container_width=True, hide_index=True)
+            render_table(exp_df)
             st.markdown('</div>', unsafe_allow_html=True)
         else:
             st.warning("No experience data available")
@@ -787,25 +958,56 @@ def show_experience_analysis():
     except Exception as e:
         st.error(f"❌ Error: {str(e)}")
 
+@st.fragment
+def _render_salary_by_skill():
+    """Salary by skill tab; a fragment so its slider only reruns this tab"""
+    st.markdown('<div class="modern-card">', unsafe_allow_html=True)
+    st.markdown("### 💰 Average Salary by Skill")
+    
+    min_jobs = st.slider("Minimum jobs required", 3, 20, 5)
+    
+    try:
+        with st.spinner("Analyzing salary data..."):
+            salary_df = load_salary_by_skill(min_jobs=min_jobs, limit=20)
+        
+        if not salary_df.empty:
+            fig = create_modern_chart(
+                salary_df,
+                'bar',
+                x='avg_max_salary',
+                y='skill_name',
+                orientation='h',
+                labels={'avg_max_salary': 'Average Max Salary', 'skill_name': 'Skill'},
+                hover_data=['avg_min_display', 'avg_max_display', 'job_count'],
+                height=500
+            )
+            st.plotly_chart(fig, use_container_width=True, config=PLOTLY_CONFIG, key="salary_by_skill")
+            
+            display_df = salary_df[['skill_name', 'avg_min_display', 'avg_max_display', 'job_count']]
+            display_df.columns = ['Skill', 'Avg Min', 'Avg Max', 'Jobs']
+            render_table(display_df)
+        else:
+            st.info("Not enough data to display salary by skill")
+    
+    except Exception as e:
+        st.error(f"❌ Error: {str(e)}")
+    
+    st.markdown('</div>', unsafe_allow_html=True)
+
 def show_salary_analysis():
     """Salary Analysis Page - Redesigned"""
     st.markdown("## 💰 Salary Analysis")
     st.caption("Compensation insights across skills and locations")
     
     try:
-        analytics = get_analytics()
+        total_jobs, jobs_with_salary = load_salary_counts()
         
-        total_jobs = analytics.get_total_jobs()
-        jobs_with_salary = analytics.get_jobs_with_salary()
-        
-        col1, col2, col3 = st.columns(3)
-        with col1:
-            render_metric_card("Total Jobs", f"{total_jobs:,}", "💼")
-        with col2:
-            render_metric_card("Jobs with Salary", f"{jobs_with_salary:,}", "💰")
-        with col3:
-            percentage = round(jobs_with_salary / total_jobs * 100, 1) if total_jobs > 0 else 0
-            render_metric_card("Data Availability", f"{percentage}%", "📊")
+        percentage = round(jobs_with_salary / total_jobs * 100, 1) if total_jobs > 0 else 0
+        render_metric_cards([
+            {'label': "Total Jobs", 'value': f"{total_jobs:,}", 'icon': "💼"},
+            {'label': "Jobs with Salary", 'value': f"{jobs_with_salary:,}", 'icon': "💰"},
+            {'label': "Data Availability", 'value': f"{percentage}%", 'icon': "📊"},
+        ])
         
         if jobs_with_salary == 0:
             st.warning("⚠️ No salary data available in current dataset")
@@ -817,71 +1019,30 @@ def show_salary_analysis():
         tab1, tab2 = st.tabs(["🎯 By Skill", "📍 By City"])
         
         with tab1:
-            st.markdown('<div class="modern-card">', unsafe_allow_html=True)
-            st.markdown("### 💰 Average Salary by Skill")
-            
-            min_jobs = st.slider("Minimum jobs required", 3, 20, 5)
-            
-            with st.spinner("Analyzing salary data..."):
-                salary_df = analytics.get_salary_by_skill(min_jobs=min_jobs, limit=20)
-            
-            if not salary_df.empty:
-                salary_df['avg_min_display'] = salary_df['avg_min_salary'].apply(
-                    lambda x: f"₹{x/100000:.1f}L" if pd.notna(x) else "N/A"
-                )
-                salary_df['avg_max_display'] = salary_df['avg_max_salary'].apply(
-                    lambda x: f"₹{x/100000:.1f}L" if pd.notna(x) else "N/A"
-                )
-                
-                fig = create_modern_chart(
-                    salary_df,
-                    'bar',
-                    x='avg_max_salary',
-                    y='skill_name',
-                    orientation='h',
-                    labels={'avg_max_salary': 'Average Max Salary', 'skill_name': 'Skill'},
-                    hover_data=['avg_min_display', 'avg_max_display', 'job_count']
-                )
-                fig.update_layout(height=500, yaxis={'categoryorder': 'total ascending'})
-                st.plotly_chart(fig, use_container_width=True, config=PLOTLY_CONFIG)
-                
-                display_df = salary_df[['skill_name', 'avg_min_display', 'avg_max_display', 'job_count']]
-                display_df.columns = ['Skill', 'Avg Min', 'Avg Max', 'Jobs']
-                st.dataframe(display_df, use_container_width=True, hide_index=True)
-            else:
-                st.info("Not enough data to display salary by skill")
-            
-            st.markdown('</div>', unsafe_allow_html=True)
+            _render_salary_by_skill()
         
         with tab2:
             st.markdown('<div class="modern-card">', unsafe_allow_html=True)
             st.markdown("### 💰 Average Salary by City")
             
             with st.spinner("Analyzing salary data by city..."):
-                city_salary_df = analytics.get_salary_by_city()
+                city_salary_df = load_salary_by_city()
             
             if not city_salary_df.empty:
-                city_salary_df['avg_min_display'] = city_salary_df['avg_min_salary'].apply(
-                    lambda x: f"₹{x/100000:.1f}L" if pd.notna(x) else "N/A"
-                )
-                city_salary_df['avg_max_display'] = city_salary_df['avg_max_salary'].apply(
-                    lambda x: f"₹{x/100000:.1f}L" if pd.notna(x) else "N/A"
-                )
-                
                 fig = create_modern_chart(
                     city_salary_df,
                     'bar',
                     x='city',
                     y='avg_max_salary',
                     labels={'avg_max_salary': 'Average Max Salary', 'city': 'City'},
-                    hover_data=['avg_min_display', 'avg_max_display', 'job_count']
+                    hover_data=['avg_min_display', 'avg_max_display', 'job_count'],
+                    height=400
                 )
-                fig.update_layout(height=400)
-                st.plotly_chart(fig, use_container_width=True, config=PLOTLY_CONFIG)
+                st.plotly_chart(fig, use_container_width=True, config=PLOTLY_CONFIG, key="salary_by_city")
                 
                 display_df = city_salary_df[['city', 'avg_min_display', 'avg_max_display', 'job_count']]
                 display_df.columns = ['City', 'Avg Min', 'Avg Max', 'Jobs']
-                st.dataframe(display_df, use_container_width=True, hide_index=True)
+                render_table(display_df)
             else:
                 st.info("Not enough data to display salary by city")
             
@@ -2,6 +2,7 @@
 Chart utilities with dark mode support
 """
 
+import pandas as pd
 import plotly.graph_objects as go
 import plotly.express as px
 from components.theme import get_theme_colors, get_chart_colors, get_gradient_colors, is_dark_mode
@@ -53,6 +54,10 @@ def get_chart_layout(title=None, height=None):
             'bgcolor': 'rgba(0,0,0,0)',
         },
         'margin': dict(l=40, r=40, t=60, b=40),
+        # Only hover the point under the cursor instead of searching every
+        # point in range on each mousemove
+        'hovermode': 'closest',
+        'hoverdistance': 1,
     }
     
     if height:
@@ -61,7 +66,27 @@ def get_chart_layout(title=None, height=None):
     return layout
 
 
-def create_bar_chart(data, x, y, title=None, color=None, orientation='v', height=400):
+def top_bars(data, values, max_bars):
+    """
+    Keep the max_bars largest rows by values
+    
+    Ranked bar charts can't be averaged down without losing what each bar
+    means, so long inputs are cut to their top rows instead.
+    
+    Args:
+        data: DataFrame with data
+        values: Column to rank by
+        max_bars: Maximum number of rows in the result
+        
+    Returns:
+        DataFrame with at most max_bars rows
+    """
+    if len(data) <= max_bars:
+        return data
+    return data.nlargest(max_bars, values)
+
+
+def create_bar_chart(data, x, y, title=None, color=None, orientation='v', height=400, max_bars=None):
     """
     Create a themed bar chart
     
@@ -73,12 +98,17 @@ def create_bar_chart(data, x, y, title=None, color=None, orientation='v', height
         color: Column for color grouping
         orientation: 'v' for vertical, 'h' for horizontal
         height: Chart height
+        max_bars: Only plot this many of the largest bars (optional)
         
     Returns:
         Plotly figure
     """
     colors = get_chart_colors()
     
+    if max_bars:
+        # The value column is x for horizontal bars, y for vertical ones
+        data = top_bars(data, x if orientation == 'h' else y, max_bars)
+    
     fig = px.bar(
         data,
         x=x if orientation == 'v' else y,
@@ -148,7 +178,30 @@ def create_line_chart(data, x, y, title=None, color=None, height=400):
     return fig
 
 
-def create_pie_chart(data, values, names, title=None, hole=0.4, height=400):
+def fold_small_slices(data, values, names, max_slices, other_label='Other'):
+    """
+    Keep the largest max_slices - 1 rows and sum the rest into one row
+    
+    Args:
+        data: DataFrame with data
+        values: Values column
+        names: Names column
+        max_slices: Maximum number of rows in the result
+        other_label: Name for the folded row
+        
+    Returns:
+        DataFrame with at most max_slices rows
+    """
+    if len(data) <= max_slices:
+        return data
+    
+    ranked = data.sort_values(values, ascending=False)
+    head = ranked.iloc[:max_slices - 1][[names, values]]
+    other = pd.DataFrame({names: [other_label], values: [ranked[values].iloc[max_slices - 1:].sum()]})
+    return pd.concat([head, other], ignore_index=True)
+
+
+def create_pie_chart(data, values, names, title=None, hole=0.4, height=400, max_slices=None):
     """
     Create a themed donut/pie chart
     
@@ -159,12 +212,16 @@ def create_pie_chart(data, values, names, title=None, hole=0.4, height=400):
         title: Chart title
         hole: Hole size (0 for pie, >0 for donut)
         height: Chart height
+        max_slices: Fold everything past the largest slices into "Other" (optional)
         
     Returns:
         Plotly figure
     """
     colors = get_chart_colors()
     
+    if max_slices:
+        data = fold_small_slices(data, values, names, max_slices)
+    
     fig = px.pie(
         data,
         values=values,
@@ -3,6 +3,7 @@ Reusable card components for the dashboard
 """
 
 import streamlit as st
+import pandas as pd
 from components.theme import get_theme_colors
 
 
@@ -156,6 +157,22 @@ def job_card(job_title, company, location, salary=None, skills=None, posted_date
     """
     Display a job posting card
     
+    Args:
+        Same as job_card_html
+    """
+    st.markdown(
+        job_card_html(job_title, company, location, salary, skills, posted_date, job_url),
+        unsafe_allow_html=True
+    )
+
+
+def job_card_html(job_title, company, location, salary=None, skills=None, posted_date=None, job_url=None):
+    """
+    Build the HTML for a job posting card
+    
+    The markup has no blank or indented lines, so several cards can be joined
+    into one grid and sent with a single st.markdown call.
+    
     Args:
         job_title: Job title (required, will be HTML-escaped)
         company: Company name (required, will be HTML-escaped)
@@ -164,6 +181,9 @@ def job_card(job_title, company, location, salary=None, skills=None, posted_date
         skills: List of required skills (optional, will be HTML-escaped)
         posted_date: Date posted (optional, will be HTML-escaped)
         job_url: URL to job posting (optional, will be validated)
+        
+    Returns:
+        str: Card HTML
     """
     import html
     
@@ -196,21 +216,16 @@ def job_card(job_title, company, location, salary=None, skills=None, posted_date
             safe_url = html.escape(url)
             apply_button = f'<a href="{safe_url}" target="_blank" rel="noopener noreferrer" style="text-decoration: none;"><button class="neuro-button">Apply Now</button></a>'
     
-    card_html = f"""
-    <div class="modern-card">
-        <h3 style="margin: 0 0 0.5rem 0; color: {colors['text_primary']};">{job_title}</h3>
-        <div style="font-size: 1rem; color: {colors['text_secondary']};">{company}</div>
-        <div style="font-size: 0.9rem; color: {colors['text_tertiary']}; margin-top: 0.25rem;">📍 {location}</div>
-        {salary_html}
-        {skills_html}
-        <div class="card-footer">
-            {posted_html}
-            {apply_button}
-        </div>
-    </div>
-    """
-    
-    st.markdown(card_html, unsafe_allow_html=True)
+    return (
+        '<div class="modern-card">'
+        f'<h3 style="margin: 0 0 0.5rem 0; color: {colors["text_primary"]};">{job_title}</h3>'
+        f'<div style="font-size: 1rem; color: {colors["text_secondary"]};">{company}</div>'
+        f'<div style="font-size: 0.9rem; color: {colors["text_tertiary"]}; margin-top: 0.25rem;">📍 {location}</div>'
+        f'{salary_html}'
+        f'{skills_html}'
+        f'<div class="card-footer">{posted_html}{apply_button}</div>'
+        '</div>'
+    )
 
 
 def skill_badge(skill_name, count=None, category=None):
@@ -225,15 +240,7 @@ def skill_badge(skill_name, count=None, category=None):
     colors = get_theme_colors()
     
     # Color based on category
-    category_colors = {
-        'Programming Language': colors['accent_primary'],
-        'Framework': colors['info'],
-        'Tool': colors['warning'],
-        'Database': colors['success'],
-        'Cloud': colors['accent_secondary'],
-    }
-    
-    color = category_colors.get(category, colors['text_secondary'])
+    color = _badge_category_colors(colors).get(category, colors['text_secondary'])
     
     count_html = ''
     if count:
@@ -248,6 +255,59 @@ def skill_badge(skill_name, count=None, category=None):
     return badge_html
 
 
+def skill_badges(skill_names, counts=None, categories=None):
+    """
+    Render a whole column of skills as badges in one HTML string
+    
+    Same markup as skill_badge, built with vectorized string operations so a
+    list of skills goes out in a single st.markdown call.
+    
+    Args:
+        skill_names: Series of skill names
+        counts: Series of job counts (optional)
+        categories: Series of skill categories for color coding (optional)
+        
+    Returns:
+        str: Concatenated badge HTML
+    """
+    colors = get_theme_colors()
+    names = pd.Series(skill_names).astype(str).reset_index(drop=True)
+    
+    if categories is not None:
+        badge_colors = (
+            pd.Series(categories).reset_index(drop=True).astype(object)
+            .map(_badge_category_colors(colors))
+            .fillna(colors['text_secondary'])
+        )
+    else:
+        badge_colors = colors['text_secondary']
+    
+    count_html = ''
+    if counts is not None:
+        counts = pd.Series(counts).reset_index(drop=True)
+        count_html = (
+            ' <span style="background: rgba(255,255,255,0.2); padding: 0.1rem 0.4rem; border-radius: 10px; font-size: 0.75rem;">'
+            + counts.astype(str) + '</span>'
+        ).where(counts.fillna(0) != 0, '')
+    
+    badges = (
+        '\n    <span class="badge" style="background: ' + badge_colors + '; color: white;">\n        '
+        + names + count_html + '\n    </span>\n    '
+    )
+    return badges.str.cat()
+
+
+def _badge_category_colors(colors):
+    """Badge color per skill category for the given theme colors"""
+    return {
+        'Programming Language': colors['accent_primary'],
+        'Framework': colors['info'],
+        'Tool': colors['warning'],
+        'Database': colors['success'],
+        'Cloud': colors['accent_secondary'],
+    }
+
+
 def progress_card(title, current, total, label=None):
     """
     Display a progress card with a progress bar
@@ -67,7 +67,7 @@ def theme_toggle():
     Create a theme toggle button in sidebar
     
     Returns:
-        bool: True if theme was toggled
+        bool: True if the theme had been changed elsewhere and the toggle was re-synced
     """
     colors = get_theme_colors()
     dark = is_dark_mode()
@@ -129,19 +129,22 @@ def theme_toggle():
     </div>
     """, unsafe_allow_html=True)
     
-    # Use checkbox for toggle
-    toggled = st.checkbox(
+    # Only out of sync if the theme was changed somewhere else; the theme
+    # wins, and the checkbox is set to match before it is drawn this run
+    resynced = st.session_state.get("theme_toggle_checkbox", dark) != dark
+    st.session_state.theme_toggle_checkbox = dark
+    
+    # Use checkbox for toggle. The theme flips in on_change, which Streamlit
+    # calls before the rerun the click triggers, so that one rerun already
+    # draws the new theme and no second st.rerun() is needed
+    st.checkbox(
         "Toggle Theme",
-        value=dark,
         key="theme_toggle_checkbox",
-        label_visibility="collapsed"
+        label_visibility="collapsed",
+        on_change=toggle_theme
     )
     
-    if toggled != dark:
-        toggle_theme()
-        return True
-    
-    return False
+    return resynced
 
 
 def breadcrumb(items):
@@ -6,6 +6,46 @@ Handles dark/light mode switching and theme persistence
 import streamlit as st
 
 
+# Palettes are built once; get_theme_colors() hands back the shared dict
+_DARK_COLORS = {
+    'background_primary': '#0e1117',
+    'background_secondary': '#1a1d24',
+    'card_primary': '#262730',
+    'card_secondary': '#2e2e38',
+    'card_elevated': '#363844',
+    'text_primary': '#fafafa',
+    'text_secondary': '#cbd5e1',
+    'text_tertiary': '#94a3b8',
+    'accent_primary': '#8b9dff',
+    'accent_secondary': '#a29dff',
+    'success': '#34d399',
+    'warning': '#fbbf24',
+    'error': '#f87171',
+    'info': '#60a5fa',
+    'border': '#404252',
+    'shadow': 'rgba(0, 0, 0, 0.3)',
+}
+
+_LIGHT_COLORS = {
+    'background_primary': '#fafbfc',
+    'background_secondary': '#ffffff',
+    'card_primary': '#ffffff',
+    'card_secondary': '#f8f9fa',
+    'card_elevated': '#ffffff',
+    'text_primary': '#1e293b',
+    'text_secondary': '#475569',
+    'text_tertiary': '#64748b',
+    'accent_primary': '#667eea',
+    'accent_secondary': '#764ba2',
+    'success': '#10b981',
+    'warning': '#f59e0b',
+    'error': '#ef4444',
+    'info': '#3b82f6',
+    'border': '#e2e8f0',
+    'shadow': 'rgba(0, 0, 0, 0.1)',
+}
+
+
 def init_theme():
     """Initialize theme in session state"""
     if 'theme' not in st.session_state:
@@ -52,44 +92,7 @@ def get_theme_colors():
             - border: Border color
             - shadow: Shadow color (with alpha)
     """
-    if is_dark_mode():
-        return {
-            'background_primary': '#0e1117',
-            'background_secondary': '#1a1d24',
-            'card_primary': '#262730',
-            'card_secondary': '#2e2e38',
-            'card_elevated': '#363844',
-            'text_primary': '#fafafa',
-            'text_secondary': '#cbd5e1',
-            'text_tertiary': '#94a3b8',
-            'accent_primary': '#8b9dff',
-            'accent_secondary': '#a29dff',
-            'success': '#34d399',
-            'warning': '#fbbf24',
-            'error': '#f87171',
-            'info': '#60a5fa',
-            'border': '#404252',
-            'shadow': 'rgba(0, 0, 0, 0.3)',
-        }
-    else:
-        return {
-            'background_primary': '#fafbfc',
-            'background_secondary': '#ffffff',
-            'card_primary': '#ffffff',
-            'card_secondary': '#f8f9fa',
-            'card_elevated': '#ffffff',
-            'text_primary': '#1e293b',
-            'text_secondary': '#475569',
-            'text_tertiary': '#64748b',
-            'accent_primary': '#667eea',
-            'accent_secondary': '#764ba2',
-            'success': '#10b981',
-            'warning': '#f59e0b',
-            'error': '#ef4444',
-            'info': '#3b82f6',
-            'border': '#e2e8f0',
-            'shadow': 'rgba(0, 0, 0, 0.1)',
-        }
+    return _DARK_COLORS if is_dark_mode() else _LIGHT_COLORS
 
 
 def get_chart_colors():
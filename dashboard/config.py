@@ -39,7 +39,12 @@ MAX_PAGE_SIZE = 100
 
 # Chart Settings
 DEFAULT_CHART_HEIGHT = 400
-PLOTLY_CONFIG = {'displayModeBar': False}
+# No scroll-zoom (wheel events re-render every trace); double-click resets the view.
+# responsive lets plotly.js resize charts itself when the window changes size
+PLOTLY_CONFIG = {'displayModeBar': False, 'scrollZoom': False, 'doubleClick': 'reset', 'responsive': True}
+MAX_PIE_SLICES = 12  # smaller slices are folded into "Other"
+MAX_CHART_BARS = 100  # longer ranked bar charts keep only their top rows
+MAX_TABLE_HEIGHT = 600  # taller tables scroll inside a fixed-height grid
 
 # Theme Settings
 THEME_OPTIONS = ['light', 'dark', 'auto']
@@ -52,4 +57,7 @@ UI_CONFIG = {
     'show_team_info': True,
     'compact_mode': False,
     'sidebar_default_state': 'expanded',
+    'max_chart_bars': MAX_CHART_BARS,
+    'max_pie_slices': MAX_PIE_SLICES,
+    'max_table_height': MAX_TABLE_HEIGHT,
 }
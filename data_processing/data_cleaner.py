@@ -15,6 +15,7 @@ from datetime import datetime
 from typing import Optional, Dict, List
 from skill_extractor import SkillExtractor
 from database.db_operations import JobDatabase
+from analytics.insights import JobMarketAnalytics
 from utils.location_validator import is_indian_city, validate_location_data, get_location_statistics
 
 logging.basicConfig(
@@ -447,6 +448,10 @@ def process_and_load_data(csv_file: str, extract_skills: bool = True):
         db.bulk_insert_jobs(df_clean, skills_by_job)
         logger.info("✓ Data loaded successfully!")
         
+        # Pre-aggregated views and cached analytics results are stale once new jobs land
+        db.refresh_materialized_views()
+        JobMarketAnalytics.invalidate_cache()
+        
         # Show stats
         stats = db.get_database_stats()
         logger.info("\n" + "="*50)
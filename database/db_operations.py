@@ -16,15 +16,15 @@ from utils.location_validator import is_indian_city, validate_location_data
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+SCHEMA_PATH = Path(__file__).parent / 'schema.sql'
+MATERIALIZED_VIEWS_PATH = Path(__file__).parent / 'materialized_views.sql'
+
 class JobDatabase:
     """Handles all database operations for job data"""
     
     def __init__(self):
         DatabaseManager.initialize_pool()
     
-    def __del__(self):
-        DatabaseManager.close_all_connections()
-    
     # ==================== COMPANY OPERATIONS ====================
     
     def insert_company(self, company_name: str) -> int:
@@ -408,6 +408,36 @@ class JobDatabase:
         logger.info(f"✗ Errors: {error_count}")
         logger.info(f"{'='*50}")
     
+    def refresh_materialized_views(self):
+        """Refresh pre-aggregated analytics views (call after loading or deleting jobs)"""
+        conn = None
+        try:
+            conn = get_db_connection()
+            cursor = conn.cursor()
+            # Create any view an older database is missing before refreshing it
+            cursor.execute(MATERIALIZED_VIEWS_PATH.read_text())
+            # CONCURRENTLY keeps the view readable by the dashboard while it rebuilds
+            cursor.execute("REFRESH MATERIALIZED VIEW CONCURRENTLY mv_skill_stats")
+            cursor.execute("REFRESH MATERIALIZED VIEW CONCURRENTLY mv_skill_cooccurrence")
+            # Readers key their caches on this stamp; it commits with the refreshed views
+            cursor.execute("""
+                UPDATE data_version
+                SET version = version + 1, refreshed_at = CURRENT_TIMESTAMP
+            """)
+            conn.commit()
+            
+            logger.info("✓ Materialized views refreshed")
+            
+        except Exception as e:
+            if conn:
+                conn.rollback()
+            logger.error(f"Error refreshing materialized views: {e}")
+            raise
+        finally:
+            if conn:
+                cursor.close()
+                DatabaseManager.return_connection(conn)
+    
     # ==================== QUERY OPERATIONS ====================
     
     def get_total_jobs(self) -> int:
@@ -589,12 +619,9 @@ def initialize_database():
         conn = get_db_connection()
         cursor = conn.cursor()
         
-        # Read and execute schema
-        schema_path = Path(__file__).parent / 'schema.sql'
-        with open(schema_path, 'r') as f:
-            schema_sql = f.read()
-        
-        cursor.execute(schema_sql)
+        # Read and execute schema, then build the analytics views over it
+        cursor.execute(SCHEMA_PATH.read_text())
+        cursor.execute(MATERIALIZED_VIEWS_PATH.read_text())
         conn.commit()
         
         logger.info("✓ Database schema initialized successfully")
@@ -0,0 +1,43 @@
+-- Pre-aggregated analytics views and the data version stamp
+-- Idempotent, so it also brings databases created from an older schema.sql
+-- up to date; JobDatabase.refresh_materialized_views() runs it before refreshing
+
+-- Pre-aggregated skill demand (refresh after each data load)
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_skill_stats AS
+SELECT 
+    js.skill_id,
+    j.location_id,
+    j.experience_level,
+    j.job_type,
+    COUNT(*) AS job_count
+FROM job_skills js
+JOIN jobs j ON js.job_id = j.job_id
+GROUP BY js.skill_id, j.location_id, j.experience_level, j.job_type;
+
+CREATE UNIQUE INDEX IF NOT EXISTS idx_mv_skill_stats_key
+    ON mv_skill_stats(skill_id, location_id, experience_level, job_type);
+
+-- Pre-aggregated skill pair counts (refresh after each data load)
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_skill_cooccurrence AS
+SELECT 
+    js1.skill_id AS skill1_id,
+    js2.skill_id AS skill2_id,
+    COUNT(*) AS co_occurrence_count
+FROM job_skills js1
+JOIN job_skills js2 ON js1.job_id = js2.job_id AND js1.skill_id < js2.skill_id
+GROUP BY js1.skill_id, js2.skill_id;
+
+CREATE UNIQUE INDEX IF NOT EXISTS idx_mv_skill_cooccurrence_key
+    ON mv_skill_cooccurrence(skill1_id, skill2_id);
+CREATE INDEX IF NOT EXISTS idx_mv_skill_cooccurrence_count
+    ON mv_skill_cooccurrence(co_occurrence_count DESC);
+
+-- Bumped in the same transaction as each view refresh, so a reader that sees
+-- a new version also sees views that match the jobs table
+CREATE TABLE IF NOT EXISTS data_version (
+    singleton BOOLEAN PRIMARY KEY DEFAULT TRUE CHECK (singleton),
+    version BIGINT NOT NULL DEFAULT 0,
+    refreshed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+INSERT INTO data_version DEFAULT VALUES ON CONFLICT DO NOTHING;
@@ -4,14 +4,31 @@ Predefined SQL queries for analytics and reporting
 
 # ==================== SKILL ANALYSIS QUERIES ====================
 
+# Skill demand queries read the pre-aggregated mv_skill_stats view
+# (see schema.sql), which holds job counts per skill/location/level/type
+
 TOP_SKILLS_OVERALL = """
     SELECT 
         s.skill_name,
         s.skill_category,
-        COUNT(DISTINCT js.job_id) as job_count,
-        ROUND(COUNT(DISTINCT js.job_id) * 100.0 / (SELECT COUNT(*) FROM jobs), 2) as percentage
-    FROM skills s
-    JOIN job_skills js ON s.skill_id = js.skill_id
+        SUM(m.job_count)::bigint as job_count,
+        ROUND(SUM(m.job_count) * 100.0 / (SELECT COUNT(*) FROM jobs), 2) as percentage
+    FROM mv_skill_stats m
+    JOIN skills s ON m.skill_id = s.skill_id
+    GROUP BY s.skill_id, s.skill_name, s.skill_category
+    ORDER BY job_count DESC
+    LIMIT %s
+"""
+
+TOP_SKILLS_MATCHING = """
+    SELECT 
+        s.skill_name,
+        s.skill_category,
+        SUM(m.job_count)::bigint as job_count,
+        ROUND(SUM(m.job_count) * 100.0 / (SELECT COUNT(*) FROM jobs), 2) as percentage
+    FROM mv_skill_stats m
+    JOIN skills s ON m.skill_id = s.skill_id
+    WHERE s.skill_name ILIKE %s
     GROUP BY s.skill_id, s.skill_name, s.skill_category
     ORDER BY job_count DESC
     LIMIT %s
@@ -21,17 +38,61 @@ TOP_SKILLS_BY_LOCATION = """
     SELECT 
         l.city,
         s.skill_name,
-        COUNT(DISTINCT j.job_id) as job_count
-    FROM skills s
-    JOIN job_skills js ON s.skill_id = js.skill_id
-    JOIN jobs j ON js.job_id = j.job_id
-    JOIN locations l ON j.location_id = l.location_id
+        SUM(m.job_count)::bigint as job_count
+    FROM mv_skill_stats m
+    JOIN skills s ON m.skill_id = s.skill_id
+    JOIN locations l ON m.location_id = l.location_id
     WHERE l.city = %s
     GROUP BY l.city, s.skill_name
     ORDER BY job_count DESC
     LIMIT %s
 """
 
+# Top skills of several cities in one pass: ranked within each city, then cut
+TOP_SKILLS_BY_LOCATIONS = """
+    SELECT city, skill_name, job_count
+    FROM (
+        SELECT 
+            l.city,
+            s.skill_name,
+            SUM(m.job_count)::bigint as job_count,
+            ROW_NUMBER() OVER (PARTITION BY l.city ORDER BY SUM(m.job_count) DESC) as rn
+        FROM mv_skill_stats m
+        JOIN skills s ON m.skill_id = s.skill_id
+        JOIN locations l ON m.location_id = l.location_id
+        WHERE l.city = ANY(%s)
+        GROUP BY l.city, s.skill_name
+    ) ranked
+    WHERE rn <= %s
+    ORDER BY city, job_count DESC
+"""
+
+TOP_SKILLS_BY_EXPERIENCE = """
+    SELECT 
+        s.skill_name,
+        s.skill_category,
+        SUM(m.job_count)::bigint as job_count
+    FROM mv_skill_stats m
+    JOIN skills s ON m.skill_id = s.skill_id
+    WHERE m.experience_level = %s
+    GROUP BY s.skill_id, s.skill_name, s.skill_category
+    ORDER BY job_count DESC
+    LIMIT %s
+"""
+
+TOP_SKILLS_BY_JOB_TYPE = """
+    SELECT 
+        s.skill_name,
+        s.skill_category,
+        SUM(m.job_count)::bigint as job_count
+    FROM mv_skill_stats m
+    JOIN skills s ON m.skill_id = s.skill_id
+    WHERE m.job_type = %s
+    GROUP BY s.skill_id, s.skill_name, s.skill_category
+    ORDER BY job_count DESC
+    LIMIT %s
+"""
+
 TOP_SKILLS_BY_ROLE = """
     SELECT 
         j.job_title,
@@ -46,25 +107,47 @@ TOP_SKILLS_BY_ROLE = """
     LIMIT %s
 """
 
+SKILL_DEMAND_BY_CITY = """
+    SELECT
+        LOWER(s.skill_name) as skill_name,
+        l.city,
+        COUNT(DISTINCT j.job_id) as job_count
+    FROM skills s
+    JOIN job_skills js ON s.skill_id = js.skill_id
+    JOIN jobs j ON js.job_id = j.job_id
+    JOIN locations l ON j.location_id = l.location_id
+    WHERE LOWER(s.skill_name) = ANY(%s)
+      AND l.city = ANY(%s)
+    GROUP BY 1, 2
+"""
+
+# Same as SKILL_DEMAND_BY_CITY for long skill lists, which are loaded into
+# a session temp table (_skills_filter) so Postgres can hash-join against it
+SKILL_DEMAND_BY_CITY_FILTER_TABLE = """
+    SELECT
+        f.skill_name,
+        l.city,
+        COUNT(DISTINCT j.job_id) as job_count
+    FROM _skills_filter f
+    JOIN skills s ON LOWER(s.skill_name) = f.skill_name
+    JOIN job_skills js ON s.skill_id = js.skill_id
+    JOIN jobs j ON js.job_id = j.job_id
+    JOIN locations l ON j.location_id = l.location_id
+    WHERE l.city = ANY(%s)
+    GROUP BY 1, 2
+"""
+
 SKILL_COOCCURRENCE = """
-    WITH skill_pairs AS (
-        SELECT 
-            js1.skill_id as skill1_id,
-            js2.skill_id as skill2_id,
-            COUNT(DISTINCT js1.job_id) as co_occurrence_count
-        FROM job_skills js1
-        JOIN job_skills js2 ON js1.job_id = js2.job_id AND js1.skill_id < js2.skill_id
-        GROUP BY js1.skill_id, js2.skill_id
-        HAVING COUNT(DISTINCT js1.job_id) >= %s
-    )
     SELECT 
         s1.skill_name as skill_1,
         s2.skill_name as skill_2,
-        sp.co_occurrence_count
-    FROM skill_pairs sp
-    JOIN skills s1 ON sp.skill1_id = s1.skill_id
-    JOIN skills s2 ON sp.skill2_id = s2.skill_id
-    ORDER BY sp.co_occurrence_count DESC
+        m.co_occurrence_count,
+        s1.skill_name || ' + ' || s2.skill_name as skill_pair
+    FROM mv_skill_cooccurrence m
+    JOIN skills s1 ON m.skill1_id = s1.skill_id
+    JOIN skills s2 ON m.skill2_id = s2.skill_id
+    WHERE m.co_occurrence_count >= %s
+    ORDER BY m.co_occurrence_count DESC
     LIMIT %s
 """
 
@@ -83,6 +166,20 @@ TOP_HIRING_COMPANIES = """
     LIMIT %s
 """
 
+TOP_HIRING_COMPANIES_MATCHING = """
+    SELECT 
+        c.company_name,
+        COUNT(j.job_id) as job_count,
+        COUNT(DISTINCT l.city) as cities_hiring_in
+    FROM companies c
+    JOIN jobs j ON c.company_id = j.company_id
+    LEFT JOIN locations l ON j.location_id = l.location_id
+    WHERE c.company_name ILIKE %s
+    GROUP BY c.company_id, c.company_name
+    ORDER BY job_count DESC
+    LIMIT %s
+"""
+
 COMPANIES_BY_CITY = """
     SELECT 
         l.city,
@@ -97,6 +194,24 @@ COMPANIES_BY_CITY = """
     LIMIT %s
 """
 
+COMPANIES_BY_CITIES = """
+    SELECT city, company_name, job_count
+    FROM (
+        SELECT 
+            l.city,
+            c.company_name,
+            COUNT(j.job_id) as job_count,
+            ROW_NUMBER() OVER (PARTITION BY l.city ORDER BY COUNT(j.job_id) DESC) as rn
+        FROM companies c
+        JOIN jobs j ON c.company_id = j.company_id
+        JOIN locations l ON j.location_id = l.location_id
+        WHERE l.city = ANY(%s)
+        GROUP BY l.city, c.company_name
+    ) ranked
+    WHERE rn <= %s
+    ORDER BY city, job_count DESC
+"""
+
 # ==================== LOCATION ANALYSIS QUERIES ====================
 
 JOBS_BY_CITY = """
@@ -112,18 +227,38 @@ JOBS_BY_CITY = """
     ORDER BY job_count DESC
 """
 
+# JOBS_BY_CITY without empty or unnamed cities; the inner join drops cities with no jobs
+ACTIVE_JOBS_BY_CITY = """
+    SELECT 
+        l.city,
+        l.state,
+        COUNT(j.job_id) as job_count,
+        COUNT(DISTINCT j.company_id) as company_count
+    FROM locations l
+    JOIN jobs j ON l.location_id = j.location_id
+    WHERE l.city IS NOT NULL AND l.city <> ''
+    GROUP BY l.location_id, l.city, l.state
+    ORDER BY job_count DESC
+"""
+
+CITIES_WITH_JOBS = """
+    SELECT l.city
+    FROM locations l
+    WHERE EXISTS (SELECT 1 FROM jobs j WHERE j.location_id = l.location_id)
+    ORDER BY l.city
+"""
+
 # ==================== EXPERIENCE LEVEL ANALYSIS ====================
 
 EXPERIENCE_DEMAND_BY_SKILL = """
     SELECT 
         s.skill_name,
-        j.experience_level,
-        COUNT(*) as job_count
-    FROM skills s
-    JOIN job_skills js ON s.skill_id = js.skill_id
-    JOIN jobs j ON js.job_id = j.job_id
-    WHERE s.skill_name = %s AND j.experience_level IS NOT NULL
-    GROUP BY s.skill_name, j.experience_level
+        m.experience_level,
+        SUM(m.job_count)::bigint as job_count
+    FROM mv_skill_stats m
+    JOIN skills s ON m.skill_id = s.skill_id
+    WHERE s.skill_name = %s AND m.experience_level IS NOT NULL
+    GROUP BY s.skill_name, m.experience_level
     ORDER BY job_count DESC
 """
 
@@ -138,6 +273,30 @@ EXPERIENCE_DISTRIBUTION = """
     ORDER BY job_count DESC
 """
 
+EXPERIENCE_BY_CITY = """
+    SELECT 
+        l.city,
+        j.experience_level,
+        COUNT(*) as job_count
+    FROM jobs j
+    JOIN locations l ON j.location_id = l.location_id
+    WHERE j.experience_level IS NOT NULL
+    GROUP BY l.city, j.experience_level
+    ORDER BY l.city, job_count DESC
+"""
+
+JOB_TYPE_BY_CITY = """
+    SELECT 
+        l.city,
+        j.job_type,
+        COUNT(*) as job_count
+    FROM jobs j
+    JOIN locations l ON j.location_id = l.location_id
+    WHERE j.job_type IS NOT NULL
+    GROUP BY l.city, j.job_type
+    ORDER BY l.city, job_count DESC
+"""
+
 # ==================== SALARY ANALYSIS QUERIES ====================
 
 SALARY_BY_SKILL = """
@@ -189,6 +348,40 @@ JOBS_BY_PORTAL = """
     ORDER BY job_count DESC
 """
 
+# ==================== SUMMARY COUNTS ====================
+
+# Bumped by each materialized view refresh (after every load or cleanup);
+# dashboards key their persisted caches on it
+DATA_VERSION = """
+    SELECT version FROM data_version
+"""
+
+MARKET_TOTALS = """
+    SELECT
+        (SELECT COUNT(*) FROM jobs) as total_jobs,
+        (SELECT COUNT(*) FROM companies) as total_companies,
+        (SELECT COUNT(*) FROM skills) as total_skills,
+        (SELECT COUNT(DISTINCT location_id) FROM jobs) as total_cities,
+        (SELECT COUNT(*) FROM jobs
+          WHERE salary_min IS NOT NULL
+            AND salary_max IS NOT NULL
+            AND salary_min > 0) as jobs_with_salary
+"""
+
+JOBS_WITH_SALARY_COUNT = """
+    SELECT COUNT(*)
+    FROM jobs
+    WHERE salary_min IS NOT NULL
+      AND salary_max IS NOT NULL
+      AND salary_min > 0
+"""
+
+# Planner statistics estimate; -1 (or 0 before PostgreSQL 14) until the table
+# has been vacuumed/analyzed, and stale after bulk loads until the next ANALYZE
+JOBS_ESTIMATED_COUNT = """
+    SELECT reltuples::bigint FROM pg_class WHERE oid = 'jobs'::regclass
+"""
+
 # ==================== SEARCH QUERIES ====================
 
 SEARCH_JOBS = """
@@ -212,6 +405,37 @@ SEARCH_JOBS = """
     LIMIT %s
 """
 
+# Base statement for JobMarketAnalytics.search_jobs_by_filters; each optional
+# filter appends one clause with a numbered placeholder ($1, $2, ...) so the
+# combination can be PREPAREd once per connection
+SEARCH_JOBS_BY_FILTERS = """
+    SELECT
+        j.job_id,
+        j.job_title,
+        c.company_name,
+        l.city,
+        j.experience_level,
+        j.job_type,
+        j.job_url,
+        j.posted_date
+    FROM jobs j
+    LEFT JOIN companies c ON j.company_id = c.company_id
+    LEFT JOIN locations l ON j.location_id = l.location_id
+    WHERE 1=1
+"""
+
+SEARCH_FILTER_CLAUSES = (
+    ('city', "l.city = ${}"),
+    ('experience_level', "j.experience_level = ${}"),
+    ('job_type', "j.job_type = ${}"),
+    ('skill_name', """EXISTS (
+        SELECT 1
+        FROM job_skills js
+        JOIN skills s ON js.skill_id = s.skill_id
+        WHERE js.job_id = j.job_id AND LOWER(s.skill_name) = LOWER(${})
+    )"""),
+)
+
 JOBS_WITH_SKILL = """
     SELECT 
         j.job_id,
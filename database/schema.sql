@@ -1,3 +1,6 @@
+DROP MATERIALIZED VIEW IF EXISTS mv_skill_stats;
+DROP MATERIALIZED VIEW IF EXISTS mv_skill_cooccurrence;
+DROP TABLE IF EXISTS data_version;
 DROP TABLE IF EXISTS job_skills CASCADE;
 DROP TABLE IF EXISTS skills CASCADE;
 DROP TABLE IF EXISTS jobs CASCADE;
@@ -58,6 +61,7 @@ CREATE INDEX idx_jobs_portal ON jobs(source_portal);
 CREATE INDEX idx_job_skills_job ON job_skills(job_id);
 CREATE INDEX idx_job_skills_skill ON job_skills(skill_id);
 CREATE INDEX idx_skills_name ON skills(skill_name);
+CREATE INDEX idx_skills_name_lower ON skills(LOWER(skill_name));
 CREATE INDEX idx_skills_category ON skills(skill_category);
 
 -- Insert initial locations (Indian tech cities)
@@ -8,6 +8,8 @@ from pathlib import Path
 sys.path.append(str(Path(__file__).parent.parent))
 
 from config.database import get_db_connection, DatabaseManager
+from database.db_operations import JobDatabase
+from analytics.insights import JobMarketAnalytics
 from utils.location_validator import is_indian_city, validate_location_data
 import logging
 from datetime import datetime
@@ -404,6 +406,11 @@ def main():
             
             # Also cleanup null locations
             cleanup_null_locations(dry_run=not args.execute)
+            
+            if args.execute:
+                # Skill and skill-pair view counts and cached analytics still include the deleted jobs
+                JobDatabase().refresh_materialized_views()
+                JobMarketAnalytics.invalidate_cache()
         
         logger.info("\n✓ Script completed successfully!")
         